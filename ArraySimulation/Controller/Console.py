@@ -4,13 +4,14 @@ Console.py
 Author: Matthew Yu (2021).
 Contact: matthewjkyu@gmail.com
 Created: 04/29/21
-Last Modified: 04/29/21
+Last Modified: 10/19/26
 
 Description: Implements the Console class used for creating input widgets in the
 Views. Based off of the Console class used for PVSim
 (https://github.com/lhr-solar/Array-Simulation). 
 """
 # Library Imports.
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QPalette
 from PyQt5.QtWidgets import (
     QComboBox,
@@ -18,6 +19,7 @@ from PyQt5.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
+    QSlider,
     QVBoxLayout,
     QWidget,
 )
@@ -133,6 +135,33 @@ class Console(View):
         if callback is not None:
             self._components[ID].currentIndexChanged.connect(callback)
 
+    def addSlider(self, ID, position, size, bounds=(0, 100), callback=None):
+        """
+        Adds a horizontal slider to the layout. The slider can have a callback
+        attached to do something when its value changes.
+
+        Parameters
+        ----------
+        ID: String
+            Unique identifier for the slider.
+        position: (int, int)
+            Location of the slider in grid coordinates.
+        size: (int, int)
+            Size of the slider in grid coordinates.
+        bounds: (int, int)
+            Minimum and maximum values of the slider.
+        callback: function reference
+            Function that will trigger with the new value when it changes.
+        """
+        self._components[ID] = QSlider(Qt.Horizontal)
+        self._components[ID].setRange(bounds[0], bounds[1])
+        self._layout.layout.addWidget(
+            self._components[ID], position[0], position[1], size[0], size[1]
+        )
+
+        if callback is not None:
+            self._components[ID].valueChanged.connect(callback)
+
     def hideConsoleWidgets(self, IDs=[]):
         """
         Hides a list of widgets from the console.
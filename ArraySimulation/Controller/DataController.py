@@ -4,7 +4,7 @@ DataController.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/19/20
-Last Modified: 03/06/21
+Last Modified: 10/19/26
 
 Description: The DataController class manages the data passed throughout the
 program. It exposes objects that represent the state of the application (what
@@ -68,10 +68,52 @@ For now, we only have two types of simulations that we want to simulate.
     This means that we should be able to load a file into this method
     to generate the appropriate irradiance and temperature profile
     across a set of modules.
+
+    The MPPT simulation can also be run at multiple rates (see
+    setupMultiRate). Instead of running every component once per cycle, each
+    component is a stage of a Scheduler with its own update period. The
+    environment is sampled at its own rate, the source IV curve is only
+    recomputed when the environment changes, and the MPPT and DC-DC
+    converter run against the cached IV curve at their control rates.
+
+    Long stretches of constant conditions can be skipped over (see
+    setupFastForward). Once the environment is static and the MPPT has settled
+    into a repeating VREF cycle, the rest of the static stretch is filled in by
+    replaying that cycle instead of simulating it.
+
+    The entries of the MPPT simulation can also be streamed to a file as they
+    are recorded (see setupSink). If the datastore does not need to be kept
+    around, the rows already written are dropped from it, so that the memory
+    used stays bounded however long the simulation is.
+
+    Long simulations can be checkpointed (see setupCheckpoint). The entire
+    state of the pipeline is periodically saved to a file, from which the
+    simulation can be resumed with loadCheckpoint if it is interrupted.
+
+    The MPPT simulation can be seeked to any cycle (see setupSnapshots and
+    seekCycle). A lightweight snapshot of the pipeline state is kept every few
+    cycles; seeking backwards restores the nearest earlier snapshot and replays
+    from there, and seeking forwards runs the pipeline as fast as possible.
+
+    Evaluating an MPPT algorithm over a profile is dominated by computing the
+    source IV curve every cycle, although the MPPT only needs the source
+    current at VREF. The source response can instead be precomputed before
+    the run (see setupSurface): the IV curve of every distinct environment of
+    the profile is computed once, into a 2-D array of condition x voltage,
+    and each cycle reads the source current from its row.
 """
 # Library Imports.
+import bisect
+import numpy as np
+import os
+import pickle
 
 # Custom Imports.
+from ArraySimulation.Controller.IVPool import IVPool
+from ArraySimulation.Controller.IVSurface import IVSurface
+from ArraySimulation.Controller.Metrics import Metrics
+from ArraySimulation.Controller.MPPTTrace import MPPTTrace
+from ArraySimulation.Controller.Scheduler import Scheduler
 from ArraySimulation.DCDCConverter.DCDCConverter import DCDCConverter
 from ArraySimulation.MPPT.MPPT import MPPT
 from ArraySimulation.PVEnvironment.PVEnvironment import PVEnvironment
@@ -86,27 +128,58 @@ class DataController:
     executed, etc) and an API for running the models in the data pipeline.
     """
 
+    # The one dimensional float columns of the datastore.
+    _FLOAT_COLUMNS = [
+        "time",
+        "arrayVoltage",
+        "sourceCurrent",
+        "vOC",
+        "iSC",
+        "vMPP",
+        "iMPP",
+        "mpptOutput",
+        "outputPower",
+        "dcdcOutput",
+    ]
+
+    # Version of the checkpoint format. Checkpoints of other versions are
+    # rejected by loadCheckpoint.
+    CHECKPOINT_VERSION = 4
+
     def __init__(self):
         """
         Generates objects for the pipeline and initializes a data store that
         records data and prepares it for feeding into the UIController.
 
-        The datastore is in the following format:
+        The datastore is columnar. Each column is a numpy array preallocated
+        for the maximum number of entries in the simulation, where row idx is
+        the idx-th entry recorded. Only the first numEntries rows are filled.
         {
-            "cycle": [],        # List of integers
-            "sourceDef": [],    # List of source environment definitions
-            "sourceOutput: [],  # List of dicts in the following format:
-                                    {
-                                        "current": float,
-                                        "IV": list of voltage/current tuples,
-                                        "edge": tuple (V_OC, I_SC, (V_MPP, I_MPP))
-                                    }
-            "mpptOutput": [],   # List of reference voltages
-            "dcdcOutput": [],   # List of output Pulse Widths
+            "maxCycle": int,
+            "numEntries": int,              # Number of rows filled
+            "modules": [],                  # Module names, in column order
+            "cycle": int array,             # Simulation cycle
+            "time": float array,            # Simulation time (s)
+            "arrayVoltage": float array,    # Voltage across the source (V)
+            "sourceCurrent": float array,   # Source current (A)
+            "irradiance": float array,      # 2-D, irradiance per module (G)
+            "temperature": float array,     # 2-D, temperature per module (C)
+            "vOC": float array,             # Open circuit voltage (V)
+            "iSC": float array,             # Short circuit current (A)
+            "vMPP": float array,            # Max power point voltage (V)
+            "iMPP": float array,            # Max power point current (A)
+            "mpptOutput": float array,      # Reference voltage output (V)
+            "outputPower": float array,     # Power at the reference (W)
+            "dcdcOutput": float array,      # Output pulse width
+            "IVRef": int array,             # Reference into IVPool, or -1
+            "IVPool": IVPool|None,          # Unique IV curves of the run
         }
 
-        Based on what is requested, not all of these parameters will have to be
-        filled in.
+        The IV curves are only stored if requested in resetPipeline, as they
+        are by far the largest part of the datastore. Each unique curve is
+        stored once in the IVPool, keyed by the conditions of the source, and
+        every entry refers to its curve by IVRef. The curve of entry idx is
+        retrieved by IVPool.getCurve(IVRef[idx]), over IVPool.getVoltages().
         """
         # Objects in the pipeline.
         self._PVEnv = PVEnvironment()
@@ -115,21 +188,56 @@ class DataController:
         self._DCDCConverter = DCDCConverter()
 
         # Data storage.
-        self.datastore = {
-            "cycle": [],
-            "sourceDef": [],
-            "sourceOutput": [],
-            "mpptOutput": [],
-            "dcdcOutput": [],
-            "maxCycle": 200,
-        }
+        self.datastore = self._createDatastore(200, 201, [], False)
 
         # The reference voltage applied at the start of every cycle.
         self._vREF = 0.0
 
+        # Scheduler used for multi-rate simulations. None for lockstep
+        # simulations.
+        self._scheduler = None
+
+        # The most recent source characteristics computed by the multi-rate
+        # pipeline. See _stepSource().
+        self._sourceSnapshot = None
+
+        # Steady state detection state for fast forwarding. None if fast
+        # forwarding is disabled. See setupFastForward().
+        self._steadyState = None
+
+        # Energy accumulated by the MPPT simulation, [actual, theoretical,
+        # sweep loss] (J). See getEnergy() and getSweepLoss().
+        self._energy = [0.0, 0.0, 0.0]
+
+        # Results sink that entries are streamed to. None if entries are not
+        # streamed. See setupSink().
+        self._sink = None
+
+        # Periodic checkpointing state. None if checkpointing is disabled. See
+        # setupCheckpoint().
+        self._checkpoint = None
+
+        # Pipeline state snapshots used for seeking. None if snapshots are
+        # disabled. See setupSnapshots().
+        self._snapshots = None
+
+        # Source response precomputed over every cycle of the profile. None if
+        # the source is evaluated every cycle. See setupSurface().
+        self._surface = None
+
     # Simulation pipeline management.
     def resetPipeline(
-        self, modelType, environment, maxCycles, MPPTGlobalAlgo, MPPTLocalAlgo, MPPTStrideAlgo
+        self,
+        modelType,
+        environment,
+        maxCycles,
+        MPPTGlobalAlgo,
+        MPPTLocalAlgo,
+        MPPTStrideAlgo,
+        strideParams=None,
+        storeIV=False,
+        maxIVCurves=None,
+        globalParams=None,
     ):
         """
         Resets components within the pipeline to the default state.
@@ -139,8 +247,11 @@ class DataController:
         ----------
         modelType: String
             The source model type.
-        environment: String or Tuple
-            PVEnvironment model used.
+        environment: String, Tuple or dict
+            PVEnvironment model used. Either a JSON file in 'External/', a step
+            response tuple, or an in memory source model dictionary (i.e.
+            generated by StochasticEnvironment, or with "Stochastic" modules).
+            See PVEnvironment.setupModel.
         maxCycles: Int
             Maximum number of cycles to execute for.
         MPPTGlobalAlgo: String
@@ -149,49 +260,526 @@ class DataController:
             The local MPPT algorithm type.
         MPPTStrideAlgo: String
             The stride MPPT algorithm type.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor, i.e.
+            {"minStride": 0.02, "error": 0.1}.
+        storeIV: bool
+            Whether to store the source IV curve of every entry in the
+            datastore.
+        maxIVCurves: int|None
+            Maximum number of unique IV curves held in memory when storing IV
+            curves. Least recently used curves beyond this are spilled to a
+            temporary file. If None, every curve is held in memory.
+        globalParams: dict|None
+            Keyword parameters of the global MPPT algorithm, i.e.
+            {"coarseStride": 0.5}.
         """
-        self.datastore = {
-            "cycle": [],
-            "sourceDef": [],
-            "sourceOutput": [],
-            "mpptOutput": [],
-            "dcdcOutput": [],
-            "maxCycle": maxCycles,
-        }
-
-        self._PVEnv.setupModel(source=environment, maxCycles=self.datastore["maxCycle"])
+        self._PVEnv.setupModel(source=environment, maxCycles=maxCycles)
         self._PVSource.setupModel(modelType=modelType)
 
+        self.datastore = self._createDatastore(
+            maxCycles,
+            self._getCapacity(maxCycles + 1),
+            list(self._PVEnv.getModuleMapping().keys()),
+            IVPool(maxCurves=maxIVCurves) if storeIV else None,
+        )
+        self._openSink()
+
         self._MPPT.setupModel(
             numCells=self._PVEnv.getSourceNumCells(),
             MPPTGlobalAlgoType=MPPTGlobalAlgo,
             MPPTLocalAlgoType=MPPTLocalAlgo,
             strideType=MPPTStrideAlgo,
+            strideParams=strideParams,
+            globalParams=globalParams,
         )
         self._DCDCConverter.reset()
 
         self._vREF = 0.0
 
-    def iteratePipelineCycleMPPT(self):
+        self._scheduler = None
+        self._sourceSnapshot = None
+
+        if self._steadyState is not None:
+            self.setupFastForward(True, self._steadyState["maxHistory"])
+        if self._surface is not None:
+            self._buildSurface()
+        if self._snapshots is not None:
+            self.setupSnapshots(self._snapshots["interval"])
+        self._energy = [0.0, 0.0, 0.0]
+
+    def setupFastForward(self, enable=True, maxHistory=256):
+        """
+        Enables or disables fast forwarding of iteratePipelineCycleMPPT across
+        periodic steady states.
+
+        Before every cycle, the state of the MPPT, the DC-DC converter, and the
+        applied VREF is fingerprinted. If the fingerprint matches that of an
+        earlier cycle and the environment has not changed since, the pipeline
+        is deterministic and will repeat the cycles in between until the
+        environment next changes. Those cycles are appended to the datastore
+        from the recorded ones, the pipeline state is restored to what it
+        would have been at the end of the stretch, and their energy is
+        accumulated in bulk. The results are identical to running every cycle.
+
+        Parameters
+        ----------
+        enable: bool
+            Whether to fast forward.
+        maxHistory: int
+            Maximum number of cycles to remember while looking for a repeating
+            state. Bounds the memory used and the longest detectable period.
+        """
+        if enable:
+            self._steadyState = {
+                "maxHistory": maxHistory,
+                "envKey": None,  # Environment of the recorded cycles.
+                "startCycle": 0,  # Cycle of the first recorded entry.
+                "fingerprints": {},  # Pipeline state fingerprint -> index.
+                "states": [],  # Pipeline state fingerprint of each cycle.
+                "rows": [],  # Datastore row of each cycle.
+            }
+        else:
+            self._steadyState = None
+
+    def setupSink(self, writer=None, retain=True):
+        """
+        Streams the entries of the MPPT simulation to a results writer. Must be
+        called before resetPipeline, which opens the writer. Entries are
+        handed to the writer every writer.blockSize entries, and the writer is
+        closed once the simulation completes (or by closeSink, i.e. if the
+        simulation is interrupted).
+
+        Parameters
+        ----------
+        writer: ResultsWriter|None
+            The writer to stream entries to. If None, entries are not
+            streamed.
+        retain: bool
+            Whether to keep every entry in the datastore. If False, the entries
+            that have been written are dropped from the datastore, which then
+            only holds the most recent entries. The datastore is then sized
+            for writer.blockSize entries instead of the whole simulation.
+        """
+        self.closeSink()
+        self._sink = None
+        if writer is not None:
+            self._sink = {
+                "writer": writer,
+                "retain": retain,
+                "open": False,  # Whether the writer is open for this run.
+                "numWritten": 0,  # Number of datastore rows written.
+            }
+
+    def closeSink(self):
+        """
+        Writes out the entries not yet streamed and closes the results writer,
+        if any.
+        """
+        if self._sink is not None and self._sink["open"]:
+            self._drainSink(True)
+            self._sink["writer"].close()
+            self._sink["open"] = False
+
+    def getSink(self):
+        """
+        Returns the results writer entries are streamed to.
+
+        Return
+        ------
+        ResultsWriter|None: The writer, or None if entries are not streamed.
+        """
+        if self._sink is None:
+            return None
+        return self._sink["writer"]
+
+    def setupCheckpoint(self, fileName=None, interval=10000):
+        """
+        Periodically checkpoints the MPPT simulation. Every interval cycles,
+        the entire state of the pipeline (the environment cycle, the MPPT
+        algorithm and stride internals, the DC-DC converter, VREF, the energy
+        accumulators, the datastore and the position in the results file, if
+        streaming) is saved to fileName. The checkpoint is removed once the
+        simulation completes.
+
+        Parameters
+        ----------
+        fileName: String|None
+            Path of the checkpoint file. If None, checkpointing is disabled.
+        interval: int
+            Number of cycles between checkpoints.
+        """
+        self._checkpoint = None
+        if fileName is not None:
+            if interval < 1:
+                raise Exception("The checkpoint interval must be at least 1 cycle.")
+            self._checkpoint = {
+                "fileName": fileName,
+                "interval": interval,
+                "lastCycle": self._PVEnv.getCycle(),  # Cycle of the last save.
+            }
+
+    def saveCheckpoint(self, fileName):
+        """
+        Saves the entire state of the pipeline to a file. The file is replaced
+        atomically, so an interruption while saving leaves the previous
+        checkpoint intact.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the checkpoint file.
+        """
+        tempFileName = fileName + ".tmp"
+        with open(tempFileName, "wb") as file:
+            pickle.dump(
+                {"version": DataController.CHECKPOINT_VERSION, "controller": self},
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tempFileName, fileName)
+
+    @classmethod
+    def loadCheckpoint(cls, fileName):
+        """
+        Restores a pipeline from a checkpoint. The simulation continues from
+        the cycle after the checkpoint, with the same setup (fast forwarding,
+        multi-rate stages, results sink, checkpointing) it was saved with. If
+        streaming, the results file is truncated back to the entries written
+        at the time of the checkpoint.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the checkpoint file.
+
+        Return
+        ------
+        DataController: The restored controller.
+        """
+        with open(fileName, "rb") as file:
+            checkpoint = pickle.load(file)
+        if (
+            not isinstance(checkpoint, dict)
+            or checkpoint.get("version") != DataController.CHECKPOINT_VERSION
+        ):
+            raise Exception(fileName + " is not a compatible checkpoint.")
+
+        controller = checkpoint["controller"]
+        if controller._sink is not None and controller._sink["open"]:
+            controller._sink["writer"].reopen()
+        return controller
+
+    def setupSnapshots(self, interval=1000):
+        """
+        Keeps a snapshot of the pipeline state (the MPPT, the DC-DC converter,
+        VREF, and the energy accumulators) every interval cycles of
+        iteratePipelineCycleMPPT, so that seekCycle can return to earlier
+        cycles without running the simulation from the start.
+
+        Parameters
+        ----------
+        interval: int|None
+            Number of cycles between snapshots. Seeking backwards replays at
+            most this many cycles. If None, snapshots are disabled.
+        """
+        self._snapshots = None
+        if interval is not None:
+            if interval < 1:
+                raise Exception("The snapshot interval must be at least 1 cycle.")
+            self._snapshots = {
+                "interval": interval,
+                "cycles": [],  # Cycle each snapshot was taken before, ascending.
+                "numEntries": [],  # Datastore entries when each was taken.
+                "states": [],  # Pickled pipeline state of each snapshot.
+            }
+
+    def seekCycle(self, cycle):
+        """
+        Moves the MPPT simulation to just after the given cycle has run. The
+        datastore then holds the entries up to and including the cycle, and
+        iterating the pipeline continues from the cycle after. The results are
+        identical to running the simulation up to the cycle from the start.
+
+        Parameters
+        ----------
+        cycle: int
+            The cycle to seek to. Clamped to the cycles of the simulation.
+
+        Return
+        ------
+        tuple: (datastore, continueBool)
+            The datastore and whether the pipeline can be iterated further.
+        """
+        if self._snapshots is None:
+            raise Exception("setupSnapshots must be called before seeking.")
+        if self._scheduler is not None:
+            raise Exception("Seeking is not supported by multi-rate pipelines.")
+        if self._sink is not None:
+            raise Exception("Seeking is not supported while streaming results.")
+
+        datastore = self.datastore
+        cycle = max(0, min(cycle, datastore["maxCycle"]))
+        numEntries = datastore["numEntries"]
+        if numEntries > 0 and datastore["cycle"][numEntries - 1] > cycle:
+            # Restore the latest snapshot taken before the cycle, and forget
+            # everything after it.
+            snapshots = self._snapshots
+            idx = bisect.bisect_right(snapshots["cycles"], cycle) - 1
+            if idx < 0:
+                raise Exception("No snapshot was taken before cycle " + str(cycle))
+            (self._MPPT, self._DCDCConverter, self._vREF, self._energy) = (
+                pickle.loads(snapshots["states"][idx])
+            )
+            self._PVEnv.setCycle(snapshots["cycles"][idx])
+            datastore["numEntries"] = snapshots["numEntries"][idx]
+            for key in ["cycles", "numEntries", "states"]:
+                del snapshots[key][idx + 1 :]
+            if self._steadyState is not None:
+                self.setupFastForward(True, self._steadyState["maxHistory"])
+
+        while (
+            datastore["numEntries"] == 0
+            or datastore["cycle"][datastore["numEntries"] - 1] < cycle
+        ):
+            (datastore, _) = self.iteratePipelineCycleMPPT(cycle)
+
+        continueBool = (
+            datastore["cycle"][datastore["numEntries"] - 1] < datastore["maxCycle"]
+        )
+        return (datastore, continueBool)
+
+    def setupSurface(self, enable=True):
+        """
+        Enables or disables precomputing the response of the source over the
+        whole profile, so that iteratePipelineCycleMPPT no longer evaluates the
+        source model. The response is computed for the current profile, if
+        any, and by every resetPipeline afterwards.
+
+        The IV curve and edge characteristics of every distinct environment
+        (the irradiance and temperature of every module) reached by a cycle of
+        the profile are computed once. The curves are stored as a 2-D array,
+        a row per condition over the voltage grid of PVSource.getIV, along
+        with the row of each cycle. Each cycle, the source current at VREF is
+        then interpolated from the row of the cycle, as in the MPPT stage of
+        the multi-rate pipeline, instead of being evaluated by the model. A run
+        then costs little more than the MPPT itself, and since the response is
+        kept across resets of the same source model and profile, other
+        algorithms are evaluated against it without computing it again.
+
+        Parameters
+        ----------
+        enable: bool
+            Whether to precompute the source response.
+        """
+        if not enable:
+            self._surface = None
+            return
+
+        if self._surface is None:
+            self._surface = {
+                "modelType": None,  # Source model the response is of.
+                "environment": None,  # Conditions of each cycle, per module.
+                "IV": None,  # Condition x voltage x (V, I).
+                "edges": [],  # Edge characteristics of each condition.
+                "index": None,  # Condition of each cycle.
+            }
+        if self._PVSource.getModelType() is not None:
+            self._buildSurface()
+
+    def _buildSurface(self):
+        """
+        Precomputes the response of the source over the current profile,
+        unless it was already computed for the same source model and
+        conditions. See setupSurface.
+        """
+        surface = self._surface
+        PVEnv = self._PVEnv
+        cycles = np.arange(self.datastore["maxCycle"] + 1)
+        (irradiance, temperature) = PVEnv.getEnvironmentAtTimes(
+            PVEnv.cycleToTime(cycles)
+        )
+        environment = np.hstack([irradiance, temperature])
+        modelType = self._PVSource.getModelType()
+        if surface["modelType"] == modelType and np.array_equal(
+            surface["environment"], environment
+        ):
+            return
+
+        (conditions, index) = np.unique(environment, axis=0, return_inverse=True)
+        numCells = PVEnv.getSourceNumCells()
+        modules = list(PVEnv.getModuleMapping().keys())
+        curves = []
+        edges = []
+        for condition in conditions.tolist():
+            modulesDef = {
+                moduleName: {
+                    "numCells": PVEnv.getModuleNumCells(moduleName),
+                    "voltage": 0.0,
+                    "irradiance": condition[idx],
+                    "temperature": condition[len(modules) + idx],
+                }
+                for (idx, moduleName) in enumerate(modules)
+            }
+            curves.append(self._PVSource.getIV(modulesDef, numCells))
+            edges.append(self._PVSource.getEdgeCharacteristics(modulesDef, numCells))
+
+        surface["modelType"] = modelType
+        surface["environment"] = environment
+        surface["IV"] = np.array(curves, dtype=float)
+        surface["edges"] = edges
+        surface["index"] = index.reshape(-1)
+
+    def getEnergy(self):
+        """
+        Returns the energy accumulated by the MPPT simulation. The actual
+        energy is extracted at the VREF output each cycle, and the theoretical
+        energy is extracted at the maximum power point.
+
+        Return
+        ------
+        tuple: (actual: float, theoretical: float) in J.
+        """
+        return tuple(self._energy[:2])
+
+    def getSweepLoss(self):
+        """
+        Returns the energy lost while the global MPPT algorithm was searching
+        for the global maximum power point (i.e. sweeping), as the difference
+        between the theoretical and actual energy over those cycles.
+
+        Return
+        ------
+        float: The energy lost in J.
+        """
+        return self._energy[2]
+
+    def getTrace(self):
+        """
+        Returns the stream seen by the MPPT over the entries recorded so far,
+        with the response surface of the source if IV curves were stored or
+        precomputed. See MPPTTrace.
+
+        Return
+        ------
+        MPPTTrace: The trace.
+        """
+        if self._sink is not None and not self._sink["retain"]:
+            raise Exception("Traces require every entry to be retained.")
+
+        datastore = self.datastore
+        numEntries = datastore["numEntries"]
+        (irradiance, temperature) = self._PVEnv.getSourceEnvironmentAtTimes(
+            datastore["time"][:numEntries]
+        )
+        surface = None
+        if datastore["IVPool"] is not None and numEntries > 0:
+            surface = IVSurface.fromIVPool(
+                datastore["IVPool"], datastore["IVRef"][:numEntries]
+            )
+        elif self._surface is not None and self._scheduler is None:
+            IV = self._surface["IV"]
+            surface = IVSurface(
+                IV[0, :, 0],
+                IV[:, :, 1],
+                self._surface["index"][datastore["cycle"][:numEntries]],
+            )
+
+        return MPPTTrace(
+            {
+                "arrVoltage": datastore["arrayVoltage"][:numEntries],
+                "arrCurrent": datastore["sourceCurrent"][:numEntries],
+                "irradiance": irradiance,
+                "temperature": temperature,
+                "vRef": datastore["mpptOutput"][:numEntries],
+            },
+            self._PVEnv.getSourceNumCells(),
+            self._getPeriod(),
+            surface,
+        )
+
+    def getMetrics(self, threshold=Metrics.THRESHOLD):
+        """
+        Returns the tracking metrics of the entries recorded so far, i.e. the
+        cycles below threshold, the settling time after each environment step
+        and the oscillation once settled. See Metrics.getRunMetrics.
+
+        Parameters
+        ----------
+        threshold: float
+            Fraction of the available power under which a cycle is poorly
+            tracked.
+
+        Return
+        ------
+        dict: The metrics.
+        """
+        if self._sink is not None and not self._sink["retain"]:
+            raise Exception("Metrics require every entry to be retained.")
+
+        return Metrics.getRunMetrics(self.datastore, self._getPeriod(), threshold)
+
+    def getRescanCounts(self):
+        """
+        Returns how many times a change in the P-V curve triggered each kind of
+        rescan of the global MPPT algorithm. See GlobalMPPTAlgorithm.
+
+        Return
+        ------
+        dict: {"partial": int, "full": int}
+        """
+        return self._MPPT.getRescanCounts()
+
+    def iteratePipelineCycleMPPT(self, stopCycle=None):
         """
         Runs an entire cycle through the pipeline, using components required for
-        a MPPT Simulation.
+        a MPPT Simulation. If fast forwarding is enabled and a periodic steady
+        state is detected, runs until the environment next changes instead.
+
+        Parameters
+        ----------
+        stopCycle: int|None
+            Last cycle fast forwarding may run up to. If None, fast forwarding
+            runs up to the next environment change.
+
+        Return
+        ------
+        tuple: (datastore, continueBool)
+            The datastore and whether the pipeline can be iterated further.
         """
         # Get the current simulation cycle.
         cycle = self._PVEnv.getCycle()
 
+        if self._snapshots is not None:
+            self._snapshotIfDue(cycle)
+
         # Retrieve the source definition for the current simulation cycle.
         modulesDef = self._PVEnv.getSourceDefinition(self._vREF)
+
+        if self._steadyState is not None:
+            result = self._fastForward(cycle, modulesDef, stopCycle)
+            if result is not None:
+                self._checkpointIfDue(result[1])
+                return result
         numCells = self._PVEnv.getSourceNumCells()
         envDef = self._PVEnv.getSourceEnvironmentDefinition()
 
         # Retrieve the source characteristics given the source definition.
-        sourceCurrent = self._PVSource.getSourceCurrent(modulesDef)
-        sourceIV = self._PVSource.getIV(modulesDef, numCells)
-        sourceEdgeChar = self._PVSource.getEdgeCharacteristics(modulesDef, numCells)
+        if self._surface is not None:
+            row = self._surface["index"][cycle]
+            sourceIV = self._surface["IV"][row]
+            sourceCurrent = float(np.interp(self._vREF, sourceIV[:, 0], sourceIV[:, 1]))
+            sourceEdgeChar = self._surface["edges"][row]
+        else:
+            sourceCurrent = self._PVSource.getSourceCurrent(modulesDef)
+            sourceIV = self._PVSource.getIV(modulesDef, numCells)
+            sourceEdgeChar = self._PVSource.getEdgeCharacteristics(
+                modulesDef, numCells
+            )
 
         # Retrieve the MPPT VREF guess given the source output current.
-        print(cycle, end='\t')
         vRef = self._MPPT.getReferenceVoltage(
             self._vREF,
             sourceCurrent,
@@ -204,13 +792,19 @@ class DataController:
         pulseWidth = self._DCDCConverter.getPulseWidth()
 
         # Store our output into our datastore.
-        self.datastore["cycle"].append(cycle)
-        self.datastore["sourceDef"].append(modulesDef)
-        self.datastore["sourceOutput"].append(
-            {"current": sourceCurrent, "IV": sourceIV, "edge": sourceEdgeChar}
+        if self._steadyState is not None:
+            self._steadyState["rows"].append(self.datastore["numEntries"])
+        self._recordEntry(
+            cycle,
+            self._PVEnv.getTime(),
+            self._vREF,
+            modulesDef,
+            sourceCurrent,
+            sourceIV,
+            sourceEdgeChar,
+            vRef,
+            pulseWidth,
         )
-        self.datastore["mpptOutput"].append(vRef)
-        self.datastore["dcdcOutput"].append(pulseWidth)
 
         # Assign the VREF to apply across the source in the next simulation cycle.
         self._vREF = vRef
@@ -219,9 +813,567 @@ class DataController:
         continueBool = True
         if not self._PVEnv.incrementCycle():
             continueBool = False
+            self.closeSink()
 
+        self._checkpointIfDue(continueBool)
         return (self.datastore, continueBool)
 
+    def _snapshotIfDue(self, cycle):
+        """
+        Takes a snapshot of the pipeline state before the given cycle runs, if
+        interval cycles have passed since the last snapshot.
+
+        Parameters
+        ----------
+        cycle: int
+            The current simulation cycle, which has not been run yet.
+        """
+        snapshots = self._snapshots
+        if snapshots["cycles"] and (
+            cycle - snapshots["cycles"][-1] < snapshots["interval"]
+        ):
+            return
+        snapshots["cycles"].append(cycle)
+        snapshots["numEntries"].append(self.datastore["numEntries"])
+        snapshots["states"].append(
+            pickle.dumps(
+                (self._MPPT, self._DCDCConverter, self._vREF, list(self._energy))
+            )
+        )
+
+    def _checkpointIfDue(self, continueBool):
+        """
+        Saves a checkpoint if interval cycles have passed since the last one,
+        or removes the checkpoint if the simulation has completed.
+
+        Parameters
+        ----------
+        continueBool: bool
+            Whether the pipeline can be iterated further.
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is None:
+            return
+
+        if not continueBool:
+            if os.path.exists(checkpoint["fileName"]):
+                os.remove(checkpoint["fileName"])
+            return
+
+        cycle = self._PVEnv.getCycle()
+        if cycle - checkpoint["lastCycle"] >= checkpoint["interval"]:
+            checkpoint["lastCycle"] = cycle
+            self.saveCheckpoint(checkpoint["fileName"])
+
+    def _getPeriod(self):
+        """
+        Returns the time covered by each entry of the MPPT simulation.
+
+        Return
+        ------
+        float: The cycle period, or the MPPT period of multi-rate pipelines,
+        in seconds.
+        """
+        if self._scheduler is not None:
+            return self._scheduler.getStage("MPPT")["period"]
+        return self._PVEnv.getCyclePeriod()
+
+    def _getCapacity(self, numEntries):
+        """
+        Returns the number of entries to preallocate in the datastore.
+
+        Parameters
+        ----------
+        numEntries: int
+            Number of entries in the simulation.
+
+        Return
+        ------
+        int: The capacity. When streaming without retaining entries, only a
+        block of entries is held at a time.
+        """
+        if self._sink is not None and not self._sink["retain"]:
+            return min(numEntries, self._sink["writer"].blockSize)
+        return numEntries
+
+    def _openSink(self):
+        """
+        Opens the results writer, if any, for a new simulation.
+        """
+        if self._sink is not None:
+            self._sink["writer"].open(self.datastore["modules"])
+            self._sink["open"] = True
+            self._sink["numWritten"] = 0
+
+    def _drainSink(self, final=False):
+        """
+        Hands the entries not yet written to the results writer once a block
+        of them has accumulated. If entries are not retained, the written rows
+        are then dropped from the front of the datastore, except for those the
+        fast forward replay may still copy from.
+
+        Parameters
+        ----------
+        final: bool
+            Whether to write out the remaining entries regardless of the block
+            size.
+        """
+        sink = self._sink
+        if sink is None or not sink["open"]:
+            return
+
+        datastore = self.datastore
+        numEntries = datastore["numEntries"]
+        if numEntries - sink["numWritten"] < sink["writer"].blockSize and not final:
+            return
+        sink["writer"].write(datastore, sink["numWritten"], numEntries)
+        sink["numWritten"] = numEntries
+        if sink["retain"]:
+            return
+
+        keep = numEntries
+        if self._steadyState is not None and self._steadyState["rows"]:
+            keep = self._steadyState["rows"][0]
+        if keep == 0:
+            return
+        for values in datastore.values():
+            if isinstance(values, np.ndarray):
+                values[: numEntries - keep] = values[keep:numEntries]
+        datastore["numEntries"] -= keep
+        sink["numWritten"] -= keep
+        if self._steadyState is not None:
+            self._steadyState["rows"] = [
+                row - keep for row in self._steadyState["rows"]
+            ]
+
+    def _createDatastore(self, maxCycle, capacity, modules, pool):
+        """
+        Creates an empty columnar datastore. See __init__ for the format.
+
+        Parameters
+        ----------
+        maxCycle: int
+            Maximum cycle of the simulation.
+        capacity: int
+            Number of entries to preallocate.
+        modules: List of Strings
+            Names of the modules in the source.
+        pool: IVPool|None
+            The pool to store the source IV curves of every entry in. If None,
+            IV curves are not stored.
+
+        Return
+        ------
+        dict: The datastore.
+        """
+        datastore = {
+            "maxCycle": maxCycle,
+            "numEntries": 0,
+            "modules": modules,
+            "cycle": np.zeros(capacity, dtype=np.int64),
+            "irradiance": np.zeros((capacity, len(modules))),
+            "temperature": np.zeros((capacity, len(modules))),
+            "IVRef": np.full(capacity, -1, dtype=np.int64),
+            "IVPool": pool,
+        }
+        for column in DataController._FLOAT_COLUMNS:
+            datastore[column] = np.zeros(capacity)
+        return datastore
+
+    def _reserveDatastore(self, numEntries):
+        """
+        Grows the datastore if it cannot fit another numEntries entries. The
+        capacity is at least doubled to amortize the copies.
+
+        Parameters
+        ----------
+        numEntries: int
+            Number of entries about to be recorded.
+        """
+        datastore = self.datastore
+        capacity = len(datastore["cycle"])
+        required = datastore["numEntries"] + numEntries
+        if required <= capacity:
+            return
+
+        newCapacity = max(required, 2 * capacity)
+        for (column, values) in datastore.items():
+            if isinstance(values, np.ndarray):
+                grown = np.zeros((newCapacity,) + values.shape[1:], dtype=values.dtype)
+                grown[:capacity] = values
+                datastore[column] = grown
+
+    def _recordEntry(
+        self,
+        cycle,
+        time,
+        arrVoltage,
+        modulesDef,
+        sourceCurrent,
+        sourceIV,
+        sourceEdgeChar,
+        vRef,
+        pulseWidth,
+    ):
+        """
+        Records an entry of the MPPT simulation into the next row of the
+        datastore, and accumulates the energy extracted over the entry.
+
+        Parameters
+        ----------
+        cycle: int
+            The simulation cycle.
+        time: float
+            The simulation time in seconds.
+        arrVoltage: float
+            The voltage applied across the source.
+        modulesDef: dict
+            The source definition.
+        sourceCurrent: float
+            The source current at the applied voltage.
+        sourceIV: List of tuples|numpy array
+            The voltage/current tuples of the source, or a 2-D array of them.
+        sourceEdgeChar: tuple
+            The edge characteristics of the source.
+        vRef: float
+            The reference voltage output by the MPPT.
+        pulseWidth: float
+            The pulse width output by the DC-DC converter.
+        """
+        self._reserveDatastore(1)
+        datastore = self.datastore
+        idx = datastore["numEntries"]
+
+        (vOC, iSC, (vMPP, iMPP)) = sourceEdgeChar
+        outputPower = 0.0
+        if len(sourceIV) > 0:
+            IV = np.asarray(sourceIV, dtype=float)
+            outputPower = vRef * float(np.interp(vRef, IV[:, 0], IV[:, 1]))
+            pool = datastore["IVPool"]
+            if pool is not None:
+                key = pool.getKey(
+                    [module["irradiance"] for module in modulesDef.values()],
+                    [module["temperature"] for module in modulesDef.values()],
+                )
+                datastore["IVRef"][idx] = pool.intern(key, IV[:, 0], IV[:, 1])
+
+        datastore["cycle"][idx] = cycle
+        datastore["time"][idx] = time
+        datastore["arrayVoltage"][idx] = arrVoltage
+        datastore["sourceCurrent"][idx] = sourceCurrent
+        for (moduleIdx, module) in enumerate(modulesDef.values()):
+            datastore["irradiance"][idx, moduleIdx] = module["irradiance"]
+            datastore["temperature"][idx, moduleIdx] = module["temperature"]
+        datastore["vOC"][idx] = vOC
+        datastore["iSC"][idx] = iSC
+        datastore["vMPP"][idx] = vMPP
+        datastore["iMPP"][idx] = iMPP
+        datastore["mpptOutput"][idx] = vRef
+        datastore["outputPower"][idx] = outputPower
+        datastore["dcdcOutput"][idx] = pulseWidth
+        datastore["numEntries"] += 1
+
+        period = self._getPeriod()
+        self._energy[0] += outputPower * period
+        self._energy[1] += vMPP * iMPP * period
+        if self._MPPT.isSearching():
+            self._energy[2] += (vMPP * iMPP - outputPower) * period
+
+        self._drainSink()
+
+    def _fastForward(self, cycle, modulesDef, stopCycle=None):
+        """
+        Checks whether the pipeline has reached a periodic steady state, and if
+        so, replays the period until the environment next changes.
+
+        Parameters
+        ----------
+        cycle: int
+            The current simulation cycle, which has not been run yet.
+        modulesDef: dict
+            The source definition for the current simulation cycle.
+        stopCycle: int|None
+            Last cycle to fast forward up to, if before the next environment
+            change.
+
+        Return
+        ------
+        tuple|None: (datastore, continueBool) if the pipeline was fast
+        forwarded, None otherwise.
+        """
+        steadyState = self._steadyState
+        envKey = tuple(
+            (module["irradiance"], module["temperature"])
+            for module in modulesDef.values()
+        )
+        if (
+            envKey != steadyState["envKey"]
+            or len(steadyState["states"]) >= steadyState["maxHistory"]
+        ):
+            # The environment changed or we have not converged in time; start
+            # looking for a steady state from this cycle.
+            self.setupFastForward(True, steadyState["maxHistory"])
+            steadyState = self._steadyState
+            steadyState["envKey"] = envKey
+            steadyState["startCycle"] = cycle
+
+        fingerprint = pickle.dumps((self._MPPT, self._DCDCConverter, self._vREF))
+        start = steadyState["fingerprints"].get(fingerprint)
+        if start is None:
+            steadyState["fingerprints"][fingerprint] = len(steadyState["states"])
+            steadyState["states"].append(fingerprint)
+            return None
+
+        # The pipeline will repeat the rows from start onwards for every cycle
+        # up to the last cycle before the environment changes.
+        period = len(steadyState["states"]) - start
+        lastCycle = int(self._PVEnv.timeToCycle(self._PVEnv.getNextChangeTime()))
+        if stopCycle is not None:
+            lastCycle = max(cycle, min(lastCycle, stopCycle))
+        numCycles = lastCycle - cycle + 1
+        remainder = numCycles % period
+
+        # Copy out the recorded period and the pipeline state at the start of
+        # the cycle after the stretch, which is the state after the remainder
+        # of a period. The recorded cycles are no longer needed afterwards.
+        periodRows = np.array(steadyState["rows"][start:])
+        template = {
+            column: self.datastore[column][periodRows]
+            for column in DataController._FLOAT_COLUMNS
+            + ["irradiance", "temperature", "IVRef"]
+        }
+        state = steadyState["states"][start + remainder]
+        self.setupFastForward(True, steadyState["maxHistory"])
+
+        # Replay the period in the datastore. When streaming without retaining
+        # entries, replay a block at a time so the datastore stays bounded.
+        cyclePeriod = self._PVEnv.getCyclePeriod()
+        blockSize = self._getCapacity(numCycles)
+        for blockStart in range(0, numCycles, blockSize):
+            numRows = min(blockSize, numCycles - blockStart)
+            self._reserveDatastore(numRows)
+            datastore = self.datastore
+            offsets = np.arange(blockStart, blockStart + numRows)
+            rows = slice(datastore["numEntries"], datastore["numEntries"] + numRows)
+            for (column, values) in template.items():
+                datastore[column][rows] = values[offsets % period]
+            datastore["cycle"][rows] = cycle + offsets
+            datastore["time"][rows] = (cycle + offsets) * cyclePeriod
+            datastore["numEntries"] += numRows
+
+            # Accumulate the energy of the replayed cycles.
+            self._energy[0] += (
+                float(np.sum(datastore["outputPower"][rows])) * cyclePeriod
+            )
+            self._energy[1] += (
+                float(np.sum(datastore["vMPP"][rows] * datastore["iMPP"][rows]))
+                * cyclePeriod
+            )
+            self._drainSink()
+
+        # Restore the pipeline state at the start of the cycle after the
+        # stretch.
+        (self._MPPT, self._DCDCConverter, self._vREF) = pickle.loads(state)
+
+        self._PVEnv.setCycle(lastCycle)
+        continueBool = True
+        if not self._PVEnv.incrementCycle():
+            continueBool = False
+            self.closeSink()
+
+        return (self.datastore, continueBool)
+
+    def setupMultiRate(
+        self,
+        environmentPeriod=None,
+        sourcePeriod=None,
+        MPPTPeriod=None,
+        converterPeriod=None,
+        settlingTime=0.0,
+    ):
+        """
+        Sets up the pipeline to run each component at its own update period.
+        Must be called after resetPipeline. Afterwards, the pipeline is
+        advanced with iteratePipelineMultiRate.
+
+        The stages, in execution order when due at the same time, are:
+        - environment: samples the PVEnvironment at the current time.
+        - source: recomputes the source IV curve and edge characteristics, but
+          only if the environment has changed since the last computation.
+        - converter: settles the array voltage towards the MPPT reference.
+        - MPPT: reads the array voltage and the source current (interpolated
+          from the cached IV curve) and generates a new reference voltage.
+
+        Parameters
+        ----------
+        environmentPeriod: float|None
+            Update period of the environment in seconds. Defaults to the
+            cycle period of the PVEnvironment.
+        sourcePeriod: float|None
+            Update period of the source in seconds. Defaults to the
+            environment period.
+        MPPTPeriod: float|None
+            Update period of the MPPT in seconds. Defaults to the environment
+            period.
+        converterPeriod: float|None
+            Update period of the DC-DC converter in seconds. Defaults to the
+            MPPT period.
+        settlingTime: float
+            Time constant, in seconds, of the array voltage settling to the
+            MPPT reference voltage. 0 applies the reference instantly.
+        """
+        if environmentPeriod is None:
+            environmentPeriod = self._PVEnv.getCyclePeriod()
+        if sourcePeriod is None:
+            sourcePeriod = environmentPeriod
+        if MPPTPeriod is None:
+            MPPTPeriod = environmentPeriod
+        if converterPeriod is None:
+            converterPeriod = MPPTPeriod
+
+        self._DCDCConverter.settlingTime = settlingTime
+        self._sourceSnapshot = None
+
+        # Reallocate the datastore for the number of MPPT updates.
+        numEntries = int(self._PVEnv.getMaxTime() / MPPTPeriod + 1e-9) + 1
+        self.datastore = self._createDatastore(
+            self.datastore["maxCycle"],
+            self._getCapacity(numEntries),
+            self.datastore["modules"],
+            self.datastore["IVPool"],
+        )
+        self._openSink()
+
+        self._scheduler = Scheduler()
+        self._scheduler.addStage(
+            "environment", environmentPeriod, self._stepEnvironment
+        )
+        self._scheduler.addStage("source", sourcePeriod, self._stepSource)
+        self._scheduler.addStage(
+            "converter", converterPeriod, self._stepConverter
+        )
+        self._scheduler.addStage("MPPT", MPPTPeriod, self._stepMPPT)
+
+    def iteratePipelineMultiRate(self):
+        """
+        Runs the multi-rate pipeline until the next MPPT update has completed.
+        Every MPPT update is stored in the datastore.
+
+        Return
+        ------
+        tuple: (datastore, continueBool)
+            The datastore and whether the pipeline can be iterated further.
+        """
+        if self._scheduler is None:
+            raise Exception("setupMultiRate must be called before iterating.")
+
+        maxTime = self._PVEnv.getMaxTime()
+        MPPTStage = self._scheduler.getStage("MPPT")
+        while MPPTStage["count"] * MPPTStage["period"] <= maxTime:
+            if "MPPT" in self._scheduler.step():
+                break
+
+        continueBool = MPPTStage["count"] * MPPTStage["period"] <= maxTime
+        if not continueBool:
+            self.closeSink()
+        self._checkpointIfDue(continueBool)
+        return (self.datastore, continueBool)
+
+    def _stepEnvironment(self, time):
+        """
+        Environment stage of the multi-rate pipeline.
+
+        Parameters
+        ----------
+        time: float
+            Current simulation time in seconds.
+        """
+        self._PVEnv.setTime(min(time, self._PVEnv.getMaxTime()))
+
+    def _stepSource(self, time):
+        """
+        Source stage of the multi-rate pipeline. The IV curve and edge
+        characteristics of the source are only recomputed if the environment
+        has changed since they were last computed.
+
+        Parameters
+        ----------
+        time: float
+            Current simulation time in seconds.
+        """
+        modulesDef = self._PVEnv.getSourceDefinition(self._vREF)
+        key = tuple(
+            (module["irradiance"], module["temperature"])
+            for module in modulesDef.values()
+        )
+        if self._sourceSnapshot is not None and self._sourceSnapshot["key"] == key:
+            return
+
+        numCells = self._PVEnv.getSourceNumCells()
+        sourceIV = self._PVSource.getIV(modulesDef, numCells)
+        sourceEdgeChar = self._PVSource.getEdgeCharacteristics(modulesDef, numCells)
+        self._sourceSnapshot = {
+            "key": key,
+            "modulesDef": modulesDef,
+            "envDef": self._PVEnv.getSourceEnvironmentDefinition(),
+            "IV": sourceIV,
+            "edge": sourceEdgeChar,
+            "voltages": np.array([voltage for (voltage, _) in sourceIV]),
+            "currents": np.array([current for (_, current) in sourceIV]),
+        }
+
+    def _stepConverter(self, time):
+        """
+        DC-DC converter stage of the multi-rate pipeline.
+
+        Parameters
+        ----------
+        time: float
+            Current simulation time in seconds.
+        """
+        self._DCDCConverter.step(self._scheduler.getStage("converter")["period"])
+
+    def _stepMPPT(self, time):
+        """
+        MPPT stage of the multi-rate pipeline. The source current at the
+        array voltage is interpolated from the cached source IV curve.
+
+        Parameters
+        ----------
+        time: float
+            Current simulation time in seconds.
+        """
+        snapshot = self._sourceSnapshot
+        arrVoltage = self._DCDCConverter.getVoltageOut()
+        sourceCurrent = float(
+            np.interp(arrVoltage, snapshot["voltages"], snapshot["currents"])
+        )
+
+        vRef = self._MPPT.getReferenceVoltage(
+            arrVoltage,
+            sourceCurrent,
+            snapshot["envDef"]["irradiance"],
+            snapshot["envDef"]["temperature"],
+        )
+
+        self._DCDCConverter.setPulseWidth(vRef)
+        pulseWidth = self._DCDCConverter.getPulseWidth()
+
+        # Store our output into our datastore.
+        self._recordEntry(
+            self._PVEnv.getCycle(),
+            time,
+            arrVoltage,
+            snapshot["modulesDef"],
+            sourceCurrent,
+            snapshot["IV"],
+            snapshot["edge"],
+            vRef,
+            pulseWidth,
+        )
+
+        self._vREF = vRef
+
     def generateSourceCurve(
         self,
         numCells,
@@ -4,14 +4,25 @@ File: Graph.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/17/20
-Last Modified: 11/24/20
+Last Modified: 10/19/26
 
 Description: The Graph class is a customizable widget allowing for
 displaying series data over an independent axis, like time. Axes properties,
 labels, and number of elements displayed at one time is defined at declaration.
+
+The values of each series are kept in a SeriesBuffer, so adding points is
+amortized O(1). Changes are not drawn immediately; the series changed are
+redrawn once the event loop is next idle, so any number of points added in
+one frame cost a single setData per series.
+
+Line series are drawn at a level of detail matching the view: each keeps an
+LODPyramid of min/max envelopes, and only the points within the visible x
+range, downsampled to about the width of the graph in pixels, are handed to
+the plotting backend. Series are redrawn whenever the view is panned, zoomed,
+or resized.
 """
 # Library Imports.
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QGridLayout, QLabel, QVBoxLayout, QWidget
 from pyqtgraph import PlotWidget, plot
 import pyqtgraph as pg
@@ -19,6 +30,8 @@ import pyqtgraph as pg
 import numpy as np
 
 # Custom Imports.
+from ArraySimulation.Controller.LODPyramid import LODPyramid
+from ArraySimulation.Controller.SeriesBuffer import SeriesBuffer
 from ArraySimulation.Controller.View import View
 
 
@@ -86,6 +99,9 @@ class Graph(View):
                 "list": ["voltage", "current", ..., "temperature"],
             }
             An optional field "size" is supported for scatter graph types. By default, this value is 4.
+            An optional field "maxLength" limits the series to its latest
+            maxLength points, as a rolling window. By default, every point is
+            kept. Rolling windows of line graphs are always drawn in full.
 
 
             The reference defines how the graph should be formatted and provides
@@ -117,6 +133,18 @@ class Graph(View):
         # Reference to the graph for easy modification.
         self._graph = {}
 
+        # Values of each series, with multipliers applied.
+        self._buffers = {}
+
+        # Level of detail pyramid of each line series that is not a rolling
+        # window.
+        self._pyramids = {}
+
+        # Series changed since they were last drawn, and whether a redraw is
+        # scheduled.
+        self._dirty = set()
+        self._redrawPending = False
+
         self.updateUI()
 
     def addPoint(self, series, datapointX, datapointY):
@@ -138,15 +166,10 @@ class Graph(View):
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
         if series in self._series:
-            self._series[series]["data"]["x"].append(datapointX)
-            self._series[series]["data"]["y"].append(
-                datapointY * self._series[series]["multiplier"]
-            )
-
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
+            self._buffers[series].append(
+                datapointX, datapointY * self._series[series]["multiplier"]
             )
+            self._markDirty(series)
 
     def addPoints(self, series, datapointsX, datapointsY):
         """
@@ -158,25 +181,21 @@ class Graph(View):
         series: String
             ID of the series that should exist in self._series where the data
             points should be inserted.
-        datapointX: int, float
-            X value list of datapoints. Can be either floats or integers.
-        datapointY: int, float
-            Y value list of datapoints. Can be either floats or integers.
+        datapointX: list|numpy array
+            X values of the datapoints. Can be either floats or integers.
+        datapointY: list|numpy array
+            Y values of the datapoints. Can be either floats or integers.
 
         Assumptions
         -----------
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
         if series in self._series:
-            self._series[series]["data"]["x"] += datapointsX
             modifier = self._series[series]["multiplier"]
-            modifiedDatapointsY = [datapointY * modifier for datapointY in datapointsY]
-            self._series[series]["data"]["y"] += modifiedDatapointsY
-
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
+            self._buffers[series].extend(
+                datapointsX, np.asarray(datapointsY, dtype=float) * modifier
             )
+            self._markDirty(series)
 
     def addSeries(self, series, seriesDict):
         """
@@ -204,15 +223,12 @@ class Graph(View):
         """
         self._series[series] = seriesDict
         self._series["list"].append(series)
-
-        # Apply multiplier to value.
-        for n, y in enumerate(self._series[series]["data"]["y"]):
-            self._series[series]["data"]["y"][n] *= self._series[series]["multiplier"]
+        self._createBuffer(series)
 
         if self._graphType == "Line":
             self._graph[series] = self.plt.plot(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
+                x=self._buffers[series].getX(),
+                y=self._buffers[series].getY(),
                 pen=pg.mkPen(
                     (
                         self._series[series]["color"][0],
@@ -225,8 +241,8 @@ class Graph(View):
             )
         elif self._graphType == "Scatter":
             self._graph[series] = pg.ScatterPlotItem(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
+                x=self._buffers[series].getX(),
+                y=self._buffers[series].getY(),
                 pen=pg.mkPen(None),
                 brush=pg.mkBrush(
                     self._series[series]["color"][0],
@@ -261,13 +277,10 @@ class Graph(View):
         Datapoints are inserted IN ORDER. We aren't doing any sorting for you.
         """
         if series in self._series:
-            self._series[series]["data"]["x"][idx] = datapointX
-            self._series[series]["data"]["y"][idx] = datapointY
-
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+            self._buffers[series].set(idx, datapointX, datapointY)
+            if series in self._pyramids:
+                self._pyramids[series].reset()
+            self._markDirty(series)
 
     def clearSeries(self, series):
         """
@@ -279,26 +292,113 @@ class Graph(View):
             ID of the series that should be cleared.
         """
         if series in self._series:
-            self._series[series]["data"]["x"].clear()
-            self._series[series]["data"]["y"].clear()
-
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+            self._buffers[series].clear()
+            if series in self._pyramids:
+                self._pyramids[series].reset()
+            self._markDirty(series)
 
     def clearAllSeries(self):
         """
         Erases all data points from all data series.
         """
         for series in self._series["list"]:
-            self._series[series]["data"]["x"].clear()
-            self._series[series]["data"]["y"].clear()
+            self._buffers[series].clear()
+            if series in self._pyramids:
+                self._pyramids[series].reset()
+            self._markDirty(series)
 
-            self._graph[series].setData(
-                x=self._series[series]["data"]["x"],
-                y=self._series[series]["data"]["y"],
-            )
+    def getSeriesData(self, series):
+        """
+        Returns the values of a series, with its multiplier applied.
+
+        Parameters
+        ----------
+        series: String
+            ID of the series.
+
+        Return
+        ------
+        tuple: (x: numpy array, y: numpy array), views valid until the series
+        next changes.
+        """
+        return (self._buffers[series].getX(), self._buffers[series].getY())
+
+    def _createBuffer(self, series):
+        """
+        Moves the initial values of a series into its buffer, applying its
+        multiplier.
+
+        Parameters
+        ----------
+        series: String
+            ID of the series.
+        """
+        seriesDict = self._series[series]
+        self._buffers[series] = SeriesBuffer(maxLength=seriesDict.get("maxLength"))
+        self._buffers[series].extend(
+            seriesDict["data"]["x"],
+            np.asarray(seriesDict["data"]["y"], dtype=float)
+            * seriesDict["multiplier"],
+        )
+        if self._graphType == "Line" and seriesDict.get("maxLength") is None:
+            self._pyramids[series] = LODPyramid()
+            self._markDirty(series)
+
+    def _markDirty(self, series):
+        """
+        Schedules a series to be redrawn once the event loop is next idle.
+
+        Parameters
+        ----------
+        series: String
+            ID of the series.
+        """
+        self._dirty.add(series)
+        if not self._redrawPending:
+            self._redrawPending = True
+            QTimer.singleShot(0, self._redraw)
+
+    def _changeView(self, *args):
+        """
+        Schedules every series with a level of detail to be redrawn for a new
+        view range or size.
+        """
+        for series in self._pyramids:
+            self._markDirty(series)
+
+    def _getView(self):
+        """
+        Returns the visible x range and its width in pixels. While the x axis
+        is auto ranged, the range spans every point, since the visible range
+        follows whatever was last drawn.
+
+        Return
+        ------
+        tuple: (xMin: float, xMax: float, numPixels: int)
+        """
+        viewBox = self.plt.getViewBox()
+        numPixels = max(int(viewBox.width()), 1)
+        if viewBox.autoRangeEnabled()[0]:
+            return (-np.inf, np.inf, numPixels)
+        (xMin, xMax) = viewBox.viewRange()[0]
+        return (xMin, xMax, numPixels)
+
+    def _redraw(self):
+        """
+        Hands the values of every changed series to the plotting backend. Line
+        series are clipped to the view and downsampled to its width.
+        """
+        if self._dirty.intersection(self._pyramids):
+            (xMin, xMax, numPixels) = self._getView()
+        for series in self._dirty:
+            x = self._buffers[series].getX()
+            y = self._buffers[series].getY()
+            if series in self._pyramids:
+                self._pyramids[series].update(x, y)
+                (x, y) = self._pyramids[series].query(x, y, xMin, xMax, numPixels)
+            self._graph[series].setData(x=x, y=y)
+        self._dirty.clear()
+        self._redrawPending = False
 
     def updateUI(self):
         """
@@ -318,13 +418,11 @@ class Graph(View):
             self.plt.setLabel("bottom", self._xAxisLabel)
             self.plt.setLabel("left", self._yAxisLabel)
             self.plt.addLegend()
+            self.plt.sigXRangeChanged.connect(self._changeView)
+            self.plt.getViewBox().sigResized.connect(self._changeView)
 
             for series in self._series["list"]:
-                # Apply multiplier to value.
-                for n, y in enumerate(self._series[series]["data"]["y"]):
-                    self._series[series]["data"]["y"][n] *= self._series[series][
-                        "multiplier"
-                    ]
+                self._createBuffer(series)
 
                 if self._graphType == "Line":
                     # Get pen color.
@@ -333,8 +431,8 @@ class Graph(View):
                         penColor = self.SERIES_COLOR_SET[series]
 
                     self._graph[series] = self.plt.plot(
-                        x=self._series[series]["data"]["x"],
-                        y=self._series[series]["data"]["y"],
+                        x=self._buffers[series].getX(),
+                        y=self._buffers[series].getY(),
                         pen=pg.mkPen(
                             (
                                 self._series[series]["color"][0],
@@ -348,8 +446,8 @@ class Graph(View):
 
                 elif self._graphType == "Scatter":
                     self._graph[series] = pg.ScatterPlotItem(
-                        x=self._series[series]["data"]["x"],
-                        y=self._series[series]["data"]["y"],
+                        x=self._buffers[series].getX(),
+                        y=self._buffers[series].getY(),
                         pen=pg.mkPen(None),
                         brush=pg.mkBrush(
                             self._series[series]["color"][0],
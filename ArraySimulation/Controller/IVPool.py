@@ -0,0 +1,278 @@
+"""
+IVPool.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The IVPool class interns the source IV curves recorded by the
+DataController. Whenever the conditions are steady, the same IV curve is
+produced cycle after cycle; instead of storing a copy per cycle, the pool
+stores each unique curve once, keyed by the quantized irradiance and
+temperature of every module, and the datastore keeps an integer reference to
+it per cycle.
+
+Runs with many unique conditions (i.e. stochastic environments) can still
+produce more curves than we want to hold in memory. The pool keeps at most
+maxCurves curves in memory; when full, the least recently used curve is
+either spilled to a temporary file (and transparently read back when
+requested) or evicted outright, depending on the policy.
+"""
+# Library Imports.
+from collections import OrderedDict
+import numpy as np
+import tempfile
+
+# Custom Imports.
+
+
+class IVPool:
+    """
+    The IVPool class stores unique IV curves, keyed by quantized per module
+    conditions, and hands out integer references to them.
+    """
+
+    # Policies for handling curves beyond maxCurves.
+    POLICIES = ["spill", "evict"]
+
+    def __init__(
+        self,
+        irradianceQuantum=1e-3,
+        temperatureQuantum=1e-3,
+        maxCurves=None,
+        policy="spill",
+    ):
+        """
+        Sets up an empty pool.
+
+        Parameters
+        ----------
+        irradianceQuantum: float
+            Resolution, in W/M^2, to which irradiances are quantized in keys.
+        temperatureQuantum: float
+            Resolution, in C, to which temperatures are quantized in keys.
+        maxCurves: int|None
+            Maximum number of curves kept in memory. If None, the pool is
+            unbounded.
+        policy: String
+            What to do with the least recently used curve when the pool is
+            full. "spill" writes it to a temporary file, "evict" drops it;
+            subsequent lookups of an evicted curve return None.
+        """
+        if policy not in IVPool.POLICIES:
+            raise Exception("Undefined IV pool policy " + policy)
+        if maxCurves is not None and maxCurves < 1:
+            raise Exception("The IV pool must hold at least one curve.")
+
+        self._irradianceQuantum = irradianceQuantum
+        self._temperatureQuantum = temperatureQuantum
+        self._maxCurves = maxCurves
+        self._policy = policy
+
+        # The voltage axis shared by every curve.
+        self._voltages = None
+
+        # Mapping of quantized conditions to curve references.
+        self._refs = {}
+
+        # Curves held in memory, ordered from least to most recently used.
+        self._curves = OrderedDict()
+
+        # Byte offsets of curves spilled to the spill file.
+        self._spilled = {}
+        self._spillFile = None
+
+        # Number of curves handed out so far. References are sequential.
+        self._numCurves = 0
+
+    def getKey(self, irradiance, temperature):
+        """
+        Quantizes the conditions of every module into a hashable key.
+
+        Parameters
+        ----------
+        irradiance: List of floats
+            Irradiance of each module.
+        temperature: List of floats
+            Temperature of each module.
+
+        Return
+        ------
+        tuple: The key.
+        """
+        return tuple(
+            np.round(np.asarray(irradiance) / self._irradianceQuantum)
+            .astype(np.int64)
+            .tolist()
+        ) + tuple(
+            np.round(np.asarray(temperature) / self._temperatureQuantum)
+            .astype(np.int64)
+            .tolist()
+        )
+
+    def getRef(self, key):
+        """
+        Returns the reference of the curve stored for a key.
+
+        Parameters
+        ----------
+        key: tuple
+            Key from getKey.
+
+        Return
+        ------
+        int|None: The reference, or None if no curve is stored for the key.
+        """
+        return self._refs.get(key)
+
+    def intern(self, key, voltages, currents):
+        """
+        Stores a curve for a key if none is stored yet.
+
+        Parameters
+        ----------
+        key: tuple
+            Key from getKey.
+        voltages: numpy array
+            Voltage axis of the curve. Must match that of every curve in the
+            pool.
+        currents: numpy array
+            Currents of the curve at each voltage.
+
+        Return
+        ------
+        int: Reference to the stored curve.
+        """
+        ref = self._refs.get(key)
+        if ref is not None:
+            return ref
+
+        if self._voltages is None:
+            self._voltages = np.asarray(voltages, dtype=float).copy()
+        elif len(voltages) != len(self._voltages):
+            raise Exception("IV curves in the pool must share a voltage axis.")
+
+        ref = self._numCurves
+        self._numCurves += 1
+        self._refs[key] = ref
+        self._curves[ref] = np.asarray(currents, dtype=np.float32).copy()
+        self._enforceLimit()
+        return ref
+
+    def getCurve(self, ref):
+        """
+        Returns the currents of a stored curve.
+
+        Parameters
+        ----------
+        ref: int
+            Reference from intern.
+
+        Return
+        ------
+        numpy array|None: The currents at each voltage of getVoltages, or None
+        if the curve was evicted.
+        """
+        if ref in self._curves:
+            self._curves.move_to_end(ref)
+            return self._curves[ref]
+        if ref in self._spilled:
+            self._spillFile.seek(self._spilled[ref])
+            currents = np.fromfile(
+                self._spillFile, dtype=np.float32, count=len(self._voltages)
+            )
+            # Bring the curve back in memory as it is likely to be reused.
+            self._curves[ref] = currents
+            self._enforceLimit()
+            return currents
+        return None
+
+    def getVoltages(self):
+        """
+        Returns the voltage axis shared by the curves.
+
+        Return
+        ------
+        numpy array|None: The voltages, or None if the pool is empty.
+        """
+        return self._voltages
+
+    def getNumCurves(self):
+        """
+        Returns the number of unique curves interned.
+
+        Return
+        ------
+        int: The number of curves, including spilled and evicted curves.
+        """
+        return self._numCurves
+
+    def getNumCurvesInMemory(self):
+        """
+        Returns the number of curves currently held in memory.
+
+        Return
+        ------
+        int: The number of curves.
+        """
+        return len(self._curves)
+
+    def clear(self):
+        """
+        Removes every curve from the pool.
+        """
+        if self._spillFile is not None:
+            self._spillFile.close()
+        self.__init__(
+            self._irradianceQuantum,
+            self._temperatureQuantum,
+            self._maxCurves,
+            self._policy,
+        )
+
+    def __getstate__(self):
+        """
+        Pickles the pool. Spilled curves are read back from the spill file,
+        which cannot be pickled itself.
+        """
+        state = self.__dict__.copy()
+        state["_spilled"] = {}
+        for (ref, offset) in self._spilled.items():
+            self._spillFile.seek(offset)
+            state["_spilled"][ref] = np.fromfile(
+                self._spillFile, dtype=np.float32, count=len(self._voltages)
+            )
+        state["_spillFile"] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Unpickles the pool, spilling the spilled curves to a new spill file.
+        """
+        spilled = state["_spilled"]
+        state["_spilled"] = {}
+        self.__dict__.update(state)
+        for (ref, currents) in spilled.items():
+            if self._spillFile is None:
+                self._spillFile = tempfile.TemporaryFile()
+            self._spillFile.seek(0, 2)
+            self._spilled[ref] = self._spillFile.tell()
+            currents.tofile(self._spillFile)
+
+    def _enforceLimit(self):
+        """
+        Spills or evicts the least recently used curves until the number of
+        curves in memory is within maxCurves.
+        """
+        if self._maxCurves is None:
+            return
+
+        while len(self._curves) > self._maxCurves:
+            (ref, currents) = self._curves.popitem(last=False)
+            if self._policy == "spill" and ref not in self._spilled:
+                if self._spillFile is None:
+                    self._spillFile = tempfile.TemporaryFile()
+                self._spillFile.seek(0, 2)
+                self._spilled[ref] = self._spillFile.tell()
+                currents.tofile(self._spillFile)
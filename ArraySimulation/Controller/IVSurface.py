@@ -0,0 +1,268 @@
+"""
+IVSurface.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The IVSurface class is the response surface of a source over a
+run: the current it outputs at any voltage, on any cycle. It holds the IV
+curve of each distinct condition of the source once, as a row of a 2-D array
+(condition x voltage) over a uniform voltage grid, and the row of each cycle.
+Reading the current at a voltage is then a linear interpolation into the row,
+with no source model evaluation. Past the end of the grid, the source is past
+its open circuit voltage and outputs no current.
+
+Surfaces are built from the IV curves interned in an IVPool by a simulation
+(see fromIVPool), or from the (voltage, current) samples of bench logs (see
+fromSamples).
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class IVSurface:
+    """
+    The IVSurface class stores the IV curve of each distinct condition of a
+    source and the condition of each cycle, and interpolates the source current
+    at any (cycle, voltage).
+    """
+
+    def __init__(self, voltages, currents, index):
+        """
+        Sets up the surface.
+
+        Parameters
+        ----------
+        voltages: numpy array
+            The uniform, increasing voltage grid shared by every curve.
+        currents: numpy array
+            2-D, the current of each curve at each voltage of the grid.
+        index: numpy array
+            The curve of each cycle.
+        """
+        voltages = np.asarray(voltages, dtype=float)
+        steps = np.diff(voltages)
+        if len(voltages) < 2 or not np.allclose(steps, steps[0]) or steps[0] <= 0:
+            raise Exception("IV surfaces require a uniform, increasing voltage grid.")
+
+        self._voltages = voltages
+        self._currents = np.asarray(currents, dtype=np.float32)
+        self._index = np.asarray(index, dtype=np.int64)
+        if self._currents.shape[1] != len(voltages):
+            raise Exception("IV surface curves must match the voltage grid.")
+
+        # Grid parameters for the interpolation.
+        self._start = float(voltages[0])
+        self._step = float(voltages[-1] - voltages[0]) / (len(voltages) - 1)
+        self._last = len(voltages) - 1
+
+    @staticmethod
+    def fromIVPool(pool, refs):
+        """
+        Builds a surface from the IV curves of a simulation.
+
+        Parameters
+        ----------
+        pool: IVPool
+            The pool the curves were interned in.
+        refs: numpy array
+            The reference into the pool of each cycle (i.e. the IVRef column of
+            the datastore).
+
+        Return
+        ------
+        IVSurface: The surface.
+        """
+        refs = np.asarray(refs, dtype=np.int64)
+        if len(refs) == 0 or np.any(refs < 0):
+            raise Exception("Every cycle must refer to an IV curve.")
+
+        # Only the curves referred to are kept, renumbered in order.
+        (unique, index) = np.unique(refs, return_inverse=True)
+        currents = []
+        for ref in unique:
+            curve = pool.getCurve(int(ref))
+            if curve is None:
+                raise Exception("IV curve " + str(ref) + " was evicted from the pool.")
+            currents.append(curve)
+        return IVSurface(pool.getVoltages(), np.array(currents), index)
+
+    @staticmethod
+    def fromSamples(
+        voltages,
+        currents,
+        irradiance,
+        temperature,
+        irradianceQuantum=1.0,
+        temperatureQuantum=0.1,
+        resolution=0.01,
+    ):
+        """
+        Builds a surface from a (voltage, current) sample per cycle, i.e. from
+        bench logs. Cycles are grouped into conditions by quantized irradiance
+        and temperature, and the curve of each condition is interpolated from
+        its samples. Above the highest voltage sampled in a condition, the
+        curve is taken to drop to no current.
+
+        Parameters
+        ----------
+        voltages: numpy array
+            Voltage applied on each cycle (V).
+        currents: numpy array
+            Current measured on each cycle (A).
+        irradiance: numpy array
+            Irradiance on each cycle (G).
+        temperature: numpy array
+            Temperature on each cycle (C).
+        irradianceQuantum: float
+            Resolution, in W/M^2, to which irradiances are grouped.
+        temperatureQuantum: float
+            Resolution, in C, to which temperatures are grouped.
+        resolution: float
+            Step of the voltage grid (V).
+
+        Return
+        ------
+        IVSurface: The surface.
+        """
+        voltages = np.asarray(voltages, dtype=float)
+        currents = np.asarray(currents, dtype=float)
+        keys = np.stack(
+            [
+                np.round(np.asarray(irradiance) / irradianceQuantum),
+                np.round(np.asarray(temperature) / temperatureQuantum),
+            ],
+            axis=1,
+        )
+        (_, index) = np.unique(keys, axis=0, return_inverse=True)
+        index = index.reshape(-1)
+
+        grid = np.arange(0, np.max(voltages) + 2 * resolution, resolution)
+        curves = np.zeros((np.max(index) + 1, len(grid)), dtype=np.float32)
+        for condition in range(len(curves)):
+            samples = index == condition
+            # Repeated voltages are averaged.
+            (sampled, inverse) = np.unique(voltages[samples], return_inverse=True)
+            means = np.bincount(
+                inverse.reshape(-1), weights=currents[samples]
+            ) / np.bincount(inverse.reshape(-1))
+            curves[condition] = np.where(
+                grid > sampled[-1] + resolution / 2,
+                0.0,
+                np.interp(grid, sampled, means),
+            )
+        return IVSurface(grid, curves, index)
+
+    def getNumCycles(self):
+        """
+        Returns the number of cycles of the surface.
+
+        Return
+        ------
+        int: The number of cycles.
+        """
+        return len(self._index)
+
+    def getNumConditions(self):
+        """
+        Returns the number of distinct conditions, and curves, of the surface.
+
+        Return
+        ------
+        int: The number of conditions.
+        """
+        return len(self._currents)
+
+    def getVoltages(self):
+        """
+        Returns the voltage grid of the curves.
+
+        Return
+        ------
+        numpy array: The voltages.
+        """
+        return self._voltages
+
+    def getCurves(self):
+        """
+        Returns the curves of every condition.
+
+        Return
+        ------
+        numpy array: 2-D, the current of each curve at each voltage.
+        """
+        return self._currents
+
+    def getIndex(self):
+        """
+        Returns the curve of each cycle.
+
+        Return
+        ------
+        numpy array: The row of getCurves of each cycle.
+        """
+        return self._index
+
+    def getCurrent(self, cycle, voltage):
+        """
+        Interpolates the source current of a cycle at a voltage.
+
+        Parameters
+        ----------
+        cycle: int
+            The cycle.
+        voltage: float
+            The voltage applied (V).
+
+        Return
+        ------
+        float: The current (A).
+        """
+        curve = self._currents[self._index[cycle]]
+        position = (voltage - self._start) / self._step
+        if position <= 0.0:
+            return float(curve[0])
+        if position >= self._last:
+            return 0.0 if position > self._last else float(curve[self._last])
+        idx = int(position)
+        (lower, upper) = (float(curve[idx]), float(curve[idx + 1]))
+        return lower + (position - idx) * (upper - lower)
+
+    def getCurrents(self, cycles, voltages):
+        """
+        Interpolates the source current at pairs of cycles and voltages.
+
+        Parameters
+        ----------
+        cycles: int|numpy array
+            The cycles, broadcast against voltages.
+        voltages: numpy array
+            The voltages applied (V).
+
+        Return
+        ------
+        numpy array: The currents (A).
+        """
+        voltages = np.asarray(voltages, dtype=float)
+        rows = self._index[cycles]
+        position = np.clip((voltages - self._start) / self._step, 0.0, self._last)
+        idx = np.minimum(position.astype(np.int64), self._last - 1)
+        lower = self._currents[rows, idx]
+        upper = self._currents[rows, idx + 1]
+        currents = lower + (position - idx) * (upper - lower)
+        return np.where(voltages > self._voltages[-1], 0.0, currents)
+
+    def getMaxPowers(self):
+        """
+        Returns the maximum power of the source on each cycle, over the voltage
+        grid.
+
+        Return
+        ------
+        numpy array: The maximum power of each cycle (W).
+        """
+        return np.max(self._currents * self._voltages, axis=1)[self._index]
@@ -0,0 +1,209 @@
+"""
+LODPyramid.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The LODPyramid class downsamples a line series for display, so
+that the cost of drawing it is proportional to the width of the graph in
+pixels instead of the number of points in the series.
+
+Level 0 of the pyramid splits the series into blocks of FACTOR points, and
+keeps the minimum and maximum point of each block. Each following level does
+the same over blocks of FACTOR blocks of the level below. Drawing the minimum
+and maximum of every block, in order, traces the envelope of the series, so
+spikes survive downsampling unlike with plain decimation.
+
+To draw a range of x values, only the points in the range are considered, at
+the coarsest level that still has at least one block per pixel. The pyramid
+is extended incrementally as points are appended to the series. The x values
+of the series must be non-decreasing.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class LODPyramid:
+    """
+    The LODPyramid class keeps min/max envelopes of a series at successively
+    coarser levels of detail.
+    """
+
+    # Number of points, or blocks of the level below, per block.
+    FACTOR = 4
+
+    def __init__(self):
+        """
+        Sets up an empty pyramid.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets every level. The pyramid is rebuilt on the next update, i.e.
+        after points of the series were modified or removed.
+        """
+        # Number of points of the series consumed, and whether their x values
+        # are non-decreasing. Unsorted series are drawn in full.
+        self._numPoints = 0
+        self._sorted = True
+
+        # Per level, the index into the series of the minimum and maximum
+        # point of each complete block.
+        self._levels = []
+
+    def getNumLevels(self):
+        """
+        Returns the number of levels built.
+
+        Return
+        ------
+        int: The number of levels.
+        """
+        return len(self._levels)
+
+    def update(self, x, y):
+        """
+        Extends the pyramid with the points appended to the series since the
+        last update. If the series got shorter, the pyramid is rebuilt.
+
+        Parameters
+        ----------
+        x: numpy array
+            The x values of the whole series.
+        y: numpy array
+            The y values of the whole series.
+        """
+        factor = LODPyramid.FACTOR
+        if len(y) < self._numPoints:
+            self.reset()
+        if self._sorted:
+            self._sorted = bool(np.all(np.diff(x[max(0, self._numPoints - 1) :]) >= 0))
+        self._numPoints = len(y)
+        if not self._sorted:
+            return
+
+        # Each level is built from the complete blocks of the level below, and
+        # only the blocks completed since the last update are reduced. Below
+        # level 0 is the series itself, where each point is its own minimum
+        # and maximum.
+        numBelow = len(y)
+        level = 0
+        while numBelow >= factor:
+            if level == len(self._levels):
+                self._levels.append(
+                    {"min": np.zeros(0, np.int64), "max": np.zeros(0, np.int64)}
+                )
+            blocks = self._levels[level]
+            done = len(blocks["min"])
+            numBlocks = numBelow // factor
+            if numBlocks > done:
+                if level == 0:
+                    minIdx = np.arange(done * factor, numBlocks * factor)
+                    minIdx = minIdx.reshape(-1, factor)
+                    maxIdx = minIdx
+                else:
+                    below = self._levels[level - 1]
+                    minIdx = below["min"][done * factor : numBlocks * factor]
+                    minIdx = minIdx.reshape(-1, factor)
+                    maxIdx = below["max"][done * factor : numBlocks * factor]
+                    maxIdx = maxIdx.reshape(-1, factor)
+                rows = np.arange(numBlocks - done)
+                blocks["min"] = np.concatenate(
+                    (blocks["min"], minIdx[rows, np.argmin(y[minIdx], axis=1)])
+                )
+                blocks["max"] = np.concatenate(
+                    (blocks["max"], maxIdx[rows, np.argmax(y[maxIdx], axis=1)])
+                )
+            numBelow = numBlocks
+            level += 1
+
+    def query(self, x, y, xMin, xMax, numPixels):
+        """
+        Returns the points to draw for a range of x values.
+
+        Parameters
+        ----------
+        x: numpy array
+            The x values of the whole series, as last passed to update.
+        y: numpy array
+            The y values of the whole series, as last passed to update.
+        xMin: float
+            Smallest x value in view.
+        xMax: float
+            Largest x value in view.
+        numPixels: int
+            Width of the view in pixels.
+
+        Return
+        ------
+        tuple: (x: numpy array, y: numpy array) The points to draw, in order.
+        One point on either side of the range is included so lines run to the
+        edges of the view. If the x values are not sorted, every point is
+        returned.
+        """
+        if not self._sorted:
+            return (x, y)
+        start = max(0, int(np.searchsorted(x, xMin, side="left")) - 1)
+        stop = min(len(x), int(np.searchsorted(x, xMax, side="right")) + 1)
+        numPixels = max(1, int(numPixels))
+        if stop - start <= 2 * numPixels or not self._levels:
+            return (x[start:stop], y[start:stop])
+
+        # The coarsest level with at least a block per pixel.
+        blockSize = 1
+        level = -1
+        while (
+            level + 1 < len(self._levels)
+            and (stop - start) // (blockSize * LODPyramid.FACTOR) >= numPixels
+        ):
+            blockSize *= LODPyramid.FACTOR
+            level += 1
+        if level < 0:
+            return (x[start:stop], y[start:stop])
+
+        # The complete blocks within the range, plus the partial blocks at
+        # either end, reduced on the fly, and the points at either end.
+        blocks = self._levels[level]
+        firstBlock = -(-start // blockSize)
+        lastBlock = min(stop // blockSize, len(blocks["min"]))
+        head = np.arange(start, firstBlock * blockSize)
+        tail = np.arange(lastBlock * blockSize, stop)
+        envelope = np.unique(
+            np.concatenate(
+                (
+                    [start, stop - 1],
+                    LODPyramid._getExtrema(y, head),
+                    blocks["min"][firstBlock:lastBlock],
+                    blocks["max"][firstBlock:lastBlock],
+                    LODPyramid._getExtrema(y, tail),
+                )
+            )
+        )
+        return (x[envelope], y[envelope])
+
+    @staticmethod
+    def _getExtrema(y, indices):
+        """
+        Returns the indices of the minimum and maximum point among some points
+        of the series.
+
+        Parameters
+        ----------
+        y: numpy array
+            The y values of the whole series.
+        indices: numpy array
+            Indices of the points, possibly empty.
+
+        Return
+        ------
+        numpy array: The indices of the minimum and maximum, if any.
+        """
+        if len(indices) == 0:
+            return indices
+        values = y[indices]
+        return indices[[np.argmin(values), np.argmax(values)]]
@@ -0,0 +1,367 @@
+"""
+MPPTTrace.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The MPPTTrace class records the stream an MPPT sees, one row per
+cycle:
+
+    (arrVoltage, arrCurrent, irradiance, temperature) -> vRef
+
+along with, optionally, the response surface of the source over the run (see
+IVSurface). Traces are built from a simulation (see
+DataController.getTrace) or from bench logs (see fromCSV), and saved to a
+compact binary file.
+
+A trace can be replayed against any MPPT or BatchMPPT configuration. Open
+loop, the recorded inputs are fed to the MPPT, i.e. to compare its output to
+that of the tracker that was recorded. Closed loop, the MPPT drives the source
+response surface: each cycle, the source current at the reference voltage of
+the last cycle is read from the surface, with no PVSource evaluation. Closed
+loop replay runs at the speed of the MPPT itself; a BatchMPPT replays N
+trackers per step, for millions of tracker steps per second, so tuning loops
+over recorded conditions cost a fraction of a full simulation.
+
+The binary file starts with a single line of JSON,
+
+    {
+        "format": "MPPTTrace",
+        "numRows": int,
+        "numCells": int,
+        "period": float,        <-  Cycle period in seconds.
+        "columns": [[name, dtype], ...],
+        "surface": {"numVoltages": int, "numConditions": int}|null,
+    }
+
+followed by the raw values of each column in order and, if there is a
+surface, its voltage grid (float64), curves (float32, condition major) and
+curve of each row (int32), all little endian.
+"""
+# Library Imports.
+import json
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.Controller.IVSurface import IVSurface
+
+
+class MPPTTrace:
+    """
+    The MPPTTrace class holds the columnar inputs and outputs of an MPPT over
+    a run, and replays them against other MPPT configurations.
+    """
+
+    # Identifier of the file format in the header.
+    FORMAT = "MPPTTrace"
+
+    # The columns of a trace.
+    COLUMNS = ["arrVoltage", "arrCurrent", "irradiance", "temperature", "vRef"]
+
+    def __init__(self, columns, numCells=1, period=1.0, surface=None):
+        """
+        Sets up the trace.
+
+        Parameters
+        ----------
+        columns: dict
+            A numpy array per name of COLUMNS, of the same length.
+        numCells: int
+            Number of cells of the source.
+        period: float
+            Cycle period in seconds.
+        surface: IVSurface|None
+            The response surface of the source over the same cycles, required
+            for closed loop replay.
+        """
+        for name in MPPTTrace.COLUMNS:
+            if name not in columns:
+                raise Exception("The trace is missing the " + name + " column.")
+        self._columns = {
+            name: np.asarray(columns[name], dtype=float) for name in MPPTTrace.COLUMNS
+        }
+        numRows = len(self._columns["vRef"])
+        if any(len(column) != numRows for column in self._columns.values()):
+            raise Exception("The trace columns must be of the same length.")
+        if surface is not None and surface.getNumCycles() != numRows:
+            raise Exception("The surface must cover every row of the trace.")
+
+        self._numCells = numCells
+        self._period = period
+        self._surface = surface
+
+    def __len__(self):
+        return len(self._columns["vRef"])
+
+    @staticmethod
+    def fromCSV(fileName, numCells=1, period=1.0, surface=True):
+        """
+        Reads a trace from a bench log. The log is a CSV file with a header row
+        naming at least the COLUMNS; other columns are ignored.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the log.
+        numCells: int
+            Number of cells of the source.
+        period: float
+            Cycle period in seconds.
+        surface: bool
+            Whether to build the response surface from the samples of the log.
+            See IVSurface.fromSamples.
+
+        Return
+        ------
+        MPPTTrace: The trace.
+        """
+        log = np.genfromtxt(fileName, delimiter=",", names=True, ndmin=1)
+        columns = {name: log[name] for name in MPPTTrace.COLUMNS}
+        IV = None
+        if surface:
+            IV = IVSurface.fromSamples(
+                columns["arrVoltage"],
+                columns["arrCurrent"],
+                columns["irradiance"],
+                columns["temperature"],
+            )
+        return MPPTTrace(columns, numCells, period, IV)
+
+    @staticmethod
+    def load(fileName):
+        """
+        Reads a trace saved by save.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file.
+
+        Return
+        ------
+        MPPTTrace: The trace.
+        """
+        with open(fileName, "rb") as file:
+            header = json.loads(file.readline().decode())
+            data = file.read()
+        if header.get("format") != MPPTTrace.FORMAT:
+            raise Exception(fileName + " is not an MPPT trace file.")
+
+        numRows = header["numRows"]
+        offset = 0
+
+        def read(dtype, count):
+            nonlocal offset
+            values = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+            offset += values.nbytes
+            return values
+
+        columns = {name: read(dtype, numRows) for (name, dtype) in header["columns"]}
+        surface = None
+        if header["surface"] is not None:
+            (numVoltages, numConditions) = (
+                header["surface"]["numVoltages"],
+                header["surface"]["numConditions"],
+            )
+            voltages = read("<f8", numVoltages)
+            curves = read("<f4", numVoltages * numConditions)
+            index = read("<i4", numRows)
+            surface = IVSurface(
+                voltages, curves.reshape(numConditions, numVoltages), index
+            )
+        return MPPTTrace(columns, header["numCells"], header["period"], surface)
+
+    def save(self, fileName):
+        """
+        Writes the trace to a compact binary file.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file.
+        """
+        surface = self._surface
+        header = {
+            "format": MPPTTrace.FORMAT,
+            "numRows": len(self),
+            "numCells": self._numCells,
+            "period": self._period,
+            "columns": [[name, "<f8"] for name in MPPTTrace.COLUMNS],
+            "surface": None,
+        }
+        blocks = [
+            self._columns[name].astype("<f8").tobytes() for name in MPPTTrace.COLUMNS
+        ]
+        if surface is not None:
+            header["surface"] = {
+                "numVoltages": len(surface.getVoltages()),
+                "numConditions": surface.getNumConditions(),
+            }
+            blocks += [
+                surface.getVoltages().astype("<f8").tobytes(),
+                surface.getCurves().astype("<f4").tobytes(),
+                surface.getIndex().astype("<i4").tobytes(),
+            ]
+        with open(fileName, "wb") as file:
+            file.write((json.dumps(header) + "\n").encode())
+            file.write(b"".join(blocks))
+
+    def getColumns(self):
+        """
+        Returns the columns of the trace.
+
+        Return
+        ------
+        dict: A numpy array per name of COLUMNS.
+        """
+        return self._columns
+
+    def getNumCells(self):
+        """
+        Returns the number of cells of the source.
+
+        Return
+        ------
+        int: The number of cells.
+        """
+        return self._numCells
+
+    def getPeriod(self):
+        """
+        Returns the cycle period of the trace.
+
+        Return
+        ------
+        float: The period in seconds.
+        """
+        return self._period
+
+    def getSurface(self):
+        """
+        Returns the response surface of the source.
+
+        Return
+        ------
+        IVSurface|None: The surface, or None if it was not recorded.
+        """
+        return self._surface
+
+    def replay(self, model, closedLoop=True):
+        """
+        Replays the trace against an MPPT configuration, from its current
+        state. The model should be set up with getNumCells cells and reset.
+
+        Parameters
+        ----------
+        model: MPPT|BatchMPPT
+            The MPPT to replay. A BatchMPPT replays each of its trackers.
+        closedLoop: bool
+            Whether the model drives the response surface, starting at the
+            voltage of the first row, or is fed the recorded inputs.
+
+        Return
+        ------
+        dict: {
+            "arrVoltage": numpy array,  # Voltage applied (V)
+            "arrCurrent": numpy array,  # Source current at it (A)
+            "vRef": numpy array,        # Reference voltage output (V)
+            "outputPower": numpy array, # Power at the reference (W)
+            "energy": (actual, theoretical) # (J)
+        }
+        Columns have a row per cycle, and for a BatchMPPT a column per tracker.
+        The power and energy are those of DataController, and are only
+        returned if the trace has a surface.
+        """
+        surface = self._surface
+        if closedLoop and surface is None:
+            raise Exception("Closed loop replay requires a response surface.")
+
+        if hasattr(model, "getReferenceVoltages"):
+            result = self._replayBatch(model, closedLoop)
+        else:
+            result = self._replayScalar(model, closedLoop)
+
+        if surface is not None:
+            cycles = np.arange(len(self))
+            if result["vRef"].ndim == 2:
+                cycles = cycles[:, np.newaxis]
+            result["outputPower"] = result["vRef"] * surface.getCurrents(
+                cycles, result["vRef"]
+            )
+            actual = np.sum(result["outputPower"], axis=0) * self._period
+            if actual.ndim == 0:
+                actual = float(actual)
+            result["energy"] = (
+                actual,
+                float(np.sum(surface.getMaxPowers())) * self._period,
+            )
+        return result
+
+    def _replayScalar(self, model, closedLoop):
+        """
+        Replays the trace against an MPPT. See replay.
+        """
+        numRows = len(self)
+        columns = self._columns
+        irradiance = columns["irradiance"].tolist()
+        temperature = columns["temperature"].tolist()
+        vRefs = [0.0] * numRows
+
+        if closedLoop:
+            getCurrent = self._surface.getCurrent
+            voltages = [0.0] * numRows
+            currents = [0.0] * numRows
+            voltage = float(columns["arrVoltage"][0])
+            for cycle in range(numRows):
+                current = getCurrent(cycle, voltage)
+                (voltages[cycle], currents[cycle]) = (voltage, current)
+                voltage = model.getReferenceVoltage(
+                    voltage, current, irradiance[cycle], temperature[cycle]
+                )
+                vRefs[cycle] = voltage
+        else:
+            voltages = columns["arrVoltage"].tolist()
+            currents = columns["arrCurrent"].tolist()
+            for cycle in range(numRows):
+                vRefs[cycle] = model.getReferenceVoltage(
+                    voltages[cycle],
+                    currents[cycle],
+                    irradiance[cycle],
+                    temperature[cycle],
+                )
+
+        return {
+            "arrVoltage": np.array(voltages),
+            "arrCurrent": np.array(currents),
+            "vRef": np.array(vRefs),
+        }
+
+    def _replayBatch(self, model, closedLoop):
+        """
+        Replays the trace against every tracker of a BatchMPPT. See replay.
+        """
+        (numRows, numTrackers) = (len(self), model.getNumTrackers())
+        columns = self._columns
+        voltages = np.zeros((numRows, numTrackers))
+        currents = np.zeros((numRows, numTrackers))
+        vRefs = np.zeros((numRows, numTrackers))
+
+        voltage = np.full(numTrackers, columns["arrVoltage"][0])
+        for cycle in range(numRows):
+            if closedLoop:
+                current = self._surface.getCurrents(cycle, voltage)
+            else:
+                voltage = np.full(numTrackers, columns["arrVoltage"][cycle])
+                current = np.full(numTrackers, columns["arrCurrent"][cycle])
+            (voltages[cycle], currents[cycle]) = (voltage, current)
+            voltage = model.getReferenceVoltages(
+                voltage,
+                current,
+                np.full(numTrackers, columns["irradiance"][cycle]),
+                np.full(numTrackers, columns["temperature"][cycle]),
+            )
+            vRefs[cycle] = voltage
+
+        return {"arrVoltage": voltages, "arrCurrent": currents, "vRef": vRefs}
@@ -4,7 +4,7 @@ MPPTView.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/17/20
-Last Modified: 03/06/21
+Last Modified: 10/19/26
 
 Description: The MPPTView class represents a visual tab of the Display class
 (and the PVSim application window). It displays a simulation of the MPPT
@@ -12,6 +12,10 @@ algorithm output versus the source model, allowing users to see the decision
 making and efficiency of the algorithms in real time under different
 environmental conditions.
 
+The simulation runs in a background SimulationWorker at the selected speed,
+independently of the frame rate. Every frame, the entries it has produced
+since the last frame are drawn at once.
+
 It shows the following IV-PV Curve graphs:
   - PVSource characteristics over time, plotting voltage, current, power,
     irradiance, and temperature
@@ -23,6 +27,10 @@ It shows the following IV-PV Curve graphs:
     - % Cycles above 5% difference over time
     - % Tracking efficiency of total possible power generated versus predicted
       power generated
+
+The timeline of the simulation can be scrubbed with the seek slider. Seeking
+moves the pipeline to the selected cycle (see DataController.seekCycle),
+redraws the history up to it, and resumes playback from there.
 """
 # Library Imports.
 from PyQt5.QtCore import QTimer
@@ -43,6 +51,9 @@ import sys
 from ArraySimulation.Controller.Console import Console
 from ArraySimulation.Controller.View import View
 from ArraySimulation.Controller.Graph import Graph
+from ArraySimulation.Controller.Metrics import Metrics
+from ArraySimulation.Controller.RingBuffer import RingBuffer
+from ArraySimulation.Controller.SimulationWorker import SimulationWorker
 
 
 class MPPTView(View):
@@ -58,14 +69,33 @@ class MPPTView(View):
     MODELS = ["Ideal", "Nonideal"]
 
     # List of Global MPPT algorithms that can be used.
-    MPPT_GLOBAL_MODELS = ["Voltage Sweep"]
+    MPPT_GLOBAL_MODELS = ["Voltage Sweep", "Particle Swarm", "Model Predictive"]
 
     # List of Local MPPT algorithms that can be used.
-    MPPT_LOCAL_MODELS = ["PandO", "IC", "FC", "Ternary", "Golden", "Bisection"]
+    MPPT_LOCAL_MODELS = [
+        "PandO",
+        "IC",
+        "FC",
+        "Ternary",
+        "Golden",
+        "Bisection",
+        "Newton",
+        "BFGS",
+    ]
 
     # List of MPPT stride algorithms that can be used.
     MPPT_STRIDE_MODELS = ["Fixed", "Adaptive", "Bisection", "Optimal"]
 
+    # Number of cycles between pipeline snapshots. Seeking backwards replays
+    # at most this many cycles.
+    SNAPSHOT_INTERVAL = 1000
+
+    # Simulation speeds that can be used, in simulated seconds per second.
+    SPEEDS = {"Max": None, "Real Time": 1, "10x": 10, "100x": 100, "1000x": 1000}
+
+    # Maximum number of entries the simulation can run ahead of the display.
+    BUFFER_SIZE = 65536
+
     def __init__(self, dataController, framerate):
         """
         Upon initialization, we perform any data and UI setup required to get
@@ -251,6 +281,20 @@ class MPPTView(View):
             (1, 2)
         )
 
+        self._console.addSlider(
+            "SeekSlider", (1, 2), (1, 4), (0, 0), self._seekMPPTAlgorithm
+        )
+        self._console.getReference("SeekSlider").sliderReleased.connect(
+            lambda: self._seekMPPTAlgorithm(
+                self._console.getReference("SeekSlider").value()
+            )
+        )
+        self._console.addLabel("SeekLbl", (1, 6), (1, 1), "Cycle 0")
+
+        self._console.addComboBox(
+            "SpeedSelection", (0, 7), (1, 1), list(MPPTView.SPEEDS), self._changeSpeed
+        )
+
         self._console.addComboBox("ModelSelection", (0, 2), (1, 1), MPPTView.MODELS)
         self._console.addComboBox(
             "GlobalMPPTAlgorithmSelection", (0, 3), (1, 1), MPPTView.MPPT_GLOBAL_MODELS
@@ -295,6 +339,7 @@ class MPPTView(View):
         """
         This callback executes the MPPT algorithm for the selected parameters.
         """
+        self._stopWorker()
         self._clearGraphs()
 
         # Get options from combo boxes and textboxes.
@@ -320,6 +365,7 @@ class MPPTView(View):
 
         if not errors:
             controller = self._datastoreParent
+            controller.setupSnapshots(MPPTView.SNAPSHOT_INTERVAL)
             controller.resetPipeline(
                 # TODO: case for tuple.
                 sourceModel,
@@ -328,25 +374,31 @@ class MPPTView(View):
                 MPPTGlobalAlgo,
                 MPPTLocalAlgo,
                 MPPTStrideAlgo,
+                storeIV=True,
             )
-            (cycleResults, continueBool) = controller.iteratePipelineCycleMPPT()
 
             powerStore = {  # TODO: maybe change naming later? Or never...
                 "actualPower": 0,  # Current Cycle Actual Power
                 "theoreticalPower": 0,  # Current Cycle Theoretical Power
-                "cycleData": [0, 0],  # [Num cycles below threshold, Total cycles]
-                "energyData": [0, 0],  # [Total Energy Generated, Total Theoretical Energy]
+                "metrics": Metrics(),  # Running efficiency metrics.
             }
 
             self.pipelineData = {
-                "continueBool": continueBool,
-                "executionIdx": 0,
-                "cycleResults": cycleResults,
+                "continueBool": True,
+                "executionIdx": 0,  # Number of entries displayed.
+                "cycleResults": controller.datastore,
                 "powerStore": powerStore,
             }
 
-            # Execute a timer thread for the duration of the generating the MPPT
-            # algorithm graphs.
+            slider = self._console.getReference("SeekSlider")
+            slider.blockSignals(True)
+            slider.setRange(0, maxCycleRes[1])
+            slider.setValue(0)
+            slider.blockSignals(False)
+
+            # Run the pipeline in the background, and display whatever it has
+            # produced once per frame.
+            self._startWorker()
             self.timer = QTimer()
             self.timer.timeout.connect(self._executeMPPTAlgorithmHelper)
             self.timer.start(self._SECOND / self._framerate)
@@ -357,224 +409,307 @@ class MPPTView(View):
 
     def _executeMPPTAlgorithmHelper(self):
         """
-        This helper function is executed by a QTimer when enabled by
-        _executeMPPTAlgorithm. It calculates results returned by the pipeline
-        and displays it on the relevant graphs.
+        This helper function is executed by a QTimer once per frame when
+        enabled by _executeMPPTAlgorithm. It drains the entries published by
+        the simulation worker since the last frame and displays them on the
+        relevant graphs at once.
         """
-        controller = self._datastoreParent
-        idx = self.pipelineData["executionIdx"]
-        cycleResults = self.pipelineData["cycleResults"]
-        powerStore = self.pipelineData["powerStore"]
+        rows = self._buffer.drain()
+        if len(rows) > 0:
+            # Rows are published in order, so the new entries are contiguous.
+            self._plotEntries(self.pipelineData["executionIdx"], int(rows[-1]) + 1)
+
+            # Track the displayed cycle on the seek slider.
+            cycleResults = self.pipelineData["cycleResults"]
+            cycle = int(cycleResults["cycle"][self.pipelineData["executionIdx"] - 1])
+            slider = self._console.getReference("SeekSlider")
+            if not slider.isSliderDown():
+                slider.blockSignals(True)
+                slider.setValue(cycle)
+                slider.blockSignals(False)
+                self._console.getReference("SeekLbl").setText("Cycle " + str(cycle))
+
+        if not self._worker.is_alive() and self._buffer.getSize() == 0:
+            self.timer.stop()
+            self.pipelineData["continueBool"] = self._worker.continueBool
+            if self._worker.error is not None:
+                self._console.getReference("StatusLbl").setText(
+                    "Error: " + str(self._worker.error)
+                )
+            else:
+                self._console.getReference("StatusLbl").setText("Success.")
+
+    def _startWorker(self):
+        """
+        Starts a simulation worker iterating the pipeline from its current
+        cycle, at the selected speed.
+        """
+        self._buffer = RingBuffer(MPPTView.BUFFER_SIZE)
+        self._worker = SimulationWorker(
+            self._datastoreParent, self._buffer, self._getSpeed()
+        )
+        self._worker.start()
+
+    def _stopWorker(self):
+        """
+        Stops the simulation worker, if any, and the display timer. Entries not
+        yet displayed are discarded.
+        """
+        if getattr(self, "timer", None) is not None:
+            self.timer.stop()
+        if getattr(self, "_worker", None) is not None:
+            self._worker.stop()
+            self._buffer.drain()
 
-        # Update derived data structures
-        VREF = round(
-            cycleResults["mpptOutput"][idx], 2
-        )  # TODO: I don't think we should be doing rounding here. Do it in GlobalMPPT and PVSource instead.
-        IVList = cycleResults["sourceOutput"][idx]["IV"]
+    def _getSpeed(self):
+        """
+        Returns the simulation speed selected.
 
-        MPPTCurrOut = [curr for (volt, curr) in IVList if round(volt, 2) == VREF]
+        Return
+        ------
+        float|None: Simulated seconds per second, or None for as fast as
+        possible.
+        """
+        speed = self._console.getReference("SpeedSelection").currentText()
+        return MPPTView.SPEEDS[speed]
+
+    def _changeSpeed(self):
+        """
+        This callback applies the selected simulation speed to the running
+        simulation.
+        """
+        if getattr(self, "_worker", None) is not None:
+            self._worker.setSpeed(self._getSpeed())
+
+    def _seekMPPTAlgorithm(self, cycle):
+        """
+        This callback seeks the running MPPT simulation to the cycle selected
+        on the seek slider. While the slider is being dragged, only the label
+        is updated; the seek happens once it is released.
+
+        Parameters
+        ----------
+        cycle: int
+            The cycle to seek to.
+        """
+        self._console.getReference("SeekLbl").setText("Cycle " + str(cycle))
+        if self._console.getReference("SeekSlider").isSliderDown():
+            return
+        if not hasattr(self, "pipelineData"):
+            return
+
+        # The pipeline can only be touched once the worker has stopped.
+        self._stopWorker()
+        controller = self._datastoreParent
+        (cycleResults, continueBool) = controller.seekCycle(cycle)
 
-        # Percent Yield
-        powerStore["actualPower"] = VREF * MPPTCurrOut[0]
-        powerStore["theoreticalPower"] = (
-            cycleResults["sourceOutput"][idx]["edge"][2][0]
-            * cycleResults["sourceOutput"][idx]["edge"][2][1]
-        )
-        percentYield = powerStore["actualPower"] / powerStore["theoreticalPower"]
-
-        # Cycles below threshold
-        if percentYield < 0.95:
-            powerStore["cycleData"][0] += 1
-        powerStore["cycleData"][1] += 1
-        percentThreshold = powerStore["cycleData"][0] / powerStore["cycleData"][1]
-
-        # Tracking efficiency
-        powerStore["energyData"][0] += powerStore["actualPower"]
-        powerStore["energyData"][1] += powerStore["theoreticalPower"]
-        trackingEff = powerStore["energyData"][0] / powerStore["energyData"][1]
-
-        # Update the MPPTView UI by plotting graphs.
-        self._plotSourceCharacteristics()
-        self._plotMPPTCharacteristics(MPPTCurrOut)
-        self._plotVRefPosition(IVList, VREF, MPPTCurrOut)
-        self._plotPowerComparison(MPPTCurrOut)
-        self._plotEfficiencyMetrics(percentYield, percentThreshold, trackingEff)
-
-        # Reiterate the pipeline and store results for next run.
-        (cycleResults, continueBool) = controller.iteratePipelineCycleMPPT()
         self.pipelineData["continueBool"] = continueBool
-        self.pipelineData["executionIdx"] += 1
         self.pipelineData["cycleResults"] = cycleResults
-        self.pipelineData["powerStore"] = powerStore
+        self._plotHistory(cycleResults["numEntries"])
 
-        if not self.pipelineData["continueBool"]:
-            self.timer.timeout.disconnect()
+        # Resume playback from the seeked cycle.
+        self._console.getReference("StatusLbl").setText("")
+        if continueBool:
+            self._startWorker()
+            self.timer.start(self._SECOND / self._framerate)
+        else:
             self._console.getReference("StatusLbl").setText("Success.")
 
-    def _plotSourceCharacteristics(self):
+    def _plotHistory(self, numEntries):
         """
-        Plots the source characteristics and environmental characteristics of
-        the PV system. One point at a time.
+        Redraws the graphs with the first numEntries entries of the datastore.
 
-        Utilizes the self.pipelineData object for primary data.
+        Parameters
+        ----------
+        numEntries: int
+            Number of entries to draw.
         """
-        idx = self.pipelineData["executionIdx"]
-        cycleResults = self.pipelineData["cycleResults"]
+        self._clearGraphs()
+        self.pipelineData["executionIdx"] = 0
+        self.pipelineData["powerStore"]["metrics"].reset()
+        self._plotEntries(0, numEntries)
 
-        # Plot Source Characteristics.
-        self._datastore["SourceChars"].addPoint(
-            "voltage",
-            cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][0],
-        )
+    def _plotEntries(self, start, stop):
+        """
+        Appends a range of entries of the datastore to the graphs, with a
+        single redraw per series, and advances the running efficiency metrics.
 
-        self._datastore["SourceChars"].addPoint(
-            "current",
-            cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][1],
-        )
+        Utilizes the self.pipelineData object for primary data.
 
-        self._datastore["SourceChars"].addPoint(
-            "power",
-            cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][0]
-            * cycleResults["sourceOutput"][idx]["edge"][2][1],
-        )
+        Parameters
+        ----------
+        start: int
+            Index of the first entry to draw.
+        stop: int
+            Index after the last entry to draw.
+        """
+        if stop <= start:
+            return
 
-        self._datastore["SourceChars"].addPoint(
-            "irradiance",
-            cycleResults["cycle"][idx],
-            cycleResults["sourceDef"][idx]["0"]["irradiance"],
+        cycleResults = self.pipelineData["cycleResults"]
+        entries = slice(start, stop)
+        cycles = cycleResults["cycle"][entries]
+        vMPP = cycleResults["vMPP"][entries]
+        iMPP = cycleResults["iMPP"][entries]
+        vRef = cycleResults["mpptOutput"][entries]
+        MPPTPower = cycleResults["outputPower"][entries]
+        MPPTCurrent = np.divide(
+            MPPTPower, vRef, out=np.zeros(len(vRef)), where=vRef != 0
         )
+        maxPower = vMPP * iMPP
 
-        self._datastore["SourceChars"].addPoint(
-            "temperature",
-            cycleResults["cycle"][idx],
-            cycleResults["sourceDef"][idx]["0"]["temperature"],
+        self._plotSourceCharacteristics(cycles, vMPP, iMPP, maxPower, entries)
+        self._plotMPPTCharacteristics(cycles, vRef, MPPTCurrent, MPPTPower)
+        self._plotPowerComparison(cycles, maxPower, MPPTPower)
+        self._plotVRefPosition(stop - 1)
+
+        # Running efficiency metrics, continued from the entries already drawn.
+        powerStore = self.pipelineData["powerStore"]
+        powerStore["actualPower"] = float(MPPTPower[-1])
+        powerStore["theoreticalPower"] = float(maxPower[-1])
+        metrics = powerStore["metrics"].update(MPPTPower, maxPower)
+
+        self._plotEfficiencyMetrics(
+            np.arange(start, stop),
+            metrics["percentYield"],
+            metrics["fractionBelowThreshold"],
+            metrics["trackingEff"],
         )
 
-    def _plotMPPTCharacteristics(self, MPPTCurrOut):
-        """
-        Plots the MPPT characteristics of the PV system. One point at a time.
+        self.pipelineData["executionIdx"] = stop
 
-        Utilizes the self.pipelineData object for primary data.
+    def _plotSourceCharacteristics(self, cycles, vMPP, iMPP, maxPower, entries):
+        """
+        Plots the source characteristics and environmental characteristics of
+        the PV system for a range of entries.
 
         Parameters
         ----------
-        MPPTCurrOut: [int]
-            Single element list that contains the MPPT current at the given voltage.
+        cycles: numpy array
+            Cycle of each entry.
+        vMPP: numpy array
+            Maximum power point voltage of each entry.
+        iMPP: numpy array
+            Maximum power point current of each entry.
+        maxPower: numpy array
+            Maximum power point power of each entry.
+        entries: slice
+            Rows of the entries in the datastore.
         """
-        idx = self.pipelineData["executionIdx"]
         cycleResults = self.pipelineData["cycleResults"]
 
-        # Plot MPPT Characteristics.
-        self._datastore["MPPTChars"].addPoint(
-            "voltage", cycleResults["cycle"][idx], cycleResults["mpptOutput"][idx]
+        # Plot Source Characteristics.
+        self._datastore["SourceChars"].addPoints("voltage", cycles, vMPP)
+        self._datastore["SourceChars"].addPoints("current", cycles, iMPP)
+        self._datastore["SourceChars"].addPoints("power", cycles, maxPower)
+        self._datastore["SourceChars"].addPoints(
+            "irradiance", cycles, cycleResults["irradiance"][entries, 0]
         )
-
-        self._datastore["MPPTChars"].addPoint(
-            "current", cycleResults["cycle"][idx], MPPTCurrOut[0]
+        self._datastore["SourceChars"].addPoints(
+            "temperature", cycles, cycleResults["temperature"][entries, 0]
         )
 
-        self._datastore["MPPTChars"].addPoint(
-            "power",
-            cycleResults["cycle"][idx],
-            cycleResults["mpptOutput"][idx] * MPPTCurrOut[0],
-        )
+    def _plotMPPTCharacteristics(self, cycles, vRef, MPPTCurrent, MPPTPower):
+        """
+        Plots the MPPT characteristics of the PV system for a range of entries.
 
-    def _plotVRefPosition(self, IVList, VREF, MPPTCurrOut):
+        Parameters
+        ----------
+        cycles: numpy array
+            Cycle of each entry.
+        vRef: numpy array
+            MPPT reference voltage of each entry.
+        MPPTCurrent: numpy array
+            Source current at the reference voltage of each entry.
+        MPPTPower: numpy array
+            Source power at the reference voltage of each entry.
+        """
+        # Plot MPPT Characteristics.
+        self._datastore["MPPTChars"].addPoints("voltage", cycles, vRef)
+        self._datastore["MPPTChars"].addPoints("current", cycles, MPPTCurrent)
+        self._datastore["MPPTChars"].addPoints("power", cycles, MPPTPower)
+
+    def _plotVRefPosition(self, idx):
         """
-        Plots the reference voltage position relative to the IV and PV curves.
+        Plots the reference voltage position relative to the IV and PV curves
+        of an entry.
 
         Parameters
         ----------
-        IVList: [(double, double), ..]
-            List of voltage current tuples across the IV Curve for the current
-            source conditions.
-        VREF: double
-            Reference voltage output of the MPPT at the end of the given cycle.
-        MPPTCurrOut: [double]
-            Single element list that contains the MPPT current at the given voltage.
+        idx: int
+            Index of the entry in the datastore.
         """
+        cycleResults = self.pipelineData["cycleResults"]
+        IVPool = cycleResults["IVPool"]
+        voltages = IVPool.getVoltages()
+        currents = IVPool.getCurve(cycleResults["IVRef"][idx])
+
         # Plot VRefPosition.
         self._datastore["VRefPosition"].clearSeries("voltage")
         self._datastore["VRefPosition"].clearSeries("power")
 
-        voltageList = [entry[0] for entry in IVList]
-        currentList = [entry[1] for entry in IVList]
-        powerList = [entry[0] * entry[1] for entry in IVList]
-
-        self._datastore["VRefPosition"].addPoints("voltage", voltageList, currentList)
-        self._datastore["VRefPosition"].addPoints("power", voltageList, powerList)
+        self._datastore["VRefPosition"].addPoints("voltage", voltages, currents)
+        self._datastore["VRefPosition"].addPoints(
+            "power", voltages, voltages * currents
+        )
 
         self._datastore["VRefPosition"].clearSeries("MPPTVREF")
 
-        idx = self.pipelineData["executionIdx"]
-        cycleResults = self.pipelineData["cycleResults"]
-        vMax = cycleResults["sourceOutput"][idx]["edge"][2][0]
-        iMax = cycleResults["sourceOutput"][idx]["edge"][2][1]
+        VREF = cycleResults["mpptOutput"][idx]
+        MPPTCurrOut = float(np.interp(VREF, voltages, currents))
+        vMax = cycleResults["vMPP"][idx]
+        iMax = cycleResults["iMPP"][idx]
         self._datastore["VRefPosition"].addPoints(
             "MPPTVREF",
             [VREF, VREF, vMax, vMax],
-            [MPPTCurrOut[0], VREF * MPPTCurrOut[0], iMax, vMax * iMax]
+            [MPPTCurrOut, VREF * MPPTCurrOut, iMax, vMax * iMax]
         )
 
-    def _plotPowerComparison(self, MPPTCurrOut):
+    def _plotPowerComparison(self, cycles, maxPower, MPPTPower):
         """
-        Plots the theoretical power versus the MPPT output power.
-
-        Utilizes the self.pipelineData object for primary data.
+        Plots the theoretical power versus the MPPT output power for a range
+        of entries.
 
         Parameters
         ----------
-        MPPTCurrOut: [int]
-            Single element list that contains the MPPT current at the given voltage.
+        cycles: numpy array
+            Cycle of each entry.
+        maxPower: numpy array
+            Maximum power point power of each entry.
+        MPPTPower: numpy array
+            Source power at the reference voltage of each entry.
         """
-
-        idx = self.pipelineData["executionIdx"]
-        cycleResults = self.pipelineData["cycleResults"]
-
         # Plot Power Comparison.
-        self._datastore["PowerComp"].addPoint(
-            "power",
-            cycleResults["cycle"][idx],
-            cycleResults["sourceOutput"][idx]["edge"][2][0]
-            * cycleResults["sourceOutput"][idx]["edge"][2][1],
-        )
+        self._datastore["PowerComp"].addPoints("power", cycles, maxPower)
+        self._datastore["PowerComp"].addPoints("MPPTPower", cycles, MPPTPower)
 
-        self._datastore["PowerComp"].addPoint(
-            "MPPTPower",
-            cycleResults["cycle"][idx],
-            cycleResults["mpptOutput"][idx] * MPPTCurrOut[0],
-        )
-
-    def _plotEfficiencyMetrics(self, percentYield, percentThreshold, trackingEff):
+    def _plotEfficiencyMetrics(
+        self, indices, percentYield, percentThreshold, trackingEff
+    ):
         """
-        Plots the efficiency metrics of the MPPT over time.
-
-        Utilizes the self.pipelineData object for primary data.
+        Plots the efficiency metrics of the MPPT over time for a range of
+        entries.
 
         Parameters
         ----------
-        percentYield: double
-            Percentage yield of the current cycle theoretical versus
-            experimental power.
-        percentThreshold: double
-            Percentage of all cycles above a quantified efficiency threshold.
-        trackingEff: double
-            Overall tracking efficiency in terms of theoretical versus
-            experimental energy generated.
+        indices: numpy array
+            Index of each entry.
+        percentYield: numpy array
+            Percentage yield of the theoretical versus experimental power of
+            each entry.
+        percentThreshold: numpy array
+            Percentage of all cycles up to each entry below a quantified
+            efficiency threshold.
+        trackingEff: numpy array
+            Overall tracking efficiency up to each entry in terms of
+            theoretical versus experimental energy generated.
         """
-        idx = self.pipelineData["executionIdx"]
-
         # Plot Efficiencies.
-        self._datastore["Efficiency"].addPoint(
-            "percentYield",
-            idx,
-            percentYield,
+        self._datastore["Efficiency"].addPoints("percentYield", indices, percentYield)
+        self._datastore["Efficiency"].addPoints(
+            "cyclesThreshold", indices, percentThreshold
         )
-        self._datastore["Efficiency"].addPoint("cyclesThreshold", idx, percentThreshold)
-        self._datastore["Efficiency"].addPoint("trackingEff", idx, trackingEff)
+        self._datastore["Efficiency"].addPoints("trackingEff", indices, trackingEff)
 
     def _validate(self, _type, value):
         """
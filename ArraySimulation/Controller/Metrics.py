@@ -0,0 +1,265 @@
+"""
+Metrics.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The Metrics class computes the tracking performance of an MPPT
+run from the columnar arrays of the DataController datastore. Every metric is
+computed with numpy over whole columns, so the UI, headless runs and sweeps
+report the same numbers for the same run.
+
+The metrics are:
+    - percentYield: the power extracted at the MPPT reference voltage over the
+      power available at the maximum power point, per cycle.
+    - cyclesBelowThreshold: the number of cycles where percentYield is below
+      THRESHOLD. Cycles with no power available are not counted.
+    - energy, theoreticalEnergy: the energy extracted at the reference voltage
+      and the energy available at the maximum power point (J).
+    - trackingEff: energy / theoreticalEnergy.
+    - settlingTime: the time from each environment step (a change in the
+      irradiance or temperature of any module, and the start of the run)
+      until the MPPT extracts at least THRESHOLD of the available power for
+      the rest of the step.
+    - oscillation: the amplitude (half the peak to peak) of the reference
+      voltage once settled, per step.
+
+Streaming displays accumulate the running metrics block by block with update.
+A whole run is summarized in one pass with getRunMetrics.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class Metrics:
+    """
+    The Metrics class accumulates the running tracking metrics of an MPPT run,
+    and summarizes the tracking metrics of a whole run.
+    """
+
+    # Fraction of the maximum power point power under which a cycle is
+    # considered to be poorly tracked.
+    THRESHOLD = 0.95
+
+    def __init__(self, period=1.0, threshold=THRESHOLD):
+        """
+        Sets up empty running metrics.
+
+        Parameters
+        ----------
+        period: float
+            Period of each entry in seconds.
+        threshold: float
+            Fraction of the available power under which a cycle is poorly
+            tracked.
+        """
+        self._period = period
+        self._threshold = threshold
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the running metrics.
+        """
+        # Totals over the entries seen so far.
+        self._numCycles = 0
+        self._numBelow = 0
+        self._energy = 0.0
+        self._theoreticalEnergy = 0.0
+
+    def update(self, outputPower, maxPower):
+        """
+        Advances the running metrics by a block of entries.
+
+        Parameters
+        ----------
+        outputPower: numpy array
+            Power extracted at the reference voltage of each entry (W).
+        maxPower: numpy array
+            Power available at the maximum power point of each entry (W).
+
+        Return
+        ------
+        dict: The running metrics after each entry of the block.
+        {
+            "percentYield": numpy array,        # Yield of the entry
+            "fractionBelowThreshold": numpy array,
+            "energy": numpy array,              # (J)
+            "theoreticalEnergy": numpy array,   # (J)
+            "trackingEff": numpy array,
+        }
+        """
+        percentYield = Metrics._getPercentYield(outputPower, maxPower)
+        below = Metrics._getBelowThreshold(outputPower, maxPower, self._threshold)
+        numBelow = self._numBelow + np.cumsum(below)
+        numCycles = self._numCycles + np.arange(1, len(outputPower) + 1)
+        energy = self._energy + np.cumsum(outputPower) * self._period
+        theoreticalEnergy = (
+            self._theoreticalEnergy + np.cumsum(maxPower) * self._period
+        )
+
+        if len(outputPower) > 0:
+            self._numBelow = int(numBelow[-1])
+            self._numCycles = int(numCycles[-1])
+            self._energy = float(energy[-1])
+            self._theoreticalEnergy = float(theoreticalEnergy[-1])
+
+        return {
+            "percentYield": percentYield,
+            "fractionBelowThreshold": numBelow / numCycles,
+            "energy": energy,
+            "theoreticalEnergy": theoreticalEnergy,
+            "trackingEff": np.divide(
+                energy,
+                theoreticalEnergy,
+                out=np.zeros(len(energy)),
+                where=theoreticalEnergy != 0,
+            ),
+        }
+
+    def getTotals(self):
+        """
+        Returns the running metrics over every entry seen so far.
+
+        Return
+        ------
+        dict: {
+            "numCycles": int,
+            "cyclesBelowThreshold": int,
+            "energy": float,            # (J)
+            "theoreticalEnergy": float, # (J)
+        }
+        """
+        return {
+            "numCycles": self._numCycles,
+            "cyclesBelowThreshold": self._numBelow,
+            "energy": self._energy,
+            "theoreticalEnergy": self._theoreticalEnergy,
+        }
+
+    @staticmethod
+    def getRunMetrics(datastore, period=1.0, threshold=THRESHOLD):
+        """
+        Summarizes the tracking metrics of the entries of a datastore.
+
+        Parameters
+        ----------
+        datastore: dict
+            The datastore of an MPPT simulation. See DataController.
+        period: float
+            Period of each entry in seconds.
+        threshold: float
+            Fraction of the available power under which a cycle is poorly
+            tracked.
+
+        Return
+        ------
+        dict: {
+            "numCycles": int,
+            "cyclesBelowThreshold": int,
+            "energy": float,                # (J)
+            "theoreticalEnergy": float,     # (J)
+            "trackingEff": float,
+            "numSteps": int,                # Environment steps, with the start
+            "unsettledSteps": int,          # Steps that never settled
+            "settlingTime": float,          # Mean over settled steps (s)
+            "maxSettlingTime": float,       # (s)
+            "oscillation": float,           # Mean over settled steps (V)
+            "maxOscillation": float,        # (V)
+            "steps": {
+                "start": numpy array,           # Entry each step starts at
+                "settlingTime": numpy array,    # NaN if unsettled (s)
+                "oscillation": numpy array,     # NaN if unsettled (V)
+            },
+        }
+        Means are NaN if no step settled.
+        """
+        numEntries = datastore["numEntries"]
+        outputPower = datastore["outputPower"][:numEntries]
+        maxPower = datastore["vMPP"][:numEntries] * datastore["iMPP"][:numEntries]
+        vRef = datastore["mpptOutput"][:numEntries]
+        below = Metrics._getBelowThreshold(outputPower, maxPower, threshold)
+
+        energy = float(np.sum(outputPower)) * period
+        theoreticalEnergy = float(np.sum(maxPower)) * period
+        metrics = {
+            "numCycles": int(numEntries),
+            "cyclesBelowThreshold": int(np.count_nonzero(below)),
+            "energy": energy,
+            "theoreticalEnergy": theoreticalEnergy,
+            "trackingEff": (
+                energy / theoreticalEnergy if theoreticalEnergy > 0 else 0.0
+            ),
+        }
+
+        # Steps start at the first entry, and at every entry whose environment
+        # differs from that of the entry before.
+        starts = np.zeros(0, dtype=np.int64)
+        if numEntries > 0:
+            environment = np.hstack(
+                [
+                    datastore["irradiance"][:numEntries],
+                    datastore["temperature"][:numEntries],
+                ]
+            )
+            changed = np.any(environment[1:] != environment[:-1], axis=1)
+            starts = np.concatenate([[0], np.flatnonzero(changed) + 1])
+        ends = np.append(starts[1:], numEntries)
+
+        # A step settles after the last entry of the step below the threshold,
+        # if any entry of the step remains.
+        entries = np.arange(numEntries)
+        settleIdx = starts
+        if numEntries > 0:
+            settleIdx = np.maximum(
+                np.maximum.reduceat(np.where(below, entries + 1, 0), starts), starts
+            )
+        settled = settleIdx < ends
+        settlingTime = np.where(settled, (settleIdx - starts) * period, np.nan)
+
+        # The oscillation of each settled step spans its entries from the
+        # settling entry on.
+        oscillation = np.full(len(starts), np.nan)
+        if np.any(settled):
+            step = np.repeat(np.arange(len(starts)), ends - starts)
+            steady = entries >= settleIdx[step]
+            high = np.maximum.reduceat(np.where(steady, vRef, -np.inf), starts)
+            low = np.minimum.reduceat(np.where(steady, vRef, np.inf), starts)
+            oscillation[settled] = (high[settled] - low[settled]) / 2
+
+        metrics["numSteps"] = len(starts)
+        metrics["unsettledSteps"] = int(np.count_nonzero(~settled))
+        (metrics["settlingTime"], metrics["maxSettlingTime"]) = (np.nan, np.nan)
+        (metrics["oscillation"], metrics["maxOscillation"]) = (np.nan, np.nan)
+        if np.any(settled):
+            metrics["settlingTime"] = float(np.mean(settlingTime[settled]))
+            metrics["maxSettlingTime"] = float(np.max(settlingTime[settled]))
+            metrics["oscillation"] = float(np.mean(oscillation[settled]))
+            metrics["maxOscillation"] = float(np.max(oscillation[settled]))
+        metrics["steps"] = {
+            "start": starts,
+            "settlingTime": settlingTime,
+            "oscillation": oscillation,
+        }
+        return metrics
+
+    @staticmethod
+    def _getPercentYield(outputPower, maxPower):
+        """
+        Returns the yield of each entry, 0 where no power is available.
+        """
+        return np.divide(
+            outputPower, maxPower, out=np.zeros(len(maxPower)), where=maxPower != 0
+        )
+
+    @staticmethod
+    def _getBelowThreshold(outputPower, maxPower, threshold):
+        """
+        Returns whether each entry is below the threshold of the available
+        power. Entries with no power available are not.
+        """
+        return (maxPower > 0) & (outputPower < threshold * maxPower)
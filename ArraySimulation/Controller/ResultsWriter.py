@@ -0,0 +1,352 @@
+"""
+ResultsWriter.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The ResultsWriter class and its derived classes are sinks that
+stream the entries recorded by the DataController to a file as the
+simulation runs.
+
+Entries are handed to the writer in blocks of rows of the columnar datastore
+and each block is written with a single buffered write. The file is flushed
+to the OS at least every flushInterval seconds and when the writer is closed,
+so an interrupted simulation leaves every block written up to that point on
+disk. Combined with DataController.setupSink(retain=False), the memory used
+by a simulation stays bounded regardless of its length.
+
+Three formats are supported, selected by file extension in fromFileName:
+    - .csv: a header row followed by one row per entry.
+    - .ndjson: one JSON object per entry, per line.
+    - .bin: a binary columnar file. See BinaryWriter.
+"""
+# Library Imports.
+import io
+import json
+import numpy as np
+import time
+
+# Custom Imports.
+
+
+class ResultsWriter:
+    """
+    The ResultsWriter class is the base class of the results sinks. Derived
+    classes implement the format specific _writeHeader and _writeBlock.
+    """
+
+    # The datastore columns written per entry, and their output names. The
+    # current is measured at the voltage across the source, which is the
+    # reference voltage of the previous entry. The irradiance and temperature
+    # of each module are appended as irradiance_<module> and
+    # temperature_<module>.
+    COLUMNS = {
+        "cycle": "cycle",
+        "time": "time",
+        "arrayVoltage": "voltage",
+        "mpptOutput": "vRef",
+        "sourceCurrent": "current",
+        "outputPower": "power",
+        "dcdcOutput": "pulseWidth",
+        "vMPP": "vMPP",
+        "iMPP": "iMPP",
+    }
+
+    def __init__(self, fileName, blockSize=1024, flushInterval=5.0):
+        """
+        Sets up the writer. The file is not opened until open is called.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file to write.
+        blockSize: int
+            Number of entries buffered by the DataController per write.
+        flushInterval: float
+            Maximum number of seconds between flushes of the file.
+        """
+        self.fileName = fileName
+        self.blockSize = blockSize
+        self._flushInterval = flushInterval
+        self._file = None
+        self._modules = []
+        self._lastFlush = 0.0
+        self._numRows = 0
+
+        # Byte offset of the end of the file when the writer was pickled.
+        self._offset = None
+
+    @staticmethod
+    def fromFileName(fileName, blockSize=1024, flushInterval=5.0):
+        """
+        Builds the writer for the format given by the file extension.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file to write, ending in .csv, .ndjson, or .bin.
+        blockSize: int
+            Number of entries buffered by the DataController per write.
+        flushInterval: float
+            Maximum number of seconds between flushes of the file.
+
+        Return
+        ------
+        ResultsWriter: The writer.
+        """
+        if fileName.endswith(".csv"):
+            return CSVWriter(fileName, blockSize, flushInterval)
+        elif fileName.endswith(".ndjson"):
+            return NDJSONWriter(fileName, blockSize, flushInterval)
+        elif fileName.endswith(".bin"):
+            return BinaryWriter(fileName, blockSize, flushInterval)
+        else:
+            raise Exception("Unsupported results file format: " + fileName)
+
+    def getColumnNames(self):
+        """
+        Returns the output names of the columns written per entry.
+
+        Return
+        ------
+        list: The column names.
+        """
+        names = list(ResultsWriter.COLUMNS.values())
+        for module in self._modules:
+            names += ["irradiance_" + module, "temperature_" + module]
+        return names
+
+    def getNumRows(self):
+        """
+        Returns the number of entries written since the writer was opened.
+
+        Return
+        ------
+        int: The number of entries.
+        """
+        return self._numRows
+
+    def open(self, modules):
+        """
+        Opens the file, overwriting it, and writes the header.
+
+        Parameters
+        ----------
+        modules: List of Strings
+            Names of the modules in the source.
+        """
+        self.close()
+        self._modules = list(modules)
+        self._numRows = 0
+        self._file = open(self.fileName, "wb")
+        self._writeHeader()
+        self.flush()
+
+    def reopen(self):
+        """
+        Reopens the file of a writer restored from a pickle (i.e. from a
+        checkpoint) for further writes. Anything written to the file after the
+        writer was pickled is discarded.
+        """
+        if self._offset is None:
+            raise Exception("Only a pickled writer can be reopened.")
+        self._file = open(self.fileName, "r+b")
+        self._file.truncate(self._offset)
+        self._file.seek(self._offset)
+        self._offset = None
+
+    def write(self, datastore, start, stop):
+        """
+        Writes a block of entries from the datastore.
+
+        Parameters
+        ----------
+        datastore: dict
+            The columnar datastore of the DataController.
+        start: int
+            Index of the first row to write.
+        stop: int
+            Index after the last row to write.
+        """
+        if self._file is None:
+            raise Exception("The results writer must be opened before writing.")
+        if stop <= start:
+            return
+
+        columns = {}
+        for (column, name) in ResultsWriter.COLUMNS.items():
+            columns[name] = datastore[column][start:stop]
+        for (moduleIdx, module) in enumerate(self._modules):
+            columns["irradiance_" + module] = datastore["irradiance"][
+                start:stop, moduleIdx
+            ]
+            columns["temperature_" + module] = datastore["temperature"][
+                start:stop, moduleIdx
+            ]
+        self._writeBlock(columns, stop - start)
+        self._numRows += stop - start
+
+        if time.time() - self._lastFlush >= self._flushInterval:
+            self.flush()
+
+    def flush(self):
+        """
+        Flushes the written blocks to the OS.
+        """
+        if self._file is not None:
+            self._file.flush()
+        self._lastFlush = time.time()
+
+    def close(self):
+        """
+        Flushes and closes the file.
+        """
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __getstate__(self):
+        """
+        Pickles the writer without its file, remembering how far the file has
+        been written instead.
+        """
+        state = self.__dict__.copy()
+        if self._file is not None:
+            self.flush()
+            state["_offset"] = self._file.tell()
+        state["_file"] = None
+        return state
+
+    def _writeHeader(self):
+        """
+        Writes the format specific header of the file.
+        """
+        pass
+
+    def _writeBlock(self, columns, numRows):
+        """
+        Writes a block of entries in the format of the file.
+
+        Parameters
+        ----------
+        columns: dict
+            A numpy array of numRows values per output column name.
+        numRows: int
+            Number of entries in the block.
+        """
+        raise Exception("_writeBlock is not implemented for the base writer.")
+
+
+class CSVWriter(ResultsWriter):
+    """
+    The CSVWriter class writes a header row followed by a row per entry.
+    """
+
+    def _writeHeader(self):
+        self._file.write((",".join(self.getColumnNames()) + "\n").encode())
+
+    def _writeBlock(self, columns, numRows):
+        block = io.StringIO()
+        np.savetxt(
+            block,
+            np.column_stack(list(columns.values())),
+            delimiter=",",
+            fmt="%.17g",
+        )
+        self._file.write(block.getvalue().encode())
+
+
+class NDJSONWriter(ResultsWriter):
+    """
+    The NDJSONWriter class writes a JSON object per entry, one per line.
+    """
+
+    def _writeBlock(self, columns, numRows):
+        values = {name: column.tolist() for (name, column) in columns.items()}
+        lines = [
+            json.dumps({name: values[name][idx] for name in values})
+            for idx in range(numRows)
+        ]
+        self._file.write(("\n".join(lines) + "\n").encode())
+
+
+class BinaryWriter(ResultsWriter):
+    """
+    The BinaryWriter class writes a binary columnar file. The file starts with
+    a single line of JSON describing the columns,
+
+        {"format": "PVSimResults", "columns": [[name, dtype], ...]}
+
+    followed by a sequence of blocks. Each block is the number of rows as a
+    little endian int64, followed by the raw values of each column in order.
+    """
+
+    # Identifier of the file format in the header.
+    FORMAT = "PVSimResults"
+
+    def _getDtypes(self):
+        """
+        Returns the dtype of each output column.
+
+        Return
+        ------
+        list: (name, dtype string) tuples.
+        """
+        return [
+            (name, "<i8" if name == "cycle" else "<f8")
+            for name in self.getColumnNames()
+        ]
+
+    def _writeHeader(self):
+        header = {"format": BinaryWriter.FORMAT, "columns": self._getDtypes()}
+        self._file.write((json.dumps(header) + "\n").encode())
+
+    def _writeBlock(self, columns, numRows):
+        block = [np.array([numRows], dtype="<i8").tobytes()]
+        for (name, dtype) in self._getDtypes():
+            block.append(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+        self._file.write(b"".join(block))
+
+    @staticmethod
+    def read(fileName):
+        """
+        Reads a binary columnar file. A partially written trailing block (i.e.
+        from an interrupted simulation) is ignored.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file to read.
+
+        Return
+        ------
+        dict: A numpy array of values per column name.
+        """
+        with open(fileName, "rb") as file:
+            header = json.loads(file.readline().decode())
+            data = file.read()
+        if header.get("format") != BinaryWriter.FORMAT:
+            raise Exception(fileName + " is not a binary results file.")
+
+        dtypes = [(name, np.dtype(dtype)) for (name, dtype) in header["columns"]]
+        blocks = {name: [] for (name, _) in dtypes}
+        offset = 0
+        while offset + 8 <= len(data):
+            numRows = int(np.frombuffer(data, dtype="<i8", count=1, offset=offset)[0])
+            blockSize = 8 + sum(numRows * dtype.itemsize for (_, dtype) in dtypes)
+            if offset + blockSize > len(data):
+                break
+            offset += 8
+            for (name, dtype) in dtypes:
+                blocks[name].append(
+                    np.frombuffer(data, dtype=dtype, count=numRows, offset=offset)
+                )
+                offset += numRows * dtype.itemsize
+
+        return {
+            name: np.concatenate(blocks[name]) if blocks[name] else np.zeros(0, dtype)
+            for (name, dtype) in dtypes
+        }
@@ -0,0 +1,122 @@
+"""
+RingBuffer.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The RingBuffer class is a bounded first in, first out queue of
+numbers shared between a single producer thread and a single consumer thread.
+
+It is lock free: the producer only ever advances the write count and the
+consumer only ever advances the read count, each after it is done with the
+slots in between. Each count is a single Python integer assignment, so neither
+side can observe a half written update from the other. Values are copied in
+and out in bulk through numpy slices.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class RingBuffer:
+    """
+    The RingBuffer class is a fixed capacity single producer, single consumer
+    queue of numbers.
+    """
+
+    def __init__(self, capacity=65536, dtype=np.int64):
+        """
+        Allocates the buffer.
+
+        Parameters
+        ----------
+        capacity: int
+            Maximum number of values held at once.
+        dtype: numpy dtype
+            Type of the values.
+        """
+        if capacity < 1:
+            raise Exception("The ring buffer must hold at least one value.")
+        self._values = np.zeros(capacity, dtype=dtype)
+
+        # Total number of values written and read. Only the producer writes
+        # _written and only the consumer writes _read.
+        self._written = 0
+        self._read = 0
+
+    def getCapacity(self):
+        """
+        Returns the maximum number of values held at once.
+
+        Return
+        ------
+        int: The capacity.
+        """
+        return len(self._values)
+
+    def getSize(self):
+        """
+        Returns the number of values waiting to be read.
+
+        Return
+        ------
+        int: The number of values.
+        """
+        return self._written - self._read
+
+    def push(self, values):
+        """
+        Writes as many values as fit in the buffer. Must only be called by the
+        producer.
+
+        Parameters
+        ----------
+        values: numpy array
+            Values to write, in order.
+
+        Return
+        ------
+        int: The number of values written, from the front of values. The
+        remaining values should be pushed again once the consumer catches up.
+        """
+        capacity = len(self._values)
+        count = min(len(values), capacity - (self._written - self._read))
+        start = self._written % capacity
+        first = min(count, capacity - start)
+        self._values[start : start + first] = values[:first]
+        self._values[: count - first] = values[first:count]
+
+        # Publish the values only once they are in place.
+        self._written += count
+        return count
+
+    def drain(self, maxCount=None):
+        """
+        Reads every value waiting in the buffer. Must only be called by the
+        consumer.
+
+        Parameters
+        ----------
+        maxCount: int|None
+            Maximum number of values to read. If None, all are read.
+
+        Return
+        ------
+        numpy array: The values read, in order.
+        """
+        capacity = len(self._values)
+        count = self._written - self._read
+        if maxCount is not None:
+            count = min(count, maxCount)
+        start = self._read % capacity
+        first = min(count, capacity - start)
+        values = np.concatenate(
+            (self._values[start : start + first], self._values[: count - first])
+        )
+
+        # Release the slots only once the values are copied out.
+        self._read += count
+        return values
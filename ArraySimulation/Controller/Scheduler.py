@@ -0,0 +1,134 @@
+"""
+Scheduler.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The Scheduler class runs a set of stages, each at its own update
+period, on a shared simulation clock. It is used by the DataController to run
+the components of the data pipeline at different rates, i.e. the environment
+at 1 Hz, the MPPT at 20 Hz, and the DC-DC converter at 1 kHz.
+
+The time at which a stage fires is always computed as the number of times the
+stage has fired multiplied by its period, rather than accumulated, so stages
+with commensurate periods stay aligned over arbitrarily long runs.
+"""
+# Library Imports.
+
+
+# Custom Imports.
+
+
+class Scheduler:
+    """
+    The Scheduler class runs a set of stages, each at its own update period, on
+    a shared simulation clock. Stages that are due at the same time are
+    executed in the order they were added.
+    """
+
+    # Tolerance, in seconds, for considering two stages due at the same time.
+    _TIME_TOLERANCE = 1e-9
+
+    def __init__(self):
+        # Ordered list of stages. Each stage is a dictionary in the following
+        # format:
+        # {
+        #     "name": String,
+        #     "period": float,      (s)
+        #     "callback": function reference, called with the current time,
+        #     "count": int,         number of times the stage has fired.
+        # }
+        self._stages = []
+
+        # The time of the most recently executed stages.
+        self._time = 0.0
+
+    def addStage(self, name, period, callback):
+        """
+        Adds a stage to the scheduler. The stage first fires at time 0.
+
+        Parameters
+        ----------
+        name: String
+            Unique identifier of the stage.
+        period: float
+            Update period of the stage in seconds.
+        callback: function reference
+            Function called with the current time (in seconds) whenever the
+            stage is due.
+        """
+        if period <= 0:
+            raise Exception("The period of stage " + name + " must be positive.")
+        if self.getStage(name) is not None:
+            raise Exception("A stage already exists with the name " + name)
+
+        self._stages.append(
+            {"name": name, "period": period, "callback": callback, "count": 0}
+        )
+
+    def getStage(self, name):
+        """
+        Returns the stage with the given name.
+
+        Parameters
+        ----------
+        name: String
+            Identifier of the stage.
+
+        Return
+        ------
+        dict|None: The stage, or None if it does not exist.
+        """
+        for stage in self._stages:
+            if stage["name"] == name:
+                return stage
+        return None
+
+    def getNextTime(self):
+        """
+        Returns the time at which the next stage is due.
+
+        Return
+        ------
+        float: Time in seconds.
+        """
+        return min(stage["count"] * stage["period"] for stage in self._stages)
+
+    def getTime(self):
+        """
+        Returns the time of the most recently executed stages.
+
+        Return
+        ------
+        float: Time in seconds.
+        """
+        return self._time
+
+    def step(self):
+        """
+        Advances the clock to the next due time and executes every stage due
+        at that time.
+
+        Return
+        ------
+        list: Names of the stages that were executed, in execution order.
+        """
+        self._time = self.getNextTime()
+        executed = []
+        for stage in self._stages:
+            stageTime = stage["count"] * stage["period"]
+            if stageTime - self._time <= Scheduler._TIME_TOLERANCE:
+                stage["callback"](self._time)
+                stage["count"] += 1
+                executed.append(stage["name"])
+        return executed
+
+    def reset(self):
+        """
+        Rewinds the clock to time 0. Stages are retained.
+        """
+        self._time = 0.0
+        for stage in self._stages:
+            stage["count"] = 0
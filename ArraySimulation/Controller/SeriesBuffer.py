@@ -0,0 +1,188 @@
+"""
+SeriesBuffer.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The SeriesBuffer class stores the x and y values of a Graph
+series in preallocated numpy arrays.
+
+Appends are amortized O(1): when the arrays are full, their capacity is
+doubled. The values are always contiguous, so getX and getY return views that
+can be handed to the plotting backend without any conversion or copy.
+
+A series can also be given a maximum length, in which case it is a rolling
+window that only keeps the latest maxLength values. The arrays are then twice
+maxLength long; values are appended until the end is reached, at which point
+the latest window is moved back to the front. This keeps the window contiguous
+at the cost of one copy every maxLength appends.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class SeriesBuffer:
+    """
+    The SeriesBuffer class stores the values of a series in growable, or
+    rolling, numpy arrays.
+    """
+
+    def __init__(self, capacity=1024, maxLength=None):
+        """
+        Allocates an empty series.
+
+        Parameters
+        ----------
+        capacity: int
+            Number of values to preallocate. Ignored for rolling windows.
+        maxLength: int|None
+            Maximum number of values kept. If None, every value is kept.
+        """
+        if maxLength is not None:
+            if maxLength < 1:
+                raise Exception("The series must keep at least one value.")
+            capacity = 2 * maxLength
+        self._maxLength = maxLength
+        self._x = np.zeros(max(capacity, 1))
+        self._y = np.zeros(max(capacity, 1))
+
+        # The values are _x[_start:_stop] and _y[_start:_stop].
+        self._start = 0
+        self._stop = 0
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def getX(self):
+        """
+        Returns the x values of the series.
+
+        Return
+        ------
+        numpy array: A view of the x values, valid until the next change.
+        """
+        return self._x[self._start : self._stop]
+
+    def getY(self):
+        """
+        Returns the y values of the series.
+
+        Return
+        ------
+        numpy array: A view of the y values, valid until the next change.
+        """
+        return self._y[self._start : self._stop]
+
+    def append(self, x, y):
+        """
+        Appends a value to the series.
+
+        Parameters
+        ----------
+        x: float
+            X value.
+        y: float
+            Y value.
+        """
+        self._reserve(1)
+        self._x[self._stop] = x
+        self._y[self._stop] = y
+        self._stop += 1
+        self._trim()
+
+    def extend(self, xs, ys):
+        """
+        Appends values to the series.
+
+        Parameters
+        ----------
+        xs: list|numpy array
+            X values.
+        ys: list|numpy array
+            Y values, one per x value.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if len(xs) != len(ys):
+            raise Exception("Series values must come in x and y pairs.")
+
+        if self._maxLength is not None and len(xs) > self._maxLength:
+            # Only the last window of values can be kept.
+            xs = xs[-self._maxLength :]
+            ys = ys[-self._maxLength :]
+        self._reserve(len(xs))
+        self._x[self._stop : self._stop + len(xs)] = xs
+        self._y[self._stop : self._stop + len(ys)] = ys
+        self._stop += len(xs)
+        self._trim()
+
+    def set(self, idx, x, y):
+        """
+        Replaces a value of the series.
+
+        Parameters
+        ----------
+        idx: int
+            Index of the value, from the oldest value kept. Negative indices
+            count from the newest value.
+        x: float
+            X value.
+        y: float
+            Y value.
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise Exception("Series index out of range: " + str(idx))
+        self._x[self._start + idx] = x
+        self._y[self._start + idx] = y
+
+    def clear(self):
+        """
+        Removes every value from the series. The capacity is kept.
+        """
+        self._start = 0
+        self._stop = 0
+
+    def _reserve(self, count):
+        """
+        Makes room for count more values at the end of the arrays, either by
+        moving a rolling window back to the front or by growing the arrays.
+
+        Parameters
+        ----------
+        count: int
+            Number of values about to be appended.
+        """
+        capacity = len(self._x)
+        if self._stop + count <= capacity:
+            return
+
+        length = len(self)
+        if self._maxLength is not None:
+            # Keep the values that will still be in the window afterwards.
+            keep = max(0, min(length, self._maxLength - count))
+            self._x[:keep] = self._x[self._stop - keep : self._stop]
+            self._y[:keep] = self._y[self._stop - keep : self._stop]
+            self._start = 0
+            self._stop = keep
+            return
+
+        newCapacity = max(2 * capacity, length + count)
+        for name in ["_x", "_y"]:
+            grown = np.zeros(newCapacity)
+            grown[:length] = getattr(self, name)[self._start : self._stop]
+            setattr(self, name, grown)
+        self._start = 0
+        self._stop = length
+
+    def _trim(self):
+        """
+        Drops the oldest values beyond the maximum length of a rolling window.
+        """
+        if self._maxLength is not None and len(self) > self._maxLength:
+            self._start = self._stop - self._maxLength
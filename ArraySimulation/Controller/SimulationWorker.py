@@ -0,0 +1,151 @@
+"""
+SimulationWorker.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The SimulationWorker class runs the MPPT simulation of a
+DataController in a background thread, so that the speed of the simulation is
+independent of the frame rate of the UI.
+
+After every iteration of the pipeline, the worker publishes the datastore rows
+it added into a RingBuffer. The UI drains the buffer once per frame and draws
+everything new at once. If the UI falls behind by more than the capacity of
+the buffer, the worker waits for it to catch up.
+
+The speed of the simulation is relative to simulation time: 1 runs in real
+time, N runs N times faster than real time, and None runs as fast as
+possible.
+"""
+# Library Imports.
+import numpy as np
+import threading
+import time
+
+# Custom Imports.
+
+
+class SimulationWorker(threading.Thread):
+    """
+    The SimulationWorker class iterates the MPPT pipeline of a DataController
+    in a background thread and publishes new datastore rows to a RingBuffer.
+    """
+
+    # Seconds to wait for the consumer when the ring buffer is full.
+    _WAIT_TIME = 0.001
+
+    # Maximum seconds to sleep at once when pacing, so stops and speed changes
+    # are picked up promptly.
+    _MAX_SLEEP = 0.05
+
+    def __init__(self, controller, buffer, speed=None):
+        """
+        Sets up the worker. The pipeline of the controller must be reset
+        beforehand, and must not be touched by other threads until the worker
+        has stopped.
+
+        Parameters
+        ----------
+        controller: DataController
+            The controller whose MPPT pipeline is run.
+        buffer: RingBuffer
+            The buffer the indices of new datastore rows are published to.
+        speed: float|None
+            Simulated seconds per wall clock second. If None, the simulation
+            runs as fast as possible.
+        """
+        super(SimulationWorker, self).__init__(daemon=True)
+        self._controller = controller
+        self._buffer = buffer
+        self._speed = speed
+        self._stopEvent = threading.Event()
+
+        # Wall clock and simulation time that pacing is measured from. Reset
+        # whenever the speed changes.
+        self._anchor = None
+
+        # Whether the pipeline can be iterated further once the worker is done,
+        # and the exception that stopped it, if any.
+        self.continueBool = True
+        self.error = None
+
+    def setSpeed(self, speed):
+        """
+        Changes the speed of the simulation.
+
+        Parameters
+        ----------
+        speed: float|None
+            Simulated seconds per wall clock second. If None, the simulation
+            runs as fast as possible.
+        """
+        self._speed = speed
+        self._anchor = None
+
+    def stop(self):
+        """
+        Stops the worker after its current iteration and waits for it to
+        finish. Rows published so far remain in the buffer.
+        """
+        self._stopEvent.set()
+        if self.is_alive():
+            self.join()
+
+    def run(self):
+        """
+        Iterates the pipeline until the simulation completes or the worker is
+        stopped.
+        """
+        controller = self._controller
+        published = controller.datastore["numEntries"]
+        try:
+            while self.continueBool and not self._stopEvent.is_set():
+                (datastore, self.continueBool) = controller.iteratePipelineCycleMPPT()
+                numEntries = datastore["numEntries"]
+                self._publish(np.arange(published, numEntries))
+                published = numEntries
+                if numEntries > 0:
+                    self._pace(datastore["time"][numEntries - 1])
+        except Exception as e:
+            self.error = e
+
+    def _publish(self, rows):
+        """
+        Pushes rows into the buffer, waiting for the consumer whenever it is
+        full.
+
+        Parameters
+        ----------
+        rows: numpy array
+            Indices of the new datastore rows.
+        """
+        while len(rows) > 0 and not self._stopEvent.is_set():
+            rows = rows[self._buffer.push(rows) :]
+            if len(rows) > 0:
+                time.sleep(SimulationWorker._WAIT_TIME)
+
+    def _pace(self, simTime):
+        """
+        Sleeps until the wall clock catches up with the simulation time at the
+        current speed.
+
+        Parameters
+        ----------
+        simTime: float
+            Simulation time of the latest entry in seconds.
+        """
+        speed = self._speed
+        if speed is None:
+            return
+        if self._anchor is None:
+            self._anchor = (time.perf_counter(), simTime)
+            return
+
+        (wallStart, simStart) = self._anchor
+        while not self._stopEvent.is_set() and self._speed == speed:
+            delay = wallStart + (simTime - simStart) / speed - time.perf_counter()
+            if delay <= 0:
+                return
+            time.sleep(min(delay, SimulationWorker._MAX_SLEEP))
@@ -0,0 +1,422 @@
+"""
+StrideTuner.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The StrideTuner class tunes the parameters of the stride models
+(i.e. minStride, error, slopeMultiplier) for each pair of local MPPT algorithm
+and stride model, maximizing the mean tracking efficiency over a set of
+environment profiles.
+
+The parameters of each pair are searched with CMA-ES (Covariance Matrix
+Adaptation Evolution Strategy, see Hansen, The CMA Evolution Strategy: A
+Tutorial, 2016). Each parameter is searched on a log scale between the bounds
+in PARAMETERS, starting from the hand-picked defaults of the stride model.
+Every generation, a population of candidate parameters is sampled from a
+multivariate normal distribution, and its mean, step size and covariance are
+moved towards the best candidates.
+
+Each candidate is evaluated by running the MPPT over every profile against
+the precomputed source response of the profile (see
+DataController.setupSurface), so an evaluation costs little more than the
+MPPT itself. The evaluations of a generation are spread across a pool of
+worker processes, each of which precomputes the response of each profile once
+and reuses it for every evaluation.
+"""
+# Library Imports.
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import itertools
+import json
+import math
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+
+
+class StrideTuner:
+    """
+    The StrideTuner class searches for the stride model parameters that
+    maximize the tracking efficiency of each pair of local MPPT algorithm and
+    stride model.
+    """
+
+    # The tunable parameters of each stride model, as (lower bound, upper
+    # bound, default).
+    PARAMETERS = {
+        "Fixed": {"minStride": (0.001, 0.2, 0.01)},
+        "Optimal": {"error": (0.001, 0.5, 0.05)},
+        "Adaptive": {"error": (0.001, 0.5, 0.05), "scale": (0.1, 30.0, 3.0)},
+        "Bisection": {
+            "minStride": (0.001, 0.2, 0.01),
+            "slopeMultiplier": (0.0001, 0.1, 0.01),
+        },
+    }
+
+    # Initial step size of the search, as a fraction of the log range of each
+    # parameter.
+    INITIAL_SIGMA = 0.3
+
+    # The columns of the results table.
+    COLUMNS = [
+        "localAlgo",
+        "strideAlgo",
+        "strideParams",
+        "trackingEff",
+        "defaultTrackingEff",
+        "numEvaluations",
+        "error",
+    ]
+
+    def __init__(self, numProcesses=None):
+        """
+        Sets up the tuner.
+
+        Parameters
+        ----------
+        numProcesses: int|None
+            Number of worker processes. If None, one per CPU is used. If 1,
+            candidates are evaluated in this process.
+        """
+        self._numProcesses = numProcesses
+
+        # The tuning setup. See setupTuning.
+        self._setup = None
+
+        # List of results, one dict per pair with keys in COLUMNS.
+        self._results = []
+
+    def setupTuning(
+        self,
+        models=None,
+        environments=None,
+        maxCycles=200,
+        globalAlgo="Voltage Sweep",
+        localAlgos=None,
+        strideAlgos=None,
+        globalParams=None,
+        maxEvaluations=200,
+        populationSize=None,
+        seed=0,
+    ):
+        """
+        Sets up the pairs to tune and the profiles to tune them against.
+
+        Parameters
+        ----------
+        models: List of Strings|None
+            PVSource cell models. If None, ["Ideal"].
+        environments: List of Strings|None
+            PVEnvironment profiles in External/. Every candidate is evaluated
+            on every (model, environment) profile. If None,
+            ["SingleCell.json"].
+        maxCycles: int
+            Maximum number of cycles to execute each profile for.
+        globalAlgo: String
+            The global MPPT algorithm used while tuning.
+        localAlgos: List of Strings|None
+            Local MPPT algorithms. If None, ["PandO"].
+        strideAlgos: List of Strings|None
+            Stride models, with an entry in PARAMETERS. If None, ["Fixed"].
+        globalParams: dict|None
+            Global MPPT algorithm keyword parameters.
+        maxEvaluations: int
+            Number of candidates evaluated per pair.
+        populationSize: int|None
+            Number of candidates per generation. If None, the CMA-ES default
+            of 4 + 3 ln(number of parameters) is used.
+        seed: int
+            Seed of the search.
+
+        Return
+        ------
+        int: The number of pairs to tune.
+        """
+        if models is None:
+            models = ["Ideal"]
+        if environments is None:
+            environments = ["SingleCell.json"]
+        if localAlgos is None:
+            localAlgos = ["PandO"]
+        if strideAlgos is None:
+            strideAlgos = ["Fixed"]
+
+        for strideAlgo in strideAlgos:
+            if strideAlgo not in StrideTuner.PARAMETERS:
+                raise Exception("Stride model " + strideAlgo + " has no parameters.")
+
+        self._setup = {
+            "profiles": list(itertools.product(models, environments)),
+            "maxCycles": maxCycles,
+            "globalAlgo": globalAlgo,
+            "globalParams": globalParams,
+            "pairs": list(itertools.product(localAlgos, strideAlgos)),
+            "maxEvaluations": maxEvaluations,
+            "populationSize": populationSize,
+            "seed": seed,
+        }
+        self._results = []
+        return len(self._setup["pairs"])
+
+    @classmethod
+    def fromJSON(cls, fileName, numProcesses=None):
+        """
+        Builds a StrideTuner from a JSON file, where each key is a keyword
+        argument of setupTuning.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the tuning definition, i.e. a file containing
+            {"localAlgos": ["PandO", "IC"], "strideAlgos": ["Fixed", "Bisection"]}.
+        numProcesses: int|None
+            Number of worker processes. If None, one per CPU is used.
+
+        Return
+        ------
+        StrideTuner: The tuner, set up.
+        """
+        with open(fileName) as file:
+            params = json.load(file)
+        tuner = cls(numProcesses)
+        tuner.setupTuning(**params)
+        return tuner
+
+    def runTuning(self):
+        """
+        Tunes every pair. Pairs that raise an exception are recorded with
+        their error message instead of halting the tuning.
+
+        Return
+        ------
+        list: The results of each pair, in pair order.
+        """
+        if self._setup is None:
+            raise Exception("setupTuning must be called before tuning.")
+
+        if self._numProcesses == 1:
+            self._results = [
+                self._tunePair(localAlgo, strideAlgo, map)
+                for (localAlgo, strideAlgo) in self._setup["pairs"]
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self._numProcesses) as executor:
+                self._results = [
+                    self._tunePair(localAlgo, strideAlgo, executor.map)
+                    for (localAlgo, strideAlgo) in self._setup["pairs"]
+                ]
+        return self._results
+
+    def getResults(self):
+        """
+        Returns the results of the last tuning.
+
+        Return
+        ------
+        list: The results of each pair, with keys in COLUMNS.
+        """
+        return self._results
+
+    def writeResults(self, fileName):
+        """
+        Writes the results table of the last tuning to a CSV file.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file to write.
+        """
+        with open(fileName, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=StrideTuner.COLUMNS)
+            writer.writeheader()
+            for result in self._results:
+                row = dict(result)
+                row["strideParams"] = json.dumps(row["strideParams"])
+                writer.writerow(row)
+
+    def _tunePair(self, localAlgo, strideAlgo, mapper):
+        """
+        Searches for the stride parameters of a pair with CMA-ES.
+
+        Parameters
+        ----------
+        localAlgo: String
+            The local MPPT algorithm.
+        strideAlgo: String
+            The stride model.
+        mapper: function
+            Maps evaluateCandidate over a list of tasks, i.e. map or the map of
+            a process pool.
+
+        Return
+        ------
+        dict: The result of the pair, with keys in COLUMNS.
+        """
+        setup = self._setup
+        result = {
+            "localAlgo": localAlgo,
+            "strideAlgo": strideAlgo,
+            "strideParams": None,
+            "trackingEff": None,
+            "defaultTrackingEff": None,
+            "numEvaluations": 0,
+            "error": None,
+        }
+        bounds = StrideTuner.PARAMETERS[strideAlgo]
+        names = list(bounds.keys())
+        low = np.log([bounds[name][0] for name in names])
+        high = np.log([bounds[name][1] for name in names])
+
+        def decode(x):
+            # Candidates are searched in [0, 1] per parameter, on a log scale.
+            values = np.exp(low + np.clip(x, 0.0, 1.0) * (high - low))
+            return {name: float(value) for (name, value) in zip(names, values)}
+
+        def evaluate(candidates):
+            tasks = [
+                (
+                    model,
+                    environment,
+                    setup["maxCycles"],
+                    setup["globalAlgo"],
+                    localAlgo,
+                    strideAlgo,
+                    decode(x),
+                    setup["globalParams"],
+                )
+                for x in candidates
+                for (model, environment) in setup["profiles"]
+            ]
+            efficiencies = np.array(list(mapper(evaluateCandidate, tasks)))
+            result["numEvaluations"] += len(candidates)
+            return efficiencies.reshape(len(candidates), -1).mean(axis=1)
+
+        try:
+            # CMA-ES strategy parameters, for n parameters.
+            n = len(names)
+            popSize = setup["populationSize"]
+            if popSize is None:
+                popSize = 4 + int(3 * math.log(n))
+            mu = popSize // 2
+            weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+            weights /= np.sum(weights)
+            muEff = 1 / np.sum(weights**2)
+            cc = (4 + muEff / n) / (n + 4 + 2 * muEff / n)
+            cs = (muEff + 2) / (n + muEff + 5)
+            c1 = 2 / ((n + 1.3) ** 2 + muEff)
+            cMu = min(1 - c1, 2 * (muEff - 2 + 1 / muEff) / ((n + 2) ** 2 + muEff))
+            damps = 1 + 2 * max(0, math.sqrt((muEff - 1) / (n + 1)) - 1) + cs
+            chiN = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n * n))
+
+            # The search starts at the defaults of the stride model.
+            mean = (np.log([bounds[name][2] for name in names]) - low) / (high - low)
+            sigma = StrideTuner.INITIAL_SIGMA
+            C = np.eye(n)
+            (pc, ps) = (np.zeros(n), np.zeros(n))
+            rng = np.random.default_rng(setup["seed"])
+
+            bestEff = float(evaluate([mean])[0])
+            (bestX, result["defaultTrackingEff"]) = (mean, bestEff)
+            generation = 0
+            while result["numEvaluations"] + popSize <= setup["maxEvaluations"]:
+                # Sample the population, clipped into the search space.
+                (eigenvalues, B) = np.linalg.eigh(C)
+                D = np.sqrt(np.maximum(eigenvalues, 1e-20))
+                z = rng.standard_normal((popSize, n))
+                x = np.clip(mean + sigma * (z * D) @ B.T, 0.0, 1.0)
+                y = (x - mean) / sigma
+
+                efficiencies = evaluate(x)
+                order = np.argsort(-efficiencies)
+                if efficiencies[order[0]] > bestEff:
+                    (bestEff, bestX) = (float(efficiencies[order[0]]), x[order[0]])
+
+                # Move the mean towards the best candidates, then adapt the
+                # step size and covariance along the path taken.
+                yW = weights @ y[order[:mu]]
+                mean = mean + sigma * yW
+                invSqrtC = B @ np.diag(1 / D) @ B.T
+                ps = (1 - cs) * ps + math.sqrt(cs * (2 - cs) * muEff) * (invSqrtC @ yW)
+                generation += 1
+                psNorm = np.linalg.norm(ps) / math.sqrt(
+                    1 - (1 - cs) ** (2 * generation)
+                )
+                hSigma = psNorm / chiN < 1.4 + 2 / (n + 1)
+                pc = (1 - cc) * pc + hSigma * math.sqrt(cc * (2 - cc) * muEff) * yW
+                rankMu = (y[order[:mu]].T * weights) @ y[order[:mu]]
+                C = (
+                    (1 - c1 - cMu) * C
+                    + c1
+                    * (np.outer(pc, pc) + (1 - hSigma) * cc * (2 - cc) * C)
+                    + cMu * rankMu
+                )
+                sigma *= math.exp(cs / damps * (np.linalg.norm(ps) / chiN - 1))
+
+            result["strideParams"] = decode(bestX)
+            result["trackingEff"] = bestEff
+        except Exception as e:
+            result["error"] = str(e)
+        return result
+
+
+# Controllers of each profile in this process, with the source response of the
+# profile precomputed. See evaluateCandidate.
+_controllers = {}
+
+
+def evaluateCandidate(task):
+    """
+    Runs the MPPT with a set of stride parameters over a profile, against the
+    precomputed source response of the profile. This is a module level
+    function so it can be sent to worker processes.
+
+    Parameters
+    ----------
+    task: tuple
+        (model, environment, maxCycles, globalAlgo, localAlgo, strideAlgo,
+        strideParams, globalParams)
+
+    Return
+    ------
+    float: The tracking efficiency of the run.
+    """
+    (
+        model,
+        environment,
+        maxCycles,
+        globalAlgo,
+        localAlgo,
+        strideAlgo,
+        strideParams,
+        globalParams,
+    ) = task
+
+    # The source response is kept across resets of the same profile.
+    key = (model, environment, maxCycles)
+    if key not in _controllers:
+        _controllers[key] = DataController()
+        _controllers[key].setupSurface(True)
+    controller = _controllers[key]
+    controller.resetPipeline(
+        model,
+        environment,
+        maxCycles,
+        globalAlgo,
+        localAlgo,
+        strideAlgo,
+        strideParams,
+        globalParams=globalParams,
+    )
+
+    continueBool = True
+    while continueBool:
+        (_, continueBool) = controller.iteratePipelineCycleMPPT()
+
+    (energy, theoreticalEnergy) = controller.getEnergy()
+    if theoreticalEnergy > 0:
+        return energy / theoreticalEnergy
+    return 0.0
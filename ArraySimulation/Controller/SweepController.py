@@ -0,0 +1,401 @@
+"""
+SweepController.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The SweepController class runs a matrix of MPPT simulations.
+Scenarios are generated from the Cartesian product of cell models,
+environment profiles, global/local/stride MPPT algorithms, and stride
+parameters. Each scenario is run headlessly by its own DataController in a
+pool of worker processes, and the performance of each scenario is collected
+into a single results table.
+
+The metrics collected per scenario are:
+    - energy: the energy extracted at the MPPT reference voltage (J).
+    - theoreticalEnergy: the energy available at the maximum power point (J).
+    - trackingEff: energy / theoreticalEnergy.
+    - cyclesBelowThreshold: the number of cycles where the extracted power was
+      below THRESHOLD of the available power.
+    - settlingTime, oscillation: the mean time to settle after each
+      environment step, and the mean amplitude of the reference voltage once
+      settled.
+    - unsettledSteps: the number of environment steps that never settled.
+See Metrics for their definitions.
+
+Sweeps can be checkpointed by giving a checkpoint directory. Each scenario
+periodically checkpoints its simulation there (see
+DataController.setupCheckpoint) and saves its result once done, so rerunning
+an interrupted sweep skips the completed scenarios and resumes the others.
+"""
+# Library Imports.
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import functools
+import hashlib
+import itertools
+import json
+import os
+import time
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.Metrics import Metrics
+
+
+class SweepController:
+    """
+    The SweepController class generates and runs a matrix of MPPT simulation
+    scenarios across a pool of processes.
+    """
+
+    # Fraction of the maximum power point power under which a cycle is
+    # considered to be poorly tracked.
+    THRESHOLD = Metrics.THRESHOLD
+
+    # The columns of the results table.
+    COLUMNS = [
+        "model",
+        "environment",
+        "maxCycles",
+        "globalAlgo",
+        "localAlgo",
+        "strideAlgo",
+        "strideParams",
+        "globalParams",
+        "energy",
+        "theoreticalEnergy",
+        "sweepLoss",
+        "partialRescans",
+        "fullRescans",
+        "trackingEff",
+        "cyclesBelowThreshold",
+        "settlingTime",
+        "oscillation",
+        "unsettledSteps",
+        "numCycles",
+        "runTime",
+        "error",
+    ]
+
+    def __init__(self, numProcesses=None, checkpointDir=None, checkpointInterval=10000):
+        """
+        Sets up the sweep.
+
+        Parameters
+        ----------
+        numProcesses: int|None
+            Number of worker processes. If None, one per CPU is used.
+        checkpointDir: String|None
+            Directory holding the checkpoints and results of each scenario. If
+            None, the sweep is not checkpointed.
+        checkpointInterval: int
+            Number of cycles between the checkpoints of each scenario.
+        """
+        self._numProcesses = numProcesses
+        self._checkpointDir = checkpointDir
+        self._checkpointInterval = checkpointInterval
+
+        # List of scenarios. Each scenario is a dict in the following format:
+        # {
+        #     "model": String,
+        #     "environment": String,
+        #     "maxCycles": int,
+        #     "globalAlgo": String,
+        #     "localAlgo": String,
+        #     "strideAlgo": String,
+        #     "strideParams": dict|None,
+        #     "globalParams": dict|None,
+        #     "fastForward": bool,
+        #     "surface": bool,
+        # }
+        self._scenarios = []
+
+        # List of results, one dict per scenario with keys in COLUMNS.
+        self._results = []
+
+    def setupSweep(
+        self,
+        models=None,
+        environments=None,
+        maxCycles=200,
+        globalAlgos=None,
+        localAlgos=None,
+        strideAlgos=None,
+        strideParams=None,
+        fastForward=True,
+        globalParams=None,
+        surface=False,
+    ):
+        """
+        Generates the scenarios from the Cartesian product of the options.
+
+        Parameters
+        ----------
+        models: List of Strings|None
+            PVSource cell models. If None, ["Ideal"].
+        environments: List of Strings|None
+            PVEnvironment profiles in External/. If None, ["SingleCell.json"].
+        maxCycles: int
+            Maximum number of cycles to execute each scenario for.
+        globalAlgos: List of Strings|None
+            Global MPPT algorithms. If None, ["Voltage Sweep"].
+        localAlgos: List of Strings|None
+            Local MPPT algorithms. If None, ["PandO"].
+        strideAlgos: List of Strings|None
+            MPPT stride algorithms. If None, ["Fixed"].
+        strideParams: List of dicts|None
+            Stride model keyword arguments, i.e. [{"minStride": 0.01},
+            {"minStride": 0.02}]. A None entry, or a None list, uses the stride
+            model defaults.
+        fastForward: bool
+            Whether to fast forward each scenario across periodic steady
+            states. This does not change the results.
+        globalParams: List of dicts|None
+            Global MPPT algorithm keyword parameters, i.e.
+            [None, {"coarseStride": 0.5}]. A None entry, or a None list, uses
+            the algorithm defaults.
+        surface: bool
+            Whether to precompute the source response of each scenario before
+            running it (see DataController.setupSurface). The source current
+            is then interpolated from the IV curve of each cycle.
+
+        Return
+        ------
+        int: The number of scenarios generated.
+        """
+        if models is None:
+            models = ["Ideal"]
+        if environments is None:
+            environments = ["SingleCell.json"]
+        if globalAlgos is None:
+            globalAlgos = ["Voltage Sweep"]
+        if localAlgos is None:
+            localAlgos = ["PandO"]
+        if strideAlgos is None:
+            strideAlgos = ["Fixed"]
+        if strideParams is None:
+            strideParams = [None]
+        if globalParams is None:
+            globalParams = [None]
+
+        self._scenarios = [
+            {
+                "model": model,
+                "environment": environment,
+                "maxCycles": maxCycles,
+                "globalAlgo": globalAlgo,
+                "localAlgo": localAlgo,
+                "strideAlgo": strideAlgo,
+                "strideParams": params,
+                "globalParams": globalAlgoParams,
+                "fastForward": fastForward,
+                "surface": surface,
+            }
+            for (
+                model,
+                environment,
+                globalAlgo,
+                globalAlgoParams,
+                localAlgo,
+                strideAlgo,
+                params,
+            ) in itertools.product(
+                models,
+                environments,
+                globalAlgos,
+                globalParams,
+                localAlgos,
+                strideAlgos,
+                strideParams,
+            )
+        ]
+        self._results = []
+        return len(self._scenarios)
+
+    @classmethod
+    def fromJSON(
+        cls, fileName, numProcesses=None, checkpointDir=None, checkpointInterval=10000
+    ):
+        """
+        Builds a SweepController from a JSON file, where each key is a
+        keyword argument of setupSweep.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the sweep definition, i.e. a file containing
+            {"localAlgos": ["PandO", "IC"], "strideAlgos": ["Fixed", "Optimal"]}.
+        numProcesses: int|None
+            Number of worker processes. If None, one per CPU is used.
+        checkpointDir: String|None
+            Directory holding the checkpoints and results of each scenario. If
+            None, the sweep is not checkpointed.
+        checkpointInterval: int
+            Number of cycles between the checkpoints of each scenario.
+
+        Return
+        ------
+        SweepController: The sweep, with its scenarios generated.
+        """
+        with open(fileName) as file:
+            params = json.load(file)
+        sweep = cls(numProcesses, checkpointDir, checkpointInterval)
+        sweep.setupSweep(**params)
+        return sweep
+
+    def getScenarios(self):
+        """
+        Returns the scenarios of the sweep.
+
+        Return
+        ------
+        list: The scenario dicts.
+        """
+        return self._scenarios
+
+    def runSweep(self):
+        """
+        Runs every scenario across the process pool. Scenarios that raise an
+        exception are recorded with their error message instead of halting
+        the sweep. If checkpointed, completed scenarios are not rerun.
+
+        Return
+        ------
+        list: The results of each scenario, in scenario order.
+        """
+        if self._checkpointDir is not None:
+            os.makedirs(self._checkpointDir, exist_ok=True)
+
+        run = functools.partial(
+            runScenario,
+            checkpointDir=self._checkpointDir,
+            checkpointInterval=self._checkpointInterval,
+        )
+        if self._numProcesses == 1:
+            self._results = [run(scenario) for scenario in self._scenarios]
+        else:
+            with ProcessPoolExecutor(max_workers=self._numProcesses) as executor:
+                self._results = list(executor.map(run, self._scenarios))
+        return self._results
+
+    def getResults(self):
+        """
+        Returns the results of the last sweep.
+
+        Return
+        ------
+        list: The results of each scenario, with keys in COLUMNS.
+        """
+        return self._results
+
+    def writeResults(self, fileName):
+        """
+        Writes the results table of the last sweep to a CSV file.
+
+        Parameters
+        ----------
+        fileName: String
+            Path of the file to write.
+        """
+        with open(fileName, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=SweepController.COLUMNS)
+            writer.writeheader()
+            for result in self._results:
+                row = dict(result)
+                row["strideParams"] = json.dumps(row["strideParams"])
+                row["globalParams"] = json.dumps(row["globalParams"])
+                writer.writerow(row)
+
+
+def runScenario(scenario, checkpointDir=None, checkpointInterval=10000):
+    """
+    Runs a single scenario of the sweep to completion. This is a module level
+    function so it can be sent to worker processes.
+
+    Parameters
+    ----------
+    scenario: dict
+        The scenario to run. See SweepController.
+    checkpointDir: String|None
+        Directory holding the checkpoints and results of each scenario. If the
+        scenario already has a result there, it is returned; if it has a
+        checkpoint, the scenario is resumed from it.
+    checkpointInterval: int
+        Number of cycles between checkpoints.
+
+    Return
+    ------
+    dict: The scenario and its metrics, with keys in SweepController.COLUMNS.
+    """
+    checkpoint = None
+    if checkpointDir is not None:
+        name = hashlib.sha1(json.dumps(scenario, sort_keys=True).encode()).hexdigest()
+        checkpoint = os.path.join(checkpointDir, name + ".pkl")
+        resultFile = os.path.join(checkpointDir, name + ".json")
+        if os.path.exists(resultFile):
+            with open(resultFile) as file:
+                return json.load(file)
+
+    result = {column: None for column in SweepController.COLUMNS}
+    for column in SweepController.COLUMNS:
+        if column in scenario:
+            result[column] = scenario[column]
+
+    startTime = time.time()
+    try:
+        if checkpoint is not None and os.path.exists(checkpoint):
+            controller = DataController.loadCheckpoint(checkpoint)
+        else:
+            controller = DataController()
+            controller.setupFastForward(scenario["fastForward"])
+            controller.setupSurface(scenario.get("surface", False))
+            controller.resetPipeline(
+                scenario["model"],
+                scenario["environment"],
+                scenario["maxCycles"],
+                scenario["globalAlgo"],
+                scenario["localAlgo"],
+                scenario["strideAlgo"],
+                scenario["strideParams"],
+                globalParams=scenario.get("globalParams"),
+            )
+            controller.setupCheckpoint(checkpoint, checkpointInterval)
+
+        continueBool = True
+        while continueBool:
+            (_, continueBool) = controller.iteratePipelineCycleMPPT()
+
+        (energy, theoreticalEnergy) = controller.getEnergy()
+        result["energy"] = energy
+        result["theoreticalEnergy"] = theoreticalEnergy
+        result["sweepLoss"] = controller.getSweepLoss()
+        rescans = controller.getRescanCounts()
+        result["partialRescans"] = rescans["partial"]
+        result["fullRescans"] = rescans["full"]
+        result["trackingEff"] = 0.0
+        if theoreticalEnergy > 0:
+            result["trackingEff"] = energy / theoreticalEnergy
+        metrics = controller.getMetrics(SweepController.THRESHOLD)
+        for column in [
+            "cyclesBelowThreshold",
+            "settlingTime",
+            "oscillation",
+            "unsettledSteps",
+            "numCycles",
+        ]:
+            result[column] = metrics[column]
+    except Exception as e:
+        result["error"] = str(e)
+    result["runTime"] = time.time() - startTime
+
+    if checkpoint is not None and result["error"] is None:
+        tempFileName = resultFile + ".tmp"
+        with open(tempFileName, "w") as file:
+            json.dump(result, file)
+        os.replace(tempFileName, resultFile)
+
+    return result
+
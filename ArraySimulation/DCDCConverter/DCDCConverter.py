@@ -4,7 +4,7 @@ DCDCConverter.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/18/20
-Last Modified: 02/27/21
+Last Modified: 10/19/26
 
 Description: Implementation of the DCDCConverter class.
 
@@ -18,7 +18,7 @@ This class is still useful, however, since it provides a base template for
 translation into C/C++ embedded code for the actual MPPT.
 """
 # Library Imports.
-
+from math import exp
 
 # Custom Imports.
 
@@ -44,7 +44,14 @@ class DCDCConverter:
         # more power that can be transmitted without being lost as heat.
         self.loadVoltage = 0
 
-    def setup(self, arrayVoltage=0.0, loadVoltage=0.6):
+        # The array voltage the converter is driving towards.
+        self.targetVoltage = 0
+
+        # Time constant (s) of the array voltage settling to the target
+        # voltage. When 0, the array voltage is applied instantly.
+        self.settlingTime = 0
+
+    def setup(self, arrayVoltage=0.0, loadVoltage=0.6, settlingTime=0.0):
         """
         Sets up initial values for the DC-DC converter.
 
@@ -55,18 +62,25 @@ class DCDCConverter:
         loadVoltage: float
             Initial load voltage. This is the battery in the case of the solar
             array.
+        settlingTime: float
+            Time constant, in seconds, of the array voltage settling to a new
+            target voltage. See step().
 
         Returns:
             - None
         """
         self.arrayVoltage = arrayVoltage
+        self.targetVoltage = arrayVoltage
         self.loadVoltage = loadVoltage
+        self.settlingTime = settlingTime
         self.pulseWidth = 0
 
     def setPulseWidth(self, MPPTTargetVoltage):
         """
         Generates a pulse width from an expected target voltage based on the
-        load voltage.
+        load voltage. If the converter has no settling time, the array voltage
+        is applied instantly. Otherwise, the array voltage moves towards the
+        target as the converter is stepped.
 
         Parameters
         ----------
@@ -75,7 +89,27 @@ class DCDCConverter:
         """
         if MPPTTargetVoltage > 0.0:
             self.pulseWidth = 1 - self.loadVoltage / MPPTTargetVoltage
-            self.arrayVoltage = MPPTTargetVoltage
+            self.targetVoltage = MPPTTargetVoltage
+            if self.settlingTime <= 0:
+                self.arrayVoltage = MPPTTargetVoltage
+
+    def step(self, dt):
+        """
+        Advances the converter by a time step. The array voltage settles
+        towards the target voltage as a first order system with a time
+        constant of settlingTime.
+
+        Parameters
+        ----------
+        dt: float
+            Time step in seconds.
+        """
+        if self.settlingTime <= 0:
+            self.arrayVoltage = self.targetVoltage
+        else:
+            self.arrayVoltage += (self.targetVoltage - self.arrayVoltage) * (
+                1 - exp(-dt / self.settlingTime)
+            )
 
     def getPulseWidth(self):
         """
@@ -109,7 +143,7 @@ class DCDCConverter:
         ------
         float: expected array voltage
         """
-        return self.array_voltage
+        return self.arrayVoltage
 
     def reset(self):
         """
@@ -117,4 +151,5 @@ class DCDCConverter:
         """
         self.pulseWidth = 0
         self.arrayVoltage = 0
+        self.targetVoltage = 0
         self.loadVoltage = 0
@@ -0,0 +1,141 @@
+"""
+BatchMPPT.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Implementation of the BatchMPPT class, the vectorized counterpart
+of the MPPT class for N independent trackers run in lockstep.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchBisection import BatchBisection
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchFC import BatchFC
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchGolden import BatchGolden
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchIC import BatchIC
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchPandO import BatchPandO
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchTernary import BatchTernary
+
+
+class BatchMPPT:
+    """
+    The BatchMPPT class is a concrete class that manages N trackers running the
+    same local MPPT algorithm and stride model. Each tracker behaves like an
+    MPPT set up with the default global algorithm: its reference voltage is
+    clamped to [0, MAX_VOLTAGE].
+    """
+
+    # The upper voltage bound for a single cell. See GlobalMPPTAlgorithm.
+    MAX_VOLTAGE_PER_CELL = 0.8
+
+    def __init__(self):
+        self._model = None
+        self._maxVoltage = 0.0
+
+    def setupModel(
+        self,
+        numTrackers=1,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+    ):
+        """
+        Initializes an internal model object for reference.
+
+        Parameters
+        ----------
+        numTrackers: int
+            Number of independent trackers.
+        numCells: int
+            Number of cells expected by the MPPT model.
+        MPPTLocalAlgoType: String
+            The name of the local MPPT algorithm type.
+        strideType: String
+            The name of the stride algorithm type.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor, i.e.
+            {"minStride": 0.02, "error": 0.1}.
+        """
+        self._maxVoltage = round(BatchMPPT.MAX_VOLTAGE_PER_CELL * numCells, 2)
+
+        if MPPTLocalAlgoType == "Bisection":
+            self._model = BatchBisection(numTrackers, numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "FC":
+            self._model = BatchFC(numTrackers, numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "Golden":
+            self._model = BatchGolden(numTrackers, numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "IC":
+            self._model = BatchIC(numTrackers, numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "PandO":
+            self._model = BatchPandO(numTrackers, numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "Ternary":
+            self._model = BatchTernary(numTrackers, numCells, strideType, strideParams)
+        else:
+            self._model = BatchLocalMPPTAlgorithm(
+                numTrackers, numCells, MPPTLocalAlgoType, strideType, strideParams
+            )
+
+    def reset(self, mask=None):
+        """
+        Resets some or all trackers.
+
+        Parameters
+        ----------
+        mask: numpy array|None
+            Boolean array selecting the trackers to reset. If None, every
+            tracker is reset.
+        """
+        if self._model is not None:
+            self._model.reset(mask)
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        """
+        Calculates the reference voltage of every tracker. See
+        BatchLocalMPPTAlgorithm.getReferenceVoltages.
+
+        Return
+        ------
+        numpy array: The reference voltage of each tracker.
+        """
+        vRefs = self._model.getReferenceVoltages(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+        return np.clip(vRefs, 0.0, self._maxVoltage)
+
+    def getNumTrackers(self):
+        """
+        Returns the number of independent trackers.
+
+        Return
+        ------
+        int: The number of trackers.
+        """
+        return self._model.getNumTrackers()
+
+    def getLocalMPPTType(self):
+        """
+        Returns the Local MPPT type used for the simulation.
+
+        Return
+        ------
+        String: Model type name.
+        """
+        return self._model.getLocalMPPTType()
+
+    def getStrideType(self):
+        """
+        Returns the Stride model type used for the simulation.
+
+        Return
+        ------
+        String: Stride type name.
+        """
+        return self._model.getStrideType()
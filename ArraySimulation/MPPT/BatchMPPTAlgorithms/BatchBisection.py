@@ -0,0 +1,77 @@
+"""
+BatchBisection.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Bisection divide and conquer
+algorithm. See Bisection for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+
+
+class BatchBisection(BatchLocalMPPTAlgorithm):
+    """
+    The BatchBisection class is a derived class of BatchLocalMPPTAlgorithm,
+    running the Bisection algorithm for every tracker.
+    """
+
+    # Error tuning parameter.
+    error = 0.01
+
+    def __init__(
+        self, numTrackers=1, numCells=1, strideType="Fixed", strideParams=None
+    ):
+        super(BatchBisection, self).__init__(
+            numTrackers, numCells, "Bisection", strideType, strideParams
+        )
+
+        # Current algorithm internal cycle of each tracker.
+        self.cycle = np.zeros(numTrackers, dtype=int)
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        (arrVoltages, arrCurrents, irradiances, temperatures) = self._asArrays(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+        if not np.all((self.cycle == 0) | (self.cycle == 1)):
+            raise Exception("self.cycle is not 0 or 1.")
+        vRefs = np.zeros(self._numTrackers)
+        pNew = arrVoltages * arrCurrents
+
+        # Cycle 1: move the bound on the side of the MPP the tracker is on.
+        # Evaluated first, since cycle 0 trackers are moved to cycle 1.
+        search = self.cycle == 1
+        dV = arrVoltages - self.vOld
+        slopes = np.zeros(self._numTrackers)
+        moved = search & (dV != 0)  # Prevent divide by 0 issues.
+        slopes[moved] = (pNew[moved] - self.pOld[moved]) / dV[moved]
+        hold = search & (np.abs(slopes) <= BatchBisection.error)
+        left = search & ~hold & (slopes > 0)
+        right = search & ~hold & ~(slopes > 0)
+        self.leftBound[left] = arrVoltages[left]
+        self.rightBound[right] = arrVoltages[right]
+        vRefs[hold] = arrVoltages[hold]
+        vRefs[left | right] = (self.leftBound + self.rightBound)[left | right] / 2
+
+        # Cycle 0: start at the midpoint of the bounds.
+        start = self.cycle == 0
+        vRefs[start] = (self.leftBound[start] + self.rightBound[start]) / 2
+        self.vOld[start] = self.leftBound[start]
+        self.vOld[search] = arrVoltages[search]
+        self.pOld = np.array(pNew)
+        self.cycle[start] = 1
+
+        return vRefs
+
+    def reset(self, mask=None):
+        super(BatchBisection, self).reset(mask)
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self.cycle[mask] = 0
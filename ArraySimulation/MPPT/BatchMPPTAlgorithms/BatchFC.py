@@ -0,0 +1,64 @@
+"""
+BatchFC.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized FC hill climbing algorithm. See
+FC for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+
+
+class BatchFC(BatchLocalMPPTAlgorithm):
+    """
+    The BatchFC class is a derived class of BatchLocalMPPTAlgorithm, running
+    the FC algorithm for every tracker.
+    """
+
+    # Error tuning parameter.
+    error = 0.05
+
+    def __init__(
+        self, numTrackers=1, numCells=1, strideType="Fixed", strideParams=None
+    ):
+        super(BatchFC, self).__init__(
+            numTrackers, numCells, "FC", strideType, strideParams
+        )
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        (arrVoltages, arrCurrents, irradiances, temperatures) = self._asArrays(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+        arrPower = arrCurrents * arrVoltages
+        dP = arrPower - self.pOld
+        dV = arrVoltages - self.vOld
+        strides = self._strideModel.getStrides(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+
+        # Trackers without a change in voltage are nudged to prevent divide by
+        # 0 issues.
+        still = dV == 0
+        slopes = np.zeros(len(dV))
+        slopes[~still] = dP[~still] / dV[~still]
+        hold = ~still & (np.abs(slopes) < BatchFC.error)
+        increase = ~still & ~hold & (slopes > 0)
+        decrease = ~still & ~hold & ~(slopes > 0)
+
+        vRefs = arrVoltages.copy()
+        vRefs[still] += 0.005
+        vRefs[increase] += strides[increase]
+        vRefs[decrease] -= strides[decrease]
+
+        self.vOld = arrVoltages.copy()
+        self.iOld = arrCurrents.copy()
+        self.pOld = arrVoltages * arrCurrents
+        return vRefs
@@ -0,0 +1,105 @@
+"""
+BatchGolden.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Golden Section Search divide and
+conquer algorithm. See Golden for the derivation.
+"""
+# Library Imports.
+from math import sqrt
+
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+
+
+class BatchGolden(BatchLocalMPPTAlgorithm):
+    """
+    The BatchGolden class is a derived class of BatchLocalMPPTAlgorithm,
+    running the Golden algorithm for every tracker.
+    """
+
+    phi = (sqrt(5) + 1) / 2 - 1
+
+    def __init__(
+        self, numTrackers=1, numCells=1, strideType="Fixed", strideParams=None
+    ):
+        super(BatchGolden, self).__init__(
+            numTrackers, numCells, "Golden", strideType, strideParams
+        )
+
+        # Current algorithm internal cycle of each tracker.
+        self.cycle = np.zeros(numTrackers, dtype=int)
+
+        # New left and right bounds of each tracker.
+        self.l1 = self.leftBound.copy()
+        self.l2 = self.rightBound.copy()
+
+        # Power associated with the new left and right bounds.
+        self.powerL1 = np.zeros(numTrackers)
+        self.powerL2 = np.zeros(numTrackers)
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        (arrVoltages, arrCurrents, irradiances, temperatures) = self._asArrays(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+        if not np.all((self.cycle >= 0) & (self.cycle <= 3)):
+            raise Exception("self.cycle is not 0, 1, 2 or 3.")
+        vRefs = np.zeros(self._numTrackers)
+        power = arrVoltages * arrCurrents
+        (start, probe) = (self.cycle == 0, self.cycle == 1)
+        search = self.cycle >= 2
+
+        # Cycle 0 and 1: probe the left and then right goalposts.
+        width = self.rightBound - self.leftBound
+        self.l1[start] = self.rightBound[start] - width[start] * BatchGolden.phi
+        vRefs[start] = self.l1[start]
+        self.powerL1[probe] = power[probe]
+        self.l2[probe] = width[probe] * BatchGolden.phi + self.leftBound[probe]
+        vRefs[probe] = self.l2[probe]
+
+        # Cycle 2 and 3: record the power of the goalpost just probed, drop the
+        # side of the bounds without the MPP, and probe the new goalpost.
+        self.powerL2[self.cycle == 2] = power[self.cycle == 2]
+        self.powerL1[self.cycle == 3] = power[self.cycle == 3]
+        shrinkRight = search & (self.powerL1 > self.powerL2)
+        shrinkLeft = search & ~shrinkRight
+
+        self.rightBound[shrinkRight] = self.l2[shrinkRight]
+        self.l2[shrinkRight] = self.l1[shrinkRight]
+        self.powerL2[shrinkRight] = self.powerL1[shrinkRight]
+
+        self.leftBound[shrinkLeft] = self.l1[shrinkLeft]
+        self.l1[shrinkLeft] = self.l2[shrinkLeft]
+        self.powerL1[shrinkLeft] = self.powerL2[shrinkLeft]
+
+        width = self.rightBound - self.leftBound
+        self.l1[shrinkRight] = (
+            self.rightBound[shrinkRight] - width[shrinkRight] * BatchGolden.phi
+        )
+        vRefs[shrinkRight] = self.l1[shrinkRight]
+        self.l2[shrinkLeft] = (
+            width[shrinkLeft] * BatchGolden.phi + self.leftBound[shrinkLeft]
+        )
+        vRefs[shrinkLeft] = self.l2[shrinkLeft]
+
+        self.cycle[start] = 1
+        self.cycle[probe | shrinkLeft] = 2
+        self.cycle[shrinkRight] = 3
+        return vRefs
+
+    def reset(self, mask=None):
+        super(BatchGolden, self).reset(mask)
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self.cycle[mask] = 0
+        self.l1[mask] = self.leftBound[mask]
+        self.l2[mask] = self.rightBound[mask]
+        self.powerL1[mask] = 0
+        self.powerL2[mask] = 0
@@ -0,0 +1,67 @@
+"""
+BatchIC.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Incremental Conductance hill
+climbing algorithm. See IC for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+
+
+class BatchIC(BatchLocalMPPTAlgorithm):
+    """
+    The BatchIC class is a derived class of BatchLocalMPPTAlgorithm, running
+    the IC algorithm for every tracker.
+    """
+
+    # Error tuning parameter.
+    error = 0.01
+
+    def __init__(
+        self, numTrackers=1, numCells=1, strideType="Fixed", strideParams=None
+    ):
+        super(BatchIC, self).__init__(
+            numTrackers, numCells, "IC", strideType, strideParams
+        )
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        (arrVoltages, arrCurrents, irradiances, temperatures) = self._asArrays(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+
+        # Compute secondary values.
+        dI = arrCurrents - self.iOld
+        dV = arrVoltages - self.vOld
+
+        # Determine the stride.
+        strides = self._strideModel.getStrides(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+
+        # Determine the direction of movement and VREF.
+        conductance = dI * arrVoltages + arrCurrents * dV
+        atMPP = np.abs(conductance) < BatchIC.error
+        left = ~atMPP & (conductance > BatchIC.error)
+        right = ~atMPP & (conductance < -BatchIC.error)
+        if not np.all(atMPP | left | right):
+            raise Exception(
+                "[BatchIC][getReferenceVoltages] Invalid region of interest."
+            )
+        vRefs = arrVoltages.copy()
+        vRefs[left] += strides[left]
+        vRefs[right] -= strides[right]
+
+        # Update dependent values.
+        self.iOld = arrCurrents.copy()
+        self.vOld = arrVoltages.copy()
+
+        return vRefs
@@ -0,0 +1,218 @@
+"""
+BatchLocalMPPTAlgorithm.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the BatchLocalMPPTAlgorithm class, the
+vectorized counterpart of the LocalMPPTAlgorithm class.
+
+A batch algorithm advances N independent trackers in lockstep. Its state is
+kept as a struct of arrays: each scalar attribute of the LocalMPPTAlgorithm
+(vOld, pOld, leftBound, ...) is a numpy array with one value per tracker, and
+each branch of the scalar algorithm is applied to the trackers taking it
+through a boolean mask. Each tracker behaves exactly like the scalar algorithm
+of the same type given the same inputs, so Monte Carlo studies over thousands
+of scenarios run as a single array program.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPTComponents.BatchAdaptiveStride import (
+    BatchAdaptiveStride,
+)
+from ArraySimulation.MPPT.MPPTComponents.BatchBisectionStride import (
+    BatchBisectionStride,
+)
+from ArraySimulation.MPPT.MPPTComponents.BatchOptimalStride import BatchOptimalStride
+from ArraySimulation.MPPT.MPPTComponents.BatchStride import BatchStride
+
+
+class BatchLocalMPPTAlgorithm:
+    """
+    The BatchLocalMPPTAlgorithm class provides the base API for derived classes
+    to calculate the voltage setpoints of N trackers at once.
+    """
+
+    # The upper voltage bound that should be predicted by any model. Adjustable
+    # based on the number of cells determined from the initialization.
+    MAX_VOLTAGE = 100
+
+    # The upper voltage bound for a single cell that should be predicted by any
+    # model. See LocalMPPTAlgorithm.
+    MAX_VOLTAGE_PER_CELL = 0.8
+
+    def __init__(
+        self,
+        numTrackers=1,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+    ):
+        """
+        Sets up the initial source parameters.
+
+        Parameters
+        ----------
+        numTrackers: int
+            The number of independent trackers.
+        numCells: int
+            The number of cells that should be accounted for in the MPPT
+            algorithm.
+        MPPTLocalAlgoType: String
+            The name of the local MPPT algorithm type.
+        strideType: String
+            The name of the stride algorithm type.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor, i.e.
+            {"minStride": 0.02, "error": 0.1}. If None, the stride model
+            defaults are used.
+        """
+        BatchLocalMPPTAlgorithm.MAX_VOLTAGE = (
+            numCells * BatchLocalMPPTAlgorithm.MAX_VOLTAGE_PER_CELL
+        )
+        self._numTrackers = numTrackers
+        self._MPPTLocalAlgoType = MPPTLocalAlgoType
+
+        if strideParams is None:
+            strideParams = {}
+        if strideType == "Adaptive":
+            self._strideModel = BatchAdaptiveStride(numTrackers, **strideParams)
+        elif strideType == "Bisection":
+            self._strideModel = BatchBisectionStride(numTrackers, **strideParams)
+        elif strideType == "Optimal":
+            self._strideModel = BatchOptimalStride(numTrackers, **strideParams)
+        elif strideType == "Fixed":
+            self._strideModel = BatchStride(numTrackers, **strideParams)
+        else:
+            self._strideModel = BatchStride(numTrackers, **strideParams)
+
+        # Previous array voltage, current, and power of each tracker.
+        self.vOld = np.zeros(numTrackers)
+        self.iOld = np.zeros(numTrackers)
+        self.pOld = np.zeros(numTrackers)
+
+        # Bounds of each tracker. A naive assumption is that the function
+        # within these bounds are unimodal.
+        self.leftBound = np.zeros(numTrackers)
+        self.rightBound = np.full(numTrackers, BatchLocalMPPTAlgorithm.MAX_VOLTAGE)
+
+    def getNumTrackers(self):
+        """
+        Returns the number of independent trackers.
+
+        Return
+        ------
+        int: The number of trackers.
+        """
+        return self._numTrackers
+
+    def setup(self, VMPP=0.621, leftBound=0, rightBound=None, mask=None):
+        """
+        Reinitializes the predicted parameters of some or all trackers.
+
+        Parameters
+        ----------
+        VMPP: float|numpy array
+            The voltage of the Maximum Power Point.
+        leftBound: float|numpy array
+            Left voltage bound of the search.
+        rightBound: float|numpy array|None
+            Right voltage bound of the search. If None, MAX_VOLTAGE.
+        mask: numpy array|None
+            Boolean array selecting the trackers to set up. If None, every
+            tracker is set up.
+        """
+        if rightBound is None:
+            rightBound = BatchLocalMPPTAlgorithm.MAX_VOLTAGE
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self.leftBound[mask] = np.broadcast_to(leftBound, self._numTrackers)[mask]
+        self.rightBound[mask] = np.broadcast_to(rightBound, self._numTrackers)[mask]
+        self._strideModel.setup(VMPP, mask=mask)
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        """
+        Calculates the reference voltage of every tracker for its PVSource
+        input. May use prior history.
+
+        Parameters
+        ----------
+        arrVoltages: numpy array
+            Array voltage of each tracker in V.
+        arrCurrents: numpy array
+            Array current of each tracker in A.
+        irradiances: numpy array
+            Irradiance of each tracker in W/M^2 (G)
+        temperatures: numpy array
+            Cell Temperature of each tracker in C.
+
+        Return
+        ------
+        numpy array: The reference voltage that should be applied to each array
+        in the next cycle.
+
+        Assumptions
+        -----------
+        The same as LocalMPPTAlgorithm.getReferenceVoltage, for each tracker.
+        """
+        return np.zeros(self._numTrackers)
+
+    def reset(self, mask=None):
+        """
+        Resets any internal variables set by the MPPT algorithm during
+        operation.
+
+        Parameters
+        ----------
+        mask: numpy array|None
+            Boolean array selecting the trackers to reset. If None, every
+            tracker is reset.
+        """
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self._strideModel.reset(mask)
+        self.vOld[mask] = 0.0
+        self.iOld[mask] = 0.0
+        self.pOld[mask] = 0.0
+        self.leftBound[mask] = 0
+        self.rightBound[mask] = BatchLocalMPPTAlgorithm.MAX_VOLTAGE
+
+    def getLocalMPPTType(self):
+        """
+        Returns the Local MPPT algorithm type used for the simulation.
+
+        Return
+        ------
+        String: Model type name.
+        """
+        return self._MPPTLocalAlgoType
+
+    def getStrideType(self):
+        """
+        Returns the Stride model type used for the simulation.
+
+        Return
+        ------
+        String: Model type name.
+        """
+        return self._strideModel.getStrideType()
+
+    @staticmethod
+    def _asArrays(*values):
+        """
+        Converts the inputs of getReferenceVoltages to float arrays.
+
+        Parameters
+        ----------
+        values: list|numpy array
+            One value per tracker, per input.
+
+        Return
+        ------
+        tuple: The inputs as numpy arrays.
+        """
+        return tuple(np.asarray(value, dtype=float) for value in values)
@@ -0,0 +1,60 @@
+"""
+BatchPandO.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Perturb and Observe hill climbing
+algorithm. See PandO for the derivation.
+"""
+# Library Imports.
+
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+
+
+class BatchPandO(BatchLocalMPPTAlgorithm):
+    """
+    The BatchPandO class is a derived class of BatchLocalMPPTAlgorithm, running
+    the PandO algorithm for every tracker.
+    """
+
+    def __init__(
+        self, numTrackers=1, numCells=1, strideType="Fixed", strideParams=None
+    ):
+        super(BatchPandO, self).__init__(
+            numTrackers, numCells, "PandO", strideType, strideParams
+        )
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        (arrVoltages, arrCurrents, irradiances, temperatures) = self._asArrays(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+
+        # Compute secondary values.
+        pIn = arrVoltages * arrCurrents
+        dV = arrVoltages - self.vOld
+        dP = pIn - self.pOld
+
+        # Determine the stride.
+        strides = self._strideModel.getStrides(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+
+        # Determine the direction of movement and VREF.
+        rising = dP > 0
+        increase = (rising & (dV > 0)) | (~rising & (dV < 0))
+        decrease = (rising & (dV < 0)) | (~rising & (dV > 0))
+        vRefs = arrVoltages.copy()
+        vRefs[increase] += strides[increase]
+        vRefs[decrease] -= strides[decrease]
+
+        # Update dependent values.
+        self.vOld = arrVoltages.copy()
+        self.pOld = pIn
+
+        return vRefs
@@ -0,0 +1,84 @@
+"""
+BatchTernary.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Ternary Search divide and conquer
+algorithm. See Ternary for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPTAlgorithms.BatchLocalMPPTAlgorithm import (
+    BatchLocalMPPTAlgorithm,
+)
+
+
+class BatchTernary(BatchLocalMPPTAlgorithm):
+    """
+    The BatchTernary class is a derived class of BatchLocalMPPTAlgorithm,
+    running the Ternary algorithm for every tracker.
+    """
+
+    # Convergence constant.
+    q = 0.33  # Roughly the same as dividing by 3.
+
+    def __init__(
+        self, numTrackers=1, numCells=1, strideType="Fixed", strideParams=None
+    ):
+        super(BatchTernary, self).__init__(
+            numTrackers, numCells, "Ternary", strideType, strideParams
+        )
+
+        # Current algorithm internal cycle of each tracker.
+        self.cycle = np.zeros(numTrackers, dtype=int)
+
+        # New left and right bounds of each tracker.
+        self.l1 = self.leftBound.copy()
+        self.l2 = self.rightBound.copy()
+
+        # Power associated with the new left and right bounds.
+        self.powerL1 = np.zeros(numTrackers)
+        self.powerL2 = np.zeros(numTrackers)
+
+    def getReferenceVoltages(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        (arrVoltages, arrCurrents, irradiances, temperatures) = self._asArrays(
+            arrVoltages, arrCurrents, irradiances, temperatures
+        )
+        if not np.all((self.cycle == 0) | (self.cycle == 1)):
+            raise Exception("self.cycle is not 0 or 1.")
+        vRefs = np.zeros(self._numTrackers)
+        power = arrVoltages * arrCurrents
+        (first, second) = (self.cycle == 0, self.cycle == 1)
+
+        # Cycle 0: drop the third of the bounds without the MPP and probe the
+        # left goalpost.
+        self.powerL2[first] = power[first]
+        shrinkRight = first & (self.powerL1 > self.powerL2)
+        shrinkLeft = first & ~shrinkRight
+        self.rightBound[shrinkRight] = self.l2[shrinkRight]
+        self.leftBound[shrinkLeft] = self.l1[shrinkLeft]
+        width = self.rightBound - self.leftBound
+        self.l1[first] = width[first] * self.q + self.leftBound[first]
+        vRefs[first] = self.l1[first]
+
+        # Cycle 1: probe the right goalpost.
+        self.powerL1[second] = power[second]
+        self.l2[second] = self.rightBound[second] - width[second] * self.q
+        vRefs[second] = self.l2[second]
+
+        self.cycle = 1 - self.cycle
+        return vRefs
+
+    def reset(self, mask=None):
+        super(BatchTernary, self).reset(mask)
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self.cycle[mask] = 0
+        self.l1[mask] = self.leftBound[mask]
+        self.l2[mask] = self.rightBound[mask]
+        self.powerL1[mask] = 0
+        self.powerL2[mask] = 0
@@ -4,9 +4,34 @@ GlobalMPPTAlgorithm.py
 Author: Afnan Mir, Array Lead (2021).
 Contact: afnanmir@utexas.edu
 Created: 02/06/2021
-Last Modified: 02/27/2021
+Last Modified: 10/19/2026
 
 Description: Implementation of the GlobalMPPTAlgorithm class.
+
+Derived classes that search for the global maximum can search again when the
+P-V curve changes while the LocalMPPTAlgorithm is tracking. Each cycle, the
+power and irradiance are compared to the last cycle. A uniform change in
+irradiance scales the power by roughly the same ratio and leaves the maxima
+where they are, so it is left to the LocalMPPTAlgorithm. A change in power not
+explained by the irradiance (i.e. a change in shading) may have moved the
+global maximum, and triggers either a partial rescan of the basins around the
+tracked voltage or, for large changes, a full rescan. Each rescan costs the
+cycles spent searching, so when shading changes faster than the search
+completes, rescanning loses more energy than tracking a stale maximum. Change
+detection is tuned with the globalParams of the derived class:
+
+    {
+        "rescan": False,        <-  Whether changes trigger a rescan.
+        "powerThreshold": 0.1,  <-  Relative power change not explained by
+                                    the irradiance (|dP/P - dG/G|) that
+                                    triggers a partial rescan.
+        "fullThreshold": 0.3,   <-  Unexplained relative power change that
+                                    triggers a full rescan.
+        "rescanWindow": 0.25,   <-  Half width of the partial rescan,
+                                    relative to MAX_VOLTAGE.
+        "holdoff": 10,          <-  Cycles the LocalMPPTAlgorithm is given to
+                                    settle before changes are detected.
+    }
 """
 # Library Imports.
 
@@ -19,6 +44,8 @@ from ArraySimulation.MPPT.LocalMPPTAlgorithms.FC import FC
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.Ternary import Ternary
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.Golden import Golden
 from ArraySimulation.MPPT.LocalMPPTAlgorithms.Bisection import Bisection
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.Newton import Newton
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.BFGS import BFGS
 
 
 class GlobalMPPTAlgorithm:
@@ -39,12 +66,23 @@ class GlobalMPPTAlgorithm:
     # standard conditions.
     MAX_VOLTAGE_PER_CELL = 0.8
 
+    # The default parameters of the change detection. See the module
+    # description.
+    RESCAN_PARAMS = {
+        "rescan": False,
+        "powerThreshold": 0.1,
+        "fullThreshold": 0.3,
+        "rescanWindow": 0.25,
+        "holdoff": 10,
+    }
+
     def __init__(
         self,
         numCells=1,
         MPPTGlobalAlgoType="Default",
         MPPTLocalAlgoType="Default",
         strideType="Fixed",
+        strideParams=None,
     ):
         """
         Sets up the initial source parameters.
@@ -60,7 +98,8 @@ class GlobalMPPTAlgorithm:
             The name of the local MPPT algorithm type.
         strideType: String
             The name of the stride algorithm type.
-        TODO: Add stride argument to voltage sweep constructor.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor.
         """
         GlobalMPPTAlgorithm.MAX_VOLTAGE = round(
             GlobalMPPTAlgorithm.MAX_VOLTAGE_PER_CELL * numCells, 2
@@ -68,17 +107,21 @@ class GlobalMPPTAlgorithm:
         self._MPPTGlobalAlgoType = MPPTGlobalAlgoType
 
         if MPPTLocalAlgoType == "Bisection":
-            self._model = Bisection(numCells, strideType)
+            self._model = Bisection(numCells, strideType, strideParams)
         elif MPPTLocalAlgoType == "FC":
-            self._model = FC(numCells, strideType)
+            self._model = FC(numCells, strideType, strideParams)
         elif MPPTLocalAlgoType == "Golden":
-            self._model = Golden(numCells, strideType)
+            self._model = Golden(numCells, strideType, strideParams)
         elif MPPTLocalAlgoType == "IC":
-            self._model = IC(numCells, strideType)
+            self._model = IC(numCells, strideType, strideParams)
         elif MPPTLocalAlgoType == "PandO":
-            self._model = PandO(numCells, strideType)
+            self._model = PandO(numCells, strideType, strideParams)
         elif MPPTLocalAlgoType == "Ternary":
-            self._model = Ternary(numCells, strideType)
+            self._model = Ternary(numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "Newton":
+            self._model = Newton(numCells, strideType, strideParams)
+        elif MPPTLocalAlgoType == "BFGS":
+            self._model = BFGS(numCells, strideType, strideParams)
         elif MPPTLocalAlgoType == "Default":
             self._model = MPPTAlgorithm(numCells, MPPTLocalAlgoType, strideType)
         else:
@@ -90,6 +133,9 @@ class GlobalMPPTAlgorithm:
         self.irrOld = 0.0
         self.pOld = 0.0
 
+        self._params = dict(GlobalMPPTAlgorithm.RESCAN_PARAMS)
+        self._resetChangeDetection()
+
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
         """
         Calculates the reference voltage output for the given PVSource output.
@@ -143,6 +189,29 @@ class GlobalMPPTAlgorithm:
         self.pOld = 0.0
         self.irrOld = 0.0
         self.tOld = 0.0
+        self._resetChangeDetection()
+
+    def isSearching(self):
+        """
+        Returns whether the algorithm is searching for the global maximum (i.e.
+        sweeping) rather than tracking it, as of the last reference voltage.
+
+        Return
+        ------
+        bool: Whether the algorithm is searching.
+        """
+        return False
+
+    def getRescanCounts(self):
+        """
+        Returns how many times a change triggered each kind of rescan since the
+        last reset.
+
+        Return
+        ------
+        dict: {"partial": int, "full": int}
+        """
+        return dict(self._rescanCounts)
 
     def getGlobalMPPTType(self):
         """
@@ -187,3 +256,104 @@ class GlobalMPPTAlgorithm:
         The left and right bounds for the global maximum of the P-V curve.
         """
         return (0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+
+    def _setupParams(self, globalParams, defaults):
+        """
+        Merges the globalParams of a derived class over its defaults and the
+        change detection defaults.
+
+        Parameters
+        ----------
+        globalParams: dict|None
+            The parameters passed to the derived class.
+        defaults: dict
+            The default parameters of the derived class.
+        """
+        params = dict(GlobalMPPTAlgorithm.RESCAN_PARAMS, **defaults)
+        if globalParams is None:
+            globalParams = {}
+        for key in globalParams:
+            if key not in params:
+                raise Exception(
+                    "Unknown " + self._MPPTGlobalAlgoType + " parameter: " + key
+                )
+        params.update(globalParams)
+        self._params = params
+
+    def _resetChangeDetection(self):
+        """
+        Resets the change detection state and the rescan counters.
+        """
+        # The (power, irradiance) of the last cycle, and the number of cycles
+        # left before changes are detected.
+        self._lastConditions = None
+        self._holdoff = 0
+        self._rescanCounts = {"partial": 0, "full": 0}
+
+    def _armChangeDetection(self):
+        """
+        Starts detecting changes once the LocalMPPTAlgorithm has had holdoff
+        cycles to settle. Called when it takes over from a search.
+        """
+        self._lastConditions = None
+        self._holdoff = self._params["holdoff"]
+
+    def _detectChange(self, arrPower, irradiance):
+        """
+        Compares the power and irradiance to the last cycle while tracking,
+        counting the rescans triggered.
+
+        Parameters
+        ----------
+        arrPower: float
+            Array power in W.
+        irradiance: float
+            Irradiance in W/M^2 (G)
+
+        Return
+        ------
+        String|None: "partial" or "full" if the global maximum should be
+        searched for again, None otherwise.
+        """
+        (last, self._lastConditions) = (self._lastConditions, (arrPower, irradiance))
+        if self._holdoff > 0:
+            self._holdoff -= 1
+            return None
+        if not self._params["rescan"] or last is None:
+            return None
+
+        (pOld, irrOld) = last
+        dP = (arrPower - pOld) / max(abs(pOld), 1e-3)
+        dG = (irradiance - irrOld) / max(abs(irrOld), 1.0)
+        mismatch = abs(dP - dG)
+        if mismatch >= self._params["fullThreshold"]:
+            change = "full"
+        elif mismatch >= self._params["powerThreshold"]:
+            change = "partial"
+        else:
+            return None
+        self._rescanCounts[change] += 1
+        return change
+
+    def _getRescanWindow(self, change, arrVoltage):
+        """
+        Returns the voltage range to search for the global maximum again.
+
+        Parameters
+        ----------
+        change: String
+            The kind of rescan, "partial" or "full".
+        arrVoltage: float
+            Array voltage in V that was being tracked.
+
+        Return
+        ------
+        tuple: The (left, right) voltages of the rescan.
+        """
+        if change == "full":
+            return (0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+        window = self._params["rescanWindow"] * GlobalMPPTAlgorithm.MAX_VOLTAGE
+        return (
+            round(max(0.0, arrVoltage - window), 2),
+            round(min(GlobalMPPTAlgorithm.MAX_VOLTAGE, arrVoltage + window), 2),
+        )
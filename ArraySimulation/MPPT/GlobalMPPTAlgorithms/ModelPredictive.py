@@ -0,0 +1,198 @@
+"""
+ModelPredictive.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The Model Predictive class is a derived concrete class of
+GlobalAlgorithm that predicts the maximum power point voltage (VMPP) from the
+irradiance and temperature with a cell model (see CellSurrogate), rather than
+searching the P-V curve for it. Whenever the irradiance or temperature has
+changed by more than a threshold since the last prediction, the reference
+voltage jumps to the predicted VMPP, and the LocalMPPTAlgorithm takes over,
+bounded to a window around it, to correct the residual error of the model.
+
+The residual error is mostly systematic (i.e. series resistance or a mismatch
+between the model and the cells), so it is learned: once the LocalMPPTAlgorithm
+has settled, the ratio between the voltage it tracks and the VMPP predicted for
+the same cycle is averaged, and the average scales the next predictions. After
+an irradiance step, the reference voltage is then within the residual error of
+the VMPP in one or two cycles, where algorithms that search take tens of
+cycles.
+
+The model assumes uniform conditions across the string. Under partial shading
+the irradiance passed is a weighted average, and the global maximum may lie
+outside of the window; the algorithm does not search, so the change detection
+parameters of GlobalMPPTAlgorithm have no effect.
+
+The algorithm is tuned with globalParams:
+
+    {
+        "irradianceThreshold": 0.05,    <-  Relative change in irradiance
+                                            since the last prediction that
+                                            triggers a new one.
+        "temperatureThreshold": 2.0,    <-  Change in temperature (C) since
+                                            the last prediction that triggers
+                                            a new one.
+        "window": 0.1,                  <-  Half width of the local tracking
+                                            bounds, relative to the predicted
+                                            VMPP.
+        "learnResidual": True,          <-  Whether the residual error of the
+                                            model scales the predictions.
+        "settleCycles": 10,             <-  Cycles the LocalMPPTAlgorithm
+                                            tracks after a prediction before
+                                            the residual error is learned.
+    }
+"""
+# Library Imports.
+
+
+# Custom Imports.
+from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
+    GlobalMPPTAlgorithm,
+)
+from ArraySimulation.MPPT.MPPTComponents.CellSurrogate import CellSurrogate
+
+
+class ModelPredictive(GlobalMPPTAlgorithm):
+    """
+    The Model Predictive class is a derived concrete class of GlobalAlgorithm
+    that jumps to the VMPP predicted by a cell model and tracks the residual
+    error with the LocalMPPTAlgorithm.
+    """
+
+    # The default parameters of the predictor. See the module description.
+    GLOBAL_PARAMS = {
+        "irradianceThreshold": 0.05,
+        "temperatureThreshold": 2.0,
+        "window": 0.1,
+        "learnResidual": True,
+        "settleCycles": 10,
+    }
+
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+        globalParams=None,
+    ):
+        super(ModelPredictive, self).__init__(
+            numCells, "Model Predictive", MPPTLocalAlgoType, strideType, strideParams
+        )
+
+        self._setupParams(globalParams, ModelPredictive.GLOBAL_PARAMS)
+        self._surrogate = CellSurrogate(numCells)
+        self._resetPrediction()
+
+    def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
+        if self._hasChanged(irradiance, temperature):
+            return self._predict(arrVoltage, irradiance, temperature)
+
+        self._settled += 1
+        if (
+            self._params["learnResidual"]
+            and self._settled > self._params["settleCycles"]
+        ):
+            prediction = self._surrogate.getMPPVoltage(irradiance, temperature)
+            if prediction > 0.0:
+                self._ratioSum += arrVoltage / prediction
+                self._ratioCount += 1
+
+        (lBound, rBound) = self._bounds
+        vRef = self._model.getReferenceVoltage(
+            arrVoltage, arrCurrent, irradiance, temperature
+        )
+        return min(max(vRef, lBound), rBound)
+
+    def reset(self):
+        super(ModelPredictive, self).reset()
+        self._resetPrediction()
+
+    def _resetPrediction(self):
+        """
+        Forgets the last prediction and the learned residual error.
+        """
+        # The (irradiance, temperature) of the last prediction, and the cycles
+        # tracked since.
+        self._conditions = None
+        self._settled = 0
+
+        # The ratio between the VMPP tracked and the VMPP predicted, and the
+        # sum and count of the ratios measured since the last prediction.
+        self._residual = 1.0
+        self._ratioSum = 0.0
+        self._ratioCount = 0
+
+        # The bounds of the local MPPT algorithm.
+        self._bounds = (0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+
+    def _hasChanged(self, irradiance, temperature):
+        """
+        Returns whether the irradiance or temperature has changed enough since
+        the last prediction to predict the VMPP again.
+
+        Parameters
+        ----------
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        bool: Whether the VMPP should be predicted again.
+        """
+        if self._conditions is None:
+            return True
+        (irrOld, tempOld) = self._conditions
+        return (
+            abs(irradiance - irrOld)
+            >= self._params["irradianceThreshold"] * max(irrOld, 1.0)
+            or abs(temperature - tempOld) >= self._params["temperatureThreshold"]
+        )
+
+    def _predict(self, arrVoltage, irradiance, temperature):
+        """
+        Updates the residual error with the ratios measured since the last
+        prediction, and hands over to the local MPPT algorithm at the new one.
+
+        Parameters
+        ----------
+        arrVoltage: float
+            Array voltage in V.
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        float: The predicted VMPP, applied in the next cycle.
+        """
+        # The local MPPT algorithm is bounded to the window, so is the residual.
+        if self._ratioCount > 0:
+            window = self._params["window"]
+            self._residual = min(
+                max(self._ratioSum / self._ratioCount, self._residual * (1 - window)),
+                self._residual * (1 + window),
+            )
+        self._ratioSum = 0.0
+        self._ratioCount = 0
+
+        prediction = self._surrogate.getMPPVoltage(irradiance, temperature)
+        self._conditions = (irradiance, temperature)
+        self._settled = 0
+        vRef = min(prediction * self._residual, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+
+        window = self._params["window"] * vRef
+        self._bounds = (
+            max(0.0, vRef - window),
+            min(GlobalMPPTAlgorithm.MAX_VOLTAGE, vRef + window),
+        )
+        self._model.reset()
+        self._model.setup(vRef, self._bounds[0], self._bounds[1])
+        return vRef
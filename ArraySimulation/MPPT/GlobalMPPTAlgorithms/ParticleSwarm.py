@@ -0,0 +1,232 @@
+"""
+ParticleSwarm.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The Particle Swarm class is a derived concrete class of
+GlobalAlgorithm implementing Particle Swarm Optimization (PSO). A small
+population of particles, each a candidate reference voltage, explores the P-V
+curve. Every cycle, one particle is applied to the array and its power is
+measured. Once every particle has been measured, each particle is pulled
+towards the best voltage it has seen and the best voltage the swarm has seen:
+
+    velocity = inertia * velocity
+        + cognitive * r1 * (personalBest - position)
+        + social * r2 * (globalBest - position)
+    position = position + velocity
+
+where r1 and r2 are uniformly random in [0, 1). Since particles share the
+global best, the swarm escapes local maxima of multi-peak P-V curves and
+usually converges on the global maximum in tens of cycles. Once the particles
+are within tolerance of each other, the LocalMPPTAlgorithm takes over at the
+global best, bounded to a window around it.
+
+While tracking, a detected change (see GlobalMPPTAlgorithm) reinitializes the
+swarm, across the whole voltage range for a full rescan or across a window
+around the tracked voltage for a partial rescan, since the global maximum may
+have moved to another peak.
+
+The algorithm is tuned with globalParams, along with the change detection
+parameters of GlobalMPPTAlgorithm:
+
+    {
+        "numParticles": 5,      <-  Size of the population.
+        "inertia": 0.4,         <-  Weight of the previous velocity.
+        "cognitive": 1.2,       <-  Pull towards the personal best.
+        "social": 1.6,          <-  Pull towards the global best.
+        "tolerance": 0.01,      <-  Convergence spread, relative to
+                                    MAX_VOLTAGE.
+        "maxIterations": 30,    <-  Iterations before converging regardless.
+        "window": 0.05,         <-  Half width of the local tracking bounds,
+                                    relative to MAX_VOLTAGE.
+        "seed": 0,              <-  Seed of the random weights.
+        "rescan": True,         <-  Whether detected changes reinitialize the
+                                    swarm.
+    }
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
+    GlobalMPPTAlgorithm,
+)
+
+
+class ParticleSwarm(GlobalMPPTAlgorithm):
+    """
+    The Particle Swarm class is a derived concrete class of GlobalAlgorithm
+    implementing Particle Swarm Optimization over the reference voltage.
+    """
+
+    # The default parameters of the swarm. See the module description.
+    GLOBAL_PARAMS = {
+        "numParticles": 5,
+        "inertia": 0.4,
+        "cognitive": 1.2,
+        "social": 1.6,
+        "tolerance": 0.01,
+        "maxIterations": 30,
+        "window": 0.05,
+        "seed": 0,
+        "rescan": True,
+    }
+
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+        globalParams=None,
+    ):
+        super(ParticleSwarm, self).__init__(
+            numCells, "Particle Swarm", MPPTLocalAlgoType, strideType, strideParams
+        )
+
+        self._setupParams(globalParams, ParticleSwarm.GLOBAL_PARAMS)
+        if self._params["numParticles"] < 2:
+            raise Exception("The swarm must have at least two particles.")
+
+        self._rng = np.random.default_rng(self._params["seed"])
+        self._initializeSwarm()
+
+    def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
+        arrPower = arrVoltage * arrCurrent
+        if self._tracking:
+            change = self._detectChange(arrPower, irradiance)
+            if change is not None:
+                self._initializeSwarm(*self._getRescanWindow(change, arrVoltage))
+            else:
+                (lBound, rBound) = self._bounds
+                vRef = self._model.getReferenceVoltage(
+                    arrVoltage, arrCurrent, irradiance, temperature
+                )
+                return min(max(vRef, lBound), rBound)
+
+        # Measure the particle applied since the last cycle.
+        if self._particle is not None:
+            self._measure(self._particle, arrVoltage, arrPower)
+
+        # Apply the next particle, moving the swarm once all were measured.
+        if self._particle is None or self._particle == len(self._positions) - 1:
+            if self._particle is not None:
+                self._moveSwarm()
+                if self._hasConverged():
+                    return self._startTracking()
+            self._particle = 0
+        else:
+            self._particle += 1
+        return float(self._positions[self._particle])
+
+    def isSearching(self):
+        return not self._tracking
+
+    def reset(self):
+        super(ParticleSwarm, self).reset()
+        self._rng = np.random.default_rng(self._params["seed"])
+        self._initializeSwarm()
+
+    def _initializeSwarm(self, left=0.0, right=None):
+        """
+        Spreads the particles evenly across a voltage range, at rest.
+
+        Parameters
+        ----------
+        left: float
+            Left end of the range in V.
+        right: float|None
+            Right end of the range in V. If None, MAX_VOLTAGE.
+        """
+        if right is None:
+            right = GlobalMPPTAlgorithm.MAX_VOLTAGE
+        numParticles = self._params["numParticles"]
+        self._positions = left + (
+            (np.arange(numParticles) + 0.5) / numParticles
+        ) * (right - left)
+        self._velocities = np.zeros(numParticles)
+        self._bestPositions = self._positions.copy()
+        self._bestPowers = np.full(numParticles, -np.inf)
+        self._iteration = 0
+
+        # Index of the particle applied in the last cycle, None before the
+        # first is applied.
+        self._particle = None
+
+        # Whether the local MPPT algorithm is tracking the global best, and
+        # its bounds.
+        self._tracking = False
+        self._bounds = (0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+
+    def _measure(self, particle, arrVoltage, arrPower):
+        """
+        Records the power of a particle, updating its personal best.
+
+        Parameters
+        ----------
+        particle: int
+            Index of the particle.
+        arrVoltage: float
+            Array voltage in V the particle was measured at.
+        arrPower: float
+            Array power in W.
+        """
+        self._positions[particle] = arrVoltage
+        if arrPower > self._bestPowers[particle]:
+            self._bestPowers[particle] = arrPower
+            self._bestPositions[particle] = arrVoltage
+
+    def _moveSwarm(self):
+        """
+        Updates the velocity and position of every particle.
+        """
+        params = self._params
+        globalBest = self._bestPositions[np.argmax(self._bestPowers)]
+        (r1, r2) = self._rng.random((2, len(self._positions)))
+        self._velocities = (
+            params["inertia"] * self._velocities
+            + params["cognitive"] * r1 * (self._bestPositions - self._positions)
+            + params["social"] * r2 * (globalBest - self._positions)
+        )
+        self._positions = np.clip(
+            self._positions + self._velocities, 0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE
+        )
+        self._iteration += 1
+
+    def _hasConverged(self):
+        """
+        Returns whether the particles are within tolerance of each other, or
+        the iteration budget is spent.
+
+        Return
+        ------
+        bool: Whether the swarm has converged.
+        """
+        spread = np.max(self._positions) - np.min(self._positions)
+        return (
+            spread < self._params["tolerance"] * GlobalMPPTAlgorithm.MAX_VOLTAGE
+            or self._iteration >= self._params["maxIterations"]
+        )
+
+    def _startTracking(self):
+        """
+        Hands over to the local MPPT algorithm at the global best.
+
+        Return
+        ------
+        float: The global best voltage, applied in the next cycle.
+        """
+        globalBest = float(self._bestPositions[np.argmax(self._bestPowers)])
+        window = self._params["window"] * GlobalMPPTAlgorithm.MAX_VOLTAGE
+        self._bounds = (
+            max(0.0, globalBest - window),
+            min(GlobalMPPTAlgorithm.MAX_VOLTAGE, globalBest + window),
+        )
+        self._model.reset()
+        self._model.setup(globalBest, self._bounds[0], self._bounds[1])
+        self._tracking = True
+        self._armChangeDetection()
+        return globalBest
@@ -4,20 +4,47 @@ VoltageSweep.py
 Author: Afnan Mir, Array Lead (2021).
 Contact: afnanmir@utexas.edu
 Created: 02/06/2021
-Last Modified: 02/08/2021
+Last Modified: 10/19/2026
 
 Description: The Voltage Sweep class is a derived concrete class of
 GlobalAlgorithm implementing the Voltage Sweep algorithm. It increments through
 the range of all possible voltage values (the "sweep"), finding all local maxima
 of the P-V curve. It then identifies the global maxima using a LocalMPPTAlgorithm.
+
+By default, the sweep walks the whole voltage range in 0.01 V steps, one cycle
+per step. For long strings this takes thousands of cycles, so a coarse to fine
+sweep can be enabled with globalParams:
+
+    {
+        "coarseStride": 0.5,    <-  Enables the coarse to fine sweep. The
+                                    stride of the coarse pass in V.
+        "fineStride": 0.01,     <-  The stride of the refinement pass in V.
+        "numCandidates": 2,     <-  The number of highest coarse peaks whose
+                                    basins are refined.
+        "boundByVoc": False,    <-  Whether to stop the sweep just past the
+                                    Voc estimated from the irradiance and
+                                    temperature, instead of at MAX_VOLTAGE.
+    }
+
+The coarse pass samples the P-V curve every coarseStride volts. Each local
+maximum of the samples is a candidate peak, bracketed by its neighboring
+samples. The refinement pass then samples the brackets of the highest
+candidates every fineStride volts, and the local MPPT algorithm takes over at
+the best sample found, bounded to its bracket.
+
+With "rescan" enabled, either sweep is repeated when a change is detected
+while tracking (see GlobalMPPTAlgorithm for its globalParams): over the whole
+voltage range for a full rescan, or over a window around the tracked voltage
+for a partial rescan.
 """
 # Library Imports.
-
+import numpy as np
 
 # Custom Imports.
 from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
     GlobalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.MPPTComponents.CellSurrogate import CellSurrogate
 
 
 class VoltageSweep(GlobalMPPTAlgorithm):
@@ -28,11 +55,35 @@ class VoltageSweep(GlobalMPPTAlgorithm):
     P-V curve. It then identifies the global maxima using a LocalMPPTAlgorithm.
     """
 
-    def __init__(self, numCells=1, MPPTLocalAlgoType="Default", strideType="Fixed"):
+    # The default parameters of the coarse to fine sweep. See the module
+    # description.
+    GLOBAL_PARAMS = {
+        "coarseStride": None,
+        "fineStride": 0.01,
+        "numCandidates": 2,
+        "boundByVoc": False,
+    }
+
+    # Relative margin past the estimated Voc that the sweep extends to.
+    VOC_MARGIN = 0.05
+
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+        globalParams=None,
+    ):
         super(VoltageSweep, self).__init__(
-            numCells, "Voltage Sweep", MPPTLocalAlgoType, strideType
+            numCells, "Voltage Sweep", MPPTLocalAlgoType, strideType, strideParams
         )
 
+        self._setupParams(globalParams, VoltageSweep.GLOBAL_PARAMS)
+
+        # Estimates the Voc that the sweep is bounded by.
+        self._surrogate = CellSurrogate(numCells)
+
         # Stores all the voltage values of the local maxima.
         self.voltage_peaks = []
         self.voltage_troughs = [0]
@@ -55,12 +106,28 @@ class VoltageSweep(GlobalMPPTAlgorithm):
         self.tOld = 0.0
         self.irrOld = 0.0
         self.pOld = 0.0
+
+        # The voltage the sweep stops at. Below MAX_VOLTAGE for a partial
+        # rescan.
+        self.sweepEnd = GlobalMPPTAlgorithm.MAX_VOLTAGE
+
+        self._resetCoarseToFine()
+
     #TODO: round the values at a lower level like PVCell or MPPTAlgorithm instead of rounding the hell out of everything here
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
+        if self._params["coarseStride"] is not None:
+            return self._coarseToFine(arrVoltage, arrCurrent, irradiance, temperature)
+
         vRef = round(arrVoltage,2)
-        if round(arrVoltage,2) < GlobalMPPTAlgorithm.MAX_VOLTAGE and self.sweeping:
+        if round(arrVoltage,2) < self.sweepEnd and self.sweeping:
             vRef = round(self._sweep(round(arrVoltage,2), arrCurrent, irradiance, temperature),2)
         else:
+            partial = self.sweepEnd < GlobalMPPTAlgorithm.MAX_VOLTAGE
+            if self.setup and self.increasing and partial:
+                # A partial rescan may end on the slope of a peak past it.
+                self.voltage_peaks.append(self.vOld)
+                self.power_peaks.append(self.pOld)
+
             (lBound, rBound) = self._getBounds()
             if self.setup:
                 self.sweeping = False
@@ -69,9 +136,15 @@ class VoltageSweep(GlobalMPPTAlgorithm):
                 #TODO: Look at this later
                 self._model.setup(maxVoltage, lBound, rBound)
                 self.setup = False
+                self._armChangeDetection()
+            else:
+                change = self._detectChange(arrVoltage * arrCurrent, irradiance)
+                if change is not None:
+                    return self._rescan(change, arrVoltage)
 
-            if arrVoltage >= GlobalMPPTAlgorithm.MAX_VOLTAGE:
+            if arrVoltage >= self.sweepEnd:
                 vRef = lBound
+                self.sweepEnd = GlobalMPPTAlgorithm.MAX_VOLTAGE
             elif arrVoltage == lBound:
                 #TODO: Optimize this out
                 vRef = lBound + 0.02
@@ -123,6 +196,188 @@ class VoltageSweep(GlobalMPPTAlgorithm):
         self.irrOld = irradiance
         return vRef
 
+    def isSearching(self):
+        if self._params["coarseStride"] is not None:
+            return self._phase != "track"
+        return self.sweeping
+
+    def _coarseToFine(self, arrVoltage, arrCurrent, irradiance, temperature):
+        """
+        Calculates the reference voltage output for the given PVSource input
+        with the coarse to fine sweep.
+
+        Parameters
+        ----------
+        arrVoltage: float
+            Array voltage in V.
+        arrCurrent: float
+            Array current in A.
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        float: The reference voltage that should be applied to the array in the
+        next cycle.
+        """
+        if self._phase == "track":
+            change = self._detectChange(arrVoltage * arrCurrent, irradiance)
+            if change is not None:
+                return self._rescan(change, arrVoltage)
+            (lBound, rBound) = self._bracket
+            vRef = self._model.getReferenceVoltage(
+                arrVoltage, arrCurrent, irradiance, temperature
+            )
+            return min(max(vRef, lBound), rBound)
+
+        # Sample the voltage applied since the last cycle.
+        self._samples.append((arrVoltage, arrVoltage * arrCurrent))
+        if self._sweepLimit is None:
+            self._sweepLimit = self._getSweepLimit(irradiance, temperature)
+
+        if self._phase == "coarse":
+            if self._target < self._sweepLimit:
+                self._target = min(
+                    self._target + self._params["coarseStride"], self._sweepLimit
+                )
+                return self._target
+            self._queue = self._getRefinement()
+            self._phase = "refine"
+
+        if self._queue:
+            return self._queue.pop(0)
+
+        # Hand over to the local MPPT algorithm at the best sample, bounded to
+        # its bracket.
+        (vBest, pBest) = max(self._samples, key=lambda sample: sample[1])
+        self._bracket = (0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+        for (left, right) in self._brackets:
+            if left <= vBest <= right:
+                self._bracket = (left, right)
+        self._model.setup(vBest, self._bracket[0], self._bracket[1])
+        self._phase = "track"
+        self._armChangeDetection()
+        return vBest
+
+    def _rescan(self, change, arrVoltage):
+        """
+        Starts sweeping again after a change was detected while tracking.
+
+        Parameters
+        ----------
+        change: String
+            The kind of rescan, "partial" or "full".
+        arrVoltage: float
+            Array voltage in V that was being tracked.
+
+        Return
+        ------
+        float: The reference voltage that should be applied to the array in the
+        next cycle, the start of the sweep.
+        """
+        (left, right) = self._getRescanWindow(change, arrVoltage)
+        self._model.reset()
+        if self._params["coarseStride"] is not None:
+            self._resetCoarseToFine()
+            self._target = left
+            if change == "partial":
+                self._sweepLimit = right
+            return left
+
+        self.voltage_peaks = []
+        self.voltage_troughs = [left]
+        self.power_peaks = []
+        self.sweeping = True
+        self.increasing = True
+        self.setup = True
+        self.pOld = 0.0
+        self.sweepEnd = right
+        return left
+
+    def _getRefinement(self):
+        """
+        Finds the candidate peaks of the coarse pass and the voltages to sample
+        within their brackets.
+
+        Return
+        ------
+        list: The voltages of the refinement pass, in increasing order.
+        """
+        voltages = np.array([sample[0] for sample in self._samples])
+        powers = np.array([sample[1] for sample in self._samples])
+        order = np.argsort(voltages, kind="stable")
+        (voltages, powers) = (voltages[order], powers[order])
+
+        # Local maxima of the coarse samples, highest first. Only the first
+        # sample of a flat run counts, and samples without power (i.e. past
+        # Voc) are not candidates.
+        padded = np.concatenate(([-np.inf], powers, [-np.inf]))
+        peaks = np.nonzero(
+            (powers > padded[:-2]) & (powers >= padded[2:]) & (powers > 0)
+        )[0]
+        peaks = peaks[np.argsort(-powers[peaks], kind="stable")]
+
+        fineStride = self._params["fineStride"]
+        self._brackets = []
+        refinement = []
+        for idx in peaks[: max(1, self._params["numCandidates"])]:
+            left = voltages[max(idx - 1, 0)]
+            right = voltages[min(idx + 1, len(voltages) - 1)]
+            self._brackets.append((float(left), float(right)))
+            steps = np.arange(left + fineStride, right, fineStride)
+            refinement += [
+                round(float(step), 6)
+                for step in steps
+                if abs(step - voltages[idx]) >= fineStride / 2
+            ]
+        return sorted(set(refinement))
+
+    def _getSweepLimit(self, irradiance, temperature):
+        """
+        Returns the voltage the sweep stops at: MAX_VOLTAGE, or just past the
+        Voc estimated from the irradiance and temperature (see CellSurrogate).
+
+        Parameters
+        ----------
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        float: The voltage in V.
+        """
+        if not self._params["boundByVoc"] or irradiance <= 0:
+            return GlobalMPPTAlgorithm.MAX_VOLTAGE
+
+        VOC = self._surrogate.getOCVoltage(irradiance, temperature)
+        return min(
+            GlobalMPPTAlgorithm.MAX_VOLTAGE,
+            round(VOC * (1 + VoltageSweep.VOC_MARGIN), 2),
+        )
+
+    def _resetCoarseToFine(self):
+        """
+        Resets the state of the coarse to fine sweep.
+        """
+        # One of "coarse", "refine", and "track".
+        self._phase = "coarse"
+
+        # The (voltage, power) samples of the sweep, the voltage the coarse
+        # pass is at, and the voltage it stops at.
+        self._samples = []
+        self._target = 0.0
+        self._sweepLimit = None
+
+        # The voltages left to sample in the refinement pass, the brackets of
+        # the candidate peaks, and the bracket of the peak tracked.
+        self._queue = []
+        self._brackets = []
+        self._bracket = (0.0, GlobalMPPTAlgorithm.MAX_VOLTAGE)
+
     def _getBounds(self):
         """
         Finds left and right bounds for the global maximum of the P-V curve.
@@ -143,7 +398,9 @@ class VoltageSweep(GlobalMPPTAlgorithm):
             0
         )
         if(index == 0):
-            leftBound = round(self.voltage_peaks[index]/2,2)
+            leftBound = max(
+                self.voltage_troughs[0], round(self.voltage_peaks[index]/2,2)
+            )
         else:
             leftBound = max(self.voltage_troughs[index], (self.voltage_peaks[index] + self.voltage_peaks[index-1])/2)
         if(index == len(self.power_peaks)-1):
@@ -156,8 +413,11 @@ class VoltageSweep(GlobalMPPTAlgorithm):
     def reset(self):
         super(VoltageSweep, self).reset()
         self.stride = 0.01
-        self.voltage_peaks = [0]
-        self.power_peaks = [0]
+        self.voltage_peaks = []
+        self.voltage_troughs = [0]
+        self.power_peaks = []
         self.sweeping = True
         self.increasing = True
         self.setup = True
+        self.sweepEnd = GlobalMPPTAlgorithm.MAX_VOLTAGE
+        self._resetCoarseToFine()
@@ -0,0 +1,121 @@
+"""
+BFGS.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the BFGS quasi-Newton algorithm.
+
+The implementation of this algorithm is based on the wikipedia page for the
+BFGS algorithm: https://en.wikipedia.org/wiki/Broyden-Fletcher-Goldfarb-Shanno_algorithm
+
+    BFGS is a quasi-Newton method: rather than measuring the second
+    derivative of the P-V curve like Newton, it keeps an estimate B of it
+    that is updated from the change in the gradient between iterations. In
+    one dimension, the BFGS update reduces to the secant condition
+
+        B = y / s,  s = m - mOld, y = g - gOld
+
+    where g is the gradient dP/dV, estimated by the finite difference of the
+    last two measurements, at their midpoint m:
+
+        g = (P - pOld) / (V - vOld)
+        m = (V + vOld) / 2
+
+    The P-V curve is concave around its maximum, so an estimate is only kept
+    if it satisfies the curvature condition y * s < 0. The reference voltage
+    is then the Newton step from the midpoint:
+
+        VREF = m - g / B
+
+    Until a valid estimate exists, the algorithm climbs the curve by the
+    stride of the stride model, like PandO.
+
+    Unlike Newton, which fits a parabola through the last three measurements,
+    the estimate B only needs one new measurement per cycle, and is carried
+    over between gradient estimates, so that a step is taken from every
+    measurement rather than from every other.
+
+    Every step is limited, and the reference voltage is dithered once
+    converged, so that the gradient and curvature stay observable (see
+    SecondOrderMPPTAlgorithm).
+
+    As this algorithm standalone can only support unimodal functions,
+    it is a subcomponent for a larger, global MPPT algorithm.
+"""
+# Library Imports.
+from math import copysign
+
+# Custom Imports.
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.SecondOrderMPPTAlgorithm import (
+    SecondOrderMPPTAlgorithm,
+)
+
+
+class BFGS(SecondOrderMPPTAlgorithm):
+    """
+    The BFGS class is a derived class of SecondOrderMPPTAlgorithm, utilizing a
+    secant estimate of the curvature of the P-V curve, kept across cycles, to
+    step towards the root of dP/dV.
+    """
+
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(BFGS, self).__init__(numCells, "BFGS", strideType, strideParams)
+
+        # Whether vOld and pOld hold a measurement.
+        self.measured = False
+
+        # The last gradient estimate, the voltage it was estimated at, and the
+        # span of the measurements it was estimated from.
+        self.gOld = None
+        self.mOld = None
+        self.span = 0.0
+
+        # The estimate of the second derivative of the P-V curve.
+        self.curvature = None
+
+    def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
+        # Compute secondary values.
+        pIn = arrVoltage * arrCurrent
+        dV = arrVoltage - self.vOld
+
+        # Determine the stride.
+        stride = self._strideModel.getStride(
+            arrVoltage, arrCurrent, irradiance, temperature
+        )
+
+        if self.measured and abs(dV) >= BFGS.minStep / 2:
+            # Estimate the gradient and update the curvature.
+            g = (pIn - self.pOld) / dV
+            m = (arrVoltage + self.vOld) / 2
+            self.span = abs(dV)
+            if self.gOld is not None and m != self.mOld:
+                (s, y) = (m - self.mOld, g - self.gOld)
+                self.curvature = y / s if y * s < 0 else None
+                self.span += abs(s)
+            (self.gOld, self.mOld) = (g, m)
+
+        # Update dependent values. A measurement too close to the last one to
+        # tell apart replaces it.
+        self.vOld = arrVoltage
+        self.pOld = pIn
+        self.measured = True
+
+        # Take a quasi-Newton step, or climb the curve. A flat P-V curve is
+        # past the open circuit voltage.
+        if self.gOld is not None and self.curvature is not None:
+            vRef = self.mOld - self.gOld / self.curvature
+            return self._limitStep(arrVoltage, vRef, self.span)
+        if self.gOld is not None:
+            self.direction = copysign(1, self.gOld) if self.gOld != 0 else -1
+        vRef = arrVoltage + self.direction * stride
+        return self._limitStep(arrVoltage, vRef, stride)
+
+    def reset(self):
+        super(BFGS, self).reset()
+        self.measured = False
+        self.gOld = None
+        self.mOld = None
+        self.span = 0.0
+        self.curvature = None
@@ -4,7 +4,7 @@ Bisection.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/19/20
-Last Modified: 02/27/21
+Last Modified: 10/19/26
 Description: Implementation of the Bisection method algorithm.
 
 The implementation of this algorithm is based on the wikipedia page for the
@@ -73,8 +73,8 @@ class Bisection(LocalMPPTAlgorithm):
     # Error tuning parameter.
     error = 0.01
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(Bisection, self).__init__(numCells, "Bisection", strideType)
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(Bisection, self).__init__(numCells, "Bisection", strideType, strideParams)
 
         # Current algorithm internal cycle.
         self.cycle = 0
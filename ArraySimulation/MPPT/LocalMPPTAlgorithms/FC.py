@@ -4,7 +4,7 @@ FC.py
 Author: Afnan Mir, Matthew Yu (2021).
 Contact: matthewjkyu@gmail.com
 Created: 11/19/20
-Last Modified: 02/27/2021
+Last Modified: 10/19/26
 
 Description: Implementation of the dP/dV feedback control D&C algorithm.
 """
@@ -24,8 +24,8 @@ class FC(LocalMPPTAlgorithm):
     # Error tuning parameter.
     error = 0.05
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(FC, self).__init__(numCells, "FC", strideType)
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(FC, self).__init__(numCells, "FC", strideType, strideParams)
 
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
         arrPower = arrCurrent * arrVoltage
@@ -4,7 +4,7 @@ Golden.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/19/20
-Last Modified: 02/27/21
+Last Modified: 10/19/26
 Description: Implementation of the Golden Section Search algorithm.
 
 The implementation of this algorithm is based on the wikipedia page for the
@@ -88,8 +88,8 @@ class Golden(LocalMPPTAlgorithm):
 
     phi = (sqrt(5) + 1) / 2 - 1
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(Golden, self).__init__(numCells, "Golden", strideType)
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(Golden, self).__init__(numCells, "Golden", strideType, strideParams)
 
         # Current algorithm internal cycle.
         self.cycle = 0
@@ -4,7 +4,7 @@ IC.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/21/20
-Last Modified: 2/27/21
+Last Modified: 10/19/26
 Description: Implementation of the Incremental Conductance algorithm.
 
 The implementation of this algorithm is based on the folowing paper:
@@ -45,8 +45,8 @@ class IC(LocalMPPTAlgorithm):
     # Error tuning parameter.
     error = 0.01
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(IC, self).__init__(numCells, "IC", strideType)
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(IC, self).__init__(numCells, "IC", strideType, strideParams)
 
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
         # Compute secondary values.
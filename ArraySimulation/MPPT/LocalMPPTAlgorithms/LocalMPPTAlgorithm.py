@@ -4,7 +4,7 @@ LocalMPPTAlgorithm.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/18/20
-Last Modified: 02/27/22
+Last Modified: 10/19/26
 Description: Implementation of the LocalMPPTAlgorithm class.
 """
 # Library Imports.
@@ -36,7 +36,13 @@ class LocalMPPTAlgorithm:
     # standard conditions.
     MAX_VOLTAGE_PER_CELL = 0.8
 
-    def __init__(self, numCells=1, MPPTLocalAlgoType="Default", strideType="Fixed"):
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+    ):
         """
         Sets up the initial source parameters.
 
@@ -49,22 +55,28 @@ class LocalMPPTAlgorithm:
             The name of the local MPPT algorithm type.
         strideType: String
             The name of the stride algorithm type.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor, i.e.
+            {"minStride": 0.02, "error": 0.1}. If None, the stride model
+            defaults are used.
         """
         LocalMPPTAlgorithm.MAX_VOLTAGE = (
             numCells * LocalMPPTAlgorithm.MAX_VOLTAGE_PER_CELL
         )
         self._MPPTLocalAlgoType = MPPTLocalAlgoType
 
+        if strideParams is None:
+            strideParams = {}
         if strideType == "Adaptive":
-            self._strideModel = AdaptiveStride()
+            self._strideModel = AdaptiveStride(**strideParams)
         elif strideType == "Bisection":
-            self._strideModel = BisectionStride()
+            self._strideModel = BisectionStride(**strideParams)
         elif strideType == "Optimal":
-            self._strideModel = OptimalStride()
+            self._strideModel = OptimalStride(**strideParams)
         elif strideType == "Fixed":
-            self._strideModel = Stride()
+            self._strideModel = Stride(**strideParams)
         else:
-            self._strideModel = Stride()
+            self._strideModel = Stride(**strideParams)
 
         # Previous array voltage value.
         self.vOld = 0.0
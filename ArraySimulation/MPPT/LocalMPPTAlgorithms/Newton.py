@@ -0,0 +1,103 @@
+"""
+Newton.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the variable step Newton-Raphson algorithm.
+
+The implementation of this algorithm is based on the following paper:
+
+    Novel algorithm of MPPT for PV array based on variable step Newton-Raphson
+    method through model predictive control (Hosseini et al.)
+
+    Section 3.2, Maximum Power Point Tracker of Variable Step
+
+    The MPP is the root of dP/dV. Newton's method finds it by stepping
+
+        VREF = V - P'(V) / P''(V)
+
+    where the derivatives are not known analytically. Instead, they are
+    estimated by finite differences of the last three distinct measurements
+    (v0, p0), (v1, p1), (v2, p2), which is the parabola through them:
+
+        d01 = (p1 - p0) / (v1 - v0)
+        d12 = (p2 - p1) / (v2 - v1)
+        d2 = (d12 - d01) / (v2 - v0)            # P''(V) / 2
+        P'(v2) = d12 + d2 * (v2 - v1)
+
+    Near the MPP the P-V curve is concave and close to a parabola, so the step
+    converges in a handful of cycles, each cycle adapting its own stride. Far
+    from the MPP, the curve may not be concave (d2 >= 0); the algorithm then
+    climbs the curve by the stride of the stride model, like PandO, until it
+    is.
+
+    Every step is limited, and the reference voltage is dithered once
+    converged, so that the three measurements stay distinct and up to date
+    (see SecondOrderMPPTAlgorithm).
+
+    As this algorithm standalone can only support unimodal functions,
+    it is a subcomponent for a larger, global MPPT algorithm.
+"""
+# Library Imports.
+from math import copysign
+
+# Custom Imports.
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.SecondOrderMPPTAlgorithm import (
+    SecondOrderMPPTAlgorithm,
+)
+
+
+class Newton(SecondOrderMPPTAlgorithm):
+    """
+    The Newton class is a derived class of SecondOrderMPPTAlgorithm, utilizing
+    finite difference estimates of the first and second derivatives of the P-V
+    curve to step towards the root of dP/dV.
+    """
+
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(Newton, self).__init__(numCells, "Newton", strideType, strideParams)
+
+        # The last three distinct (voltage, power) measurements, oldest first.
+        self.samples = []
+
+    def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
+        # Compute secondary values.
+        pIn = arrVoltage * arrCurrent
+
+        # Determine the stride.
+        stride = self._strideModel.getStride(
+            arrVoltage, arrCurrent, irradiance, temperature
+        )
+
+        # Replace the measurements too close to this one to tell apart.
+        self.samples = [
+            sample
+            for sample in self.samples
+            if abs(sample[0] - arrVoltage) >= Newton.minStep / 2
+        ]
+        self.samples = (self.samples + [(arrVoltage, pIn)])[-3:]
+
+        # Take a Newton step if the curve is concave, and climb it otherwise.
+        if len(self.samples) == 3:
+            ((v0, p0), (v1, p1), (v2, p2)) = self.samples
+            d01 = (p1 - p0) / (v1 - v0)
+            d12 = (p2 - p1) / (v2 - v1)
+            d2 = (d12 - d01) / (v2 - v0)
+            if d2 < 0:
+                vRef = v2 - (d12 + d2 * (v2 - v1)) / (2 * d2)
+                span = max(v0, v1, v2) - min(v0, v1, v2)
+                return self._limitStep(arrVoltage, vRef, span)
+
+        if len(self.samples) >= 2:
+            ((v1, p1), (v2, p2)) = self.samples[-2:]
+            slope = (p2 - p1) * (v2 - v1)
+            # A flat P-V curve is past the open circuit voltage.
+            self.direction = copysign(1, slope) if slope != 0 else -1
+        vRef = arrVoltage + self.direction * stride
+        return self._limitStep(arrVoltage, vRef, stride)
+
+    def reset(self):
+        super(Newton, self).reset()
+        self.samples = []
@@ -4,7 +4,7 @@ PandO.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/18/20
-Last Modified: 02/27/21
+Last Modified: 10/19/26
 
 Description: Implementation of the PandO hill climbing algorithm.
 """
@@ -25,8 +25,8 @@ class PandO(LocalMPPTAlgorithm):
     voltage. It belongs to the classification of hill climbing algorithms.
     """
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(PandO, self).__init__(numCells, "PandO", strideType)
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(PandO, self).__init__(numCells, "PandO", strideType, strideParams)
         self._minVoltage = .05
 
     def getReferenceVoltage(self, arrVoltage, arrCurrent, irradiance, temperature):
@@ -45,19 +45,13 @@ class PandO(LocalMPPTAlgorithm):
         if dP > 0:
             if dV > 0:  # Increase vRef.
                 vRef += stride
-                print('Right dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
             elif dV < 0:  # Decrease vRef.
                 vRef -= stride
-                print('Left dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
         else:
             if dV > 0:  # Decrease vRef.
                 vRef -= stride
-                print('Left dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
             elif dV < 0:  # Increase vRef.
                 vRef += stride
-                print('Right dp='+str(round(dP, 3))+' dV='+str(round(dV, 3)), end='\t')
-
-        print(" to ", round(vRef, 3))
 
         # Update dependent values.
         self.vOld = arrVoltage
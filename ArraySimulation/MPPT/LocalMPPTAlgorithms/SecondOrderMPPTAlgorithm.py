@@ -0,0 +1,120 @@
+"""
+SecondOrderMPPTAlgorithm.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the SecondOrderMPPTAlgorithm class.
+
+Second order algorithms (see Newton and BFGS) step towards the root of dP/dV
+using an estimate of the curvature of the P-V curve, and climb the curve by
+the stride of the stride model until a valid estimate exists.
+
+Every step is limited to maxStep of the width of the bounds, and to
+maxExpansion of the span of the measurements it was estimated from, since the
+estimate is a poor fit far outside of them. Once the step falls below
+minStep, the reference voltage is perturbed by minStep to either side and
+back (see DITHER), so that the measurements stay distinct and up to date, and
+changes in the P-V curve are still observed.
+"""
+# Library Imports.
+
+
+# Custom Imports.
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.LocalMPPTAlgorithm import (
+    LocalMPPTAlgorithm,
+)
+
+
+class SecondOrderMPPTAlgorithm(LocalMPPTAlgorithm):
+    """
+    The SecondOrderMPPTAlgorithm class is a derived class of
+    LocalMPPTAlgorithm providing the step limiting shared by second order
+    algorithms.
+    """
+
+    # Smallest perturbation of the reference voltage (V).
+    minStep = 0.01
+
+    # Largest step, relative to the width of the bounds.
+    maxStep = 0.25
+
+    # Largest step, relative to the span of the measurements it is estimated
+    # from. Limits extrapolation far from the MPP, where the P-V curve is not
+    # parabolic.
+    maxExpansion = 2.0
+
+    # Perturbations, in minStep, cycled through once converged.
+    DITHER = [1, 0, -1, 0]
+
+    def __init__(
+        self,
+        numCells=1,
+        MPPTLocalAlgoType="Default",
+        strideType="Fixed",
+        strideParams=None,
+    ):
+        """
+        Sets up the initial source parameters.
+
+        Parameters
+        ----------
+        numCells: int
+            The number of cells that should be accounted for in the MPPT
+            algorithm.
+        MPPTLocalAlgoType: String
+            The name of the local MPPT algorithm type.
+        strideType: String
+            The name of the stride algorithm type.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor.
+        """
+        super(SecondOrderMPPTAlgorithm, self).__init__(
+            numCells, MPPTLocalAlgoType, strideType, strideParams
+        )
+
+        # The side the curve is climbed towards, and the index of the last
+        # perturbation in DITHER.
+        self.direction = 1
+        self.dither = 0
+
+    def _limitStep(self, arrVoltage, vRef, span):
+        """
+        Limits the step to the reference voltage to [minStep, maxStep] within
+        the bounds.
+
+        Parameters
+        ----------
+        arrVoltage: float
+            Array voltage in V.
+        vRef: float
+            The reference voltage of the step.
+        span: float
+            The span in V of the measurements the step was estimated from.
+
+        Return
+        ------
+        float: The reference voltage that should be applied to the array in the
+        next cycle.
+        """
+        maxStep = max(
+            min(
+                SecondOrderMPPTAlgorithm.maxStep * (self.rightBound - self.leftBound),
+                SecondOrderMPPTAlgorithm.maxExpansion * span,
+            ),
+            SecondOrderMPPTAlgorithm.minStep,
+        )
+        step = min(max(vRef - arrVoltage, -maxStep), maxStep)
+        if abs(step) < SecondOrderMPPTAlgorithm.minStep:
+            self.dither = (self.dither + 1) % len(SecondOrderMPPTAlgorithm.DITHER)
+            step += (
+                SecondOrderMPPTAlgorithm.DITHER[self.dither]
+                * SecondOrderMPPTAlgorithm.minStep
+            )
+        return min(max(arrVoltage + step, self.leftBound), self.rightBound)
+
+    def reset(self):
+        super(SecondOrderMPPTAlgorithm, self).reset()
+        self.direction = 1
+        self.dither = 0
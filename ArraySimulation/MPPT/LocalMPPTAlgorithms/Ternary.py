@@ -4,7 +4,7 @@ Ternary.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/24/20
-Last Modified: 02/27/21
+Last Modified: 10/19/26
 Description: Implementation of the Ternary Search algorithm.
 
 The implementation of this algorithm is based on the wikipedia page for the
@@ -68,8 +68,8 @@ class Ternary(LocalMPPTAlgorithm):
     # Convergence constant.
     q = 0.33  # Roughly the same as dividing by 3.
 
-    def __init__(self, numCells=1, strideType="Fixed"):
-        super(Ternary, self).__init__(numCells, "Ternary", strideType)
+    def __init__(self, numCells=1, strideType="Fixed", strideParams=None):
+        super(Ternary, self).__init__(numCells, "Ternary", strideType, strideParams)
 
         # Current algorithm internal cycle.
         self.cycle = 0
@@ -4,7 +4,7 @@ MPPT.py
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/18/20
-Last Modified: 02/27/21
+Last Modified: 10/19/26
 
 Description: Implementation of the MPPT class.
 """
@@ -15,6 +15,8 @@ Description: Implementation of the MPPT class.
 from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
     GlobalMPPTAlgorithm,
 )
+from ArraySimulation.MPPT.GlobalMPPTAlgorithms.ModelPredictive import ModelPredictive
+from ArraySimulation.MPPT.GlobalMPPTAlgorithms.ParticleSwarm import ParticleSwarm
 from ArraySimulation.MPPT.GlobalMPPTAlgorithms.VoltageSweep import VoltageSweep
 
 
@@ -35,6 +37,8 @@ class MPPT:
         MPPTGlobalAlgoType="Default",
         MPPTLocalAlgoType="Default",
         strideType="Fixed",
+        strideParams=None,
+        globalParams=None,
     ):
         """
         Initializes an internal model object for reference.
@@ -51,20 +55,47 @@ class MPPT:
             The name of the local MPPT algorithm type.
         strideType: String
             The name of the stride algorithm type.
+        strideParams: dict|None
+            Keyword arguments passed to the stride model constructor, i.e.
+            {"minStride": 0.02, "error": 0.1}.
+        globalParams: dict|None
+            Keyword parameters of the global MPPT algorithm, i.e.
+            {"coarseStride": 0.5} for the Voltage Sweep or
+            {"numParticles": 6} for the Particle Swarm, or
+            {"window": 0.05} for the Model Predictive. If None, the
+            algorithm defaults are used.
         """
         # Reset any model if there are any already defined.
         if self._model is not None:
             self.reset()
 
         if MPPTGlobalAlgoType == "Voltage Sweep":
-            self._model = VoltageSweep(numCells, MPPTLocalAlgoType, strideType)
+            self._model = VoltageSweep(
+                numCells, MPPTLocalAlgoType, strideType, strideParams, globalParams
+            )
+        elif MPPTGlobalAlgoType == "Particle Swarm":
+            self._model = ParticleSwarm(
+                numCells, MPPTLocalAlgoType, strideType, strideParams, globalParams
+            )
+        elif MPPTGlobalAlgoType == "Model Predictive":
+            self._model = ModelPredictive(
+                numCells, MPPTLocalAlgoType, strideType, strideParams, globalParams
+            )
         elif MPPTGlobalAlgoType == "Default":
             self._model = GlobalMPPTAlgorithm(
-                numCells, MPPTGlobalAlgoType, MPPTLocalAlgoType, strideType
+                numCells,
+                MPPTGlobalAlgoType,
+                MPPTLocalAlgoType,
+                strideType,
+                strideParams,
             )
         else:
             self._model = GlobalMPPTAlgorithm(
-                numCells, MPPTGlobalAlgoType, MPPTLocalAlgoType, strideType
+                numCells,
+                MPPTGlobalAlgoType,
+                MPPTLocalAlgoType,
+                strideType,
+                strideParams,
             )
 
     def reset(self):
@@ -79,6 +110,30 @@ class MPPT:
             arrVoltage, arrCurrent, irradiance, temperature
         )
 
+    def isSearching(self):
+        """
+        Returns whether the global MPPT algorithm is searching for the global
+        maximum rather than tracking it, as of the last reference voltage.
+
+        Return
+        ------
+        bool: Whether the algorithm is searching.
+        """
+        return self._model is not None and self._model.isSearching()
+
+    def getRescanCounts(self):
+        """
+        Returns how many times a change triggered each kind of rescan of the
+        global MPPT algorithm since the last reset.
+
+        Return
+        ------
+        dict: {"partial": int, "full": int}
+        """
+        if self._model is None:
+            return {"partial": 0, "full": 0}
+        return self._model.getRescanCounts()
+
     def getGlobalMPPTType(self):
         """
         Returns the Global MPPT type used for the simulation.
@@ -23,6 +23,9 @@ following paper:
 
     f(V_best - V) = exp( (V_best - V) / 3 ) - 1     , V < V_best
                     0                               , V > V_best
+
+    The scale of the exponential (3 V in the paper) is a parameter of the
+    stride model, as it depends on the number of cells in the source.
     
     We see that in the event of the solar cell voltage being to the right of the 
     maximum power point, Piegari et Rizzo use dV_min to shift back towards the 
@@ -50,12 +53,35 @@ class AdaptiveStride(Stride):
     times.
     """
 
-    def __init__(self, minStride=0.01, VMPP=0.621, error=0.05):
+    def __init__(self, minStride=0.01, VMPP=0.621, error=0.05, scale=3.0):
+        """
+        Sets up the adaptive stride towards an estimated VMPP, growing
+        exponentially with the distance below it.
+
+        Parameters
+        ----------
+        minStride: float
+            The minimum value of the stride, if applicable. Unused; the minimum
+            stride is derived from the VMPP and error instead.
+        VMPP: float
+            Our estimation of the PVSource voltage at the maximum power point.
+            Note that the default value is for a single cell and is an
+            experimental estimate; according to Sunniva the cell VMPP is 0.621.
+        error: float
+            The minimum error percentage of V_best to serve as our minimum
+            stride.
+        scale: float
+            The voltage, in V, over which the stride towards the VMPP grows by
+            a factor of e.
+        """
         super(AdaptiveStride, self).__init__("Adaptive", minStride, VMPP, error)
 
+        # Voltage scale of the exponential stride.
+        self.scale = scale
+
     def getStride(self, arrVoltage, arrCurrent, irradiance, temperature):
         minStride = self.error * self.error * self.VMPP / (2 * (1 - self.error))
         stride = 0
         if arrVoltage < self.VMPP:
-            stride = exp((self.VMPP - arrVoltage) / 3) - 1
+            stride = exp((self.VMPP - arrVoltage) / self.scale) - 1
         return stride + minStride
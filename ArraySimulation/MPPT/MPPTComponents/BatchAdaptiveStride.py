@@ -0,0 +1,41 @@
+"""
+BatchAdaptiveStride.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Adaptive Stride perturbation
+function. See AdaptiveStride for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPTComponents.BatchStride import BatchStride
+
+
+class BatchAdaptiveStride(BatchStride):
+    """
+    Derived class of BatchStride seeking to adaptively jump towards the VMPP at
+    all times, for every tracker.
+    """
+
+    def __init__(
+        self, numTrackers=1, minStride=0.01, VMPP=0.621, error=0.05, scale=3.0
+    ):
+        super(BatchAdaptiveStride, self).__init__(
+            numTrackers, "Adaptive", minStride, VMPP, error
+        )
+
+        # Voltage scale of the exponential stride. See AdaptiveStride.
+        self.scale = scale
+
+    def getStrides(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        minStride = self.error * self.error * self.VMPP / (2 * (1 - self.error))
+        strides = np.where(
+            arrVoltages < self.VMPP,
+            np.exp((self.VMPP - arrVoltages) / self.scale) - 1,
+            0.0,
+        )
+        return strides + minStride
@@ -0,0 +1,74 @@
+"""
+BatchBisectionStride.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Bisection Stride perturbation
+function. See BisectionStride for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPTComponents.BatchStride import BatchStride
+
+
+class BatchBisectionStride(BatchStride):
+    """
+    Derived class of BatchStride seeking to jump to the VMPP at all times, for
+    every tracker.
+    """
+
+    def __init__(
+        self,
+        numTrackers=1,
+        minStride=0.01,
+        VMPP=0.621,
+        error=0.05,
+        slopeMultiplier=0.01,
+    ):
+        """
+        Sets up the initial source parameters.
+
+        Parameters
+        ----------
+        numTrackers: int
+            The number of independent trackers.
+        minStride: float
+            The minimum value of the stride, if applicable.
+        slopeMultiplier: float
+            The multiplier that dictates how large the stride is calculated when
+            on the left side of the P-V curve. Empirically determined.
+        """
+        super(BatchBisectionStride, self).__init__(
+            numTrackers, "Bisection", minStride, VMPP, error
+        )
+
+        # Constant for determining convergence speed on the left side of the VMPP.
+        self.slopeMultiplier = slopeMultiplier
+
+        # Constant for selecting the minimum power and voltage difference.
+        self._minPowDiff = 0.01
+        self._minVoltDiff = 0.001
+
+    def getStrides(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        pIn = arrVoltages * arrCurrents
+        dV = arrVoltages - self.vOld
+        dP = pIn - self.pOld
+
+        # Only trackers with a large enough change have a slope.
+        valid = (np.abs(dP) >= self._minPowDiff) & (np.abs(dV) >= self._minVoltDiff)
+        slopes = np.zeros(len(dV))
+        slopes[valid] = dP[valid] / dV[valid]
+
+        strides = np.zeros(len(dV))
+        right = valid & (slopes < 0)
+        left = valid & (slopes > 0)
+        strides[right] = (arrVoltages[right] + self.vOld[right]) / 2 - self.vOld[right]
+        strides[left] = slopes[left] * self.slopeMultiplier
+
+        self.vOld = np.array(arrVoltages, dtype=float)
+        self.pOld = pIn
+        return np.maximum(np.abs(strides), self._minStride)
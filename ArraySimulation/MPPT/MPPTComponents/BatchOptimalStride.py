@@ -0,0 +1,32 @@
+"""
+BatchOptimalStride.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the vectorized Optimal Stride perturbation
+function. See OptimalStride for the derivation.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPTComponents.BatchStride import BatchStride
+
+
+class BatchOptimalStride(BatchStride):
+    """
+    Derived class of BatchStride jumping by the distance to the VMPP, for every
+    tracker.
+    """
+
+    def __init__(self, numTrackers=1, minStride=0.01, VMPP=0.621, error=0.05):
+        super(BatchOptimalStride, self).__init__(
+            numTrackers, "Optimal", minStride, VMPP, error
+        )
+
+    def getStrides(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        minStride = self.error * self.error * self.VMPP / (2 * (1 - self.error))
+        strides = np.abs(self.VMPP - arrVoltages)
+        return strides + minStride
@@ -0,0 +1,136 @@
+"""
+BatchStride.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of the BatchStride class, the vectorized
+counterpart of the Stride class.
+
+A BatchStride holds the state of N independent stride models in numpy arrays,
+one value per tracker, and computes the stride of every tracker at once. Each
+tracker behaves exactly like a Stride of the same type given the same inputs.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class BatchStride:
+    """
+    The BatchStride class provides the base API for derived classes to
+    calculate the strides of N trackers at once.
+
+    By default, the stride function implemented by the concrete base class is a
+    fixed stride.
+    """
+
+    def __init__(
+        self, numTrackers=1, strideType="Fixed", minStride=0.01, VMPP=0.621, error=0.05
+    ):
+        """
+        Sets up the initial source parameters.
+
+        Parameters
+        ----------
+        numTrackers: int
+            The number of independent trackers.
+        strideType: String
+            The name of the stride type.
+        minStride: float
+            The minimum value of the stride, if applicable.
+        VMPP: float
+            Our estimation of the PVSource voltage at the maximum power point.
+        error: float
+            The minimum error percentage of V_best to serve as our minimum
+            stride.
+        """
+        self._numTrackers = numTrackers
+
+        # Name of the explicit stride function used.
+        self._strideType = strideType
+
+        # The minimum stride attempted in any iteration.
+        self._minStride = minStride
+
+        # The previous iteration characteristics of each tracker.
+        self.vOld = np.zeros(numTrackers)
+        self.pOld = np.zeros(numTrackers)
+
+        # The anticipated VMPP to aim for, and the user defined error for
+        # determining variable minimum stride distance, of each tracker.
+        self.VMPP = np.full(numTrackers, float(VMPP))
+        self.error = np.full(numTrackers, float(error))
+
+    def setup(self, VMPP=0.621, error=None, mask=None):
+        """
+        Reinitializes the predicted parameters of some or all trackers.
+
+        Parameters
+        ----------
+        VMPP: float|numpy array
+            Our estimation of the PVSource voltage at the maximum power point.
+        error: float|numpy array|None
+            The minimum error percentage of V_best to serve as our minimum
+            stride. If None, the error of each tracker is kept.
+        mask: numpy array|None
+            Boolean array selecting the trackers to set up. If None, every
+            tracker is set up.
+        """
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self.VMPP[mask] = np.broadcast_to(VMPP, self._numTrackers)[mask]
+        if error is not None:
+            self.error[mask] = np.broadcast_to(error, self._numTrackers)[mask]
+
+    def getStrides(self, arrVoltages, arrCurrents, irradiances, temperatures):
+        """
+        Calculates the voltage stride of every tracker for its PVSource output.
+        May use prior history.
+
+        By default, we output a fixed stride.
+
+        Parameters
+        ----------
+        arrVoltages: numpy array
+            Array voltage of each tracker in V.
+        arrCurrents: numpy array
+            Array current of each tracker in A.
+        irradiances: numpy array
+            Irradiance of each tracker in W/M^2 (G)
+        temperatures: numpy array
+            Cell Temperature of each tracker in C.
+
+        Return
+        ------
+        numpy array: The change in voltage that should be applied to each array
+        in the next cycle.
+        """
+        return np.full(self._numTrackers, float(self._minStride))
+
+    def reset(self, mask=None):
+        """
+        Resets any internal variables set during operation.
+
+        Parameters
+        ----------
+        mask: numpy array|None
+            Boolean array selecting the trackers to reset. If None, every
+            tracker is reset.
+        """
+        if mask is None:
+            mask = np.ones(self._numTrackers, dtype=bool)
+        self.vOld[mask] = 0.0
+        self.pOld[mask] = 0.0
+
+    def getStrideType(self):
+        """
+        Returns the Stride model type used for the simulation.
+
+        Return
+        ------
+        String: Stride type name.
+        """
+        return self._strideType
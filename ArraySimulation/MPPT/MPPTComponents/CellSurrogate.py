@@ -0,0 +1,141 @@
+"""
+CellSurrogate.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+Description: Implementation of a fast cell model predicting the maximum power
+point voltage.
+
+The CellSurrogate class predicts the maximum power point voltage (VMPP) of a
+string of cells from the irradiance and temperature alone, without measuring
+the P-V curve. It uses the ideal single diode model of a cell, tuned to the
+datasheet of the Sunpower Maxeon III Bin Le1 solar cells:
+
+    I(V) = ISC - I0 * (exp(V / VT) - 1)
+    VT = k * T / q
+    VOC = VOC_REF + beta * (T - T_REF) + VT * ln(G / G_REF)
+    I0 = ISC * exp(-VOC / VT)
+
+At the MPP, dP/dV = 0, which for x = VMPP / VT reduces to
+
+    x + ln(1 + x) = ln(ISC / I0 + 1)
+
+where ISC / I0 = exp(VOC / VT) does not depend on ISC. This has no closed
+form, but converges in a handful of Newton iterations starting from
+x = VOC / VT. Cells in series share the current, so the VMPP of a string under
+uniform conditions is that of a cell times the number of cells.
+
+The surrogate does not model series or shunt resistance, the cell model
+actually simulated, or partial shading, so the prediction is expected to carry
+a residual error that a LocalMPPTAlgorithm corrects.
+"""
+# Library Imports.
+from math import exp, log
+
+
+# Custom Imports.
+
+
+class CellSurrogate:
+    """
+    The CellSurrogate class is a concrete class predicting the VMPP of a string
+    of cells from its irradiance and temperature.
+    """
+
+    # Reference values of the cell datasheet.
+    refIrrad = 1000  # Reference Cell Irradiance (W/M^2).
+    refTemp = 25 + 273.15  # Reference Cell Temperature (Celsius -> Kelvin).
+    refOCVoltage = 0.721  # Reference Open Circuit Voltage (V).
+    beta = -2.2e-3  # Temperature coefficient of VOC (V/K).
+    k = 1.381e-23  # Boltzmann's constant (J/K).
+    q = 1.602e-19  # Electron charge (C).
+
+    # Lowest irradiance (W/M^2) the model is evaluated at.
+    MIN_IRRADIANCE = 0.001
+
+    # Newton iterations of the MPP condition.
+    ITERATIONS = 8
+
+    def __init__(self, numCells=1):
+        """
+        Sets up the surrogate of a string of cells.
+
+        Parameters
+        ----------
+        numCells: int
+            The number of cells in series.
+        """
+        self._numCells = numCells
+
+    def getOCVoltage(self, irradiance, temperature):
+        """
+        Estimates the open circuit voltage of the string.
+
+        Parameters
+        ----------
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        float: The estimated VOC in V, or 0 if the cells do not conduct.
+        """
+        (OCVoltage, _) = self._getCellOCVoltage(irradiance, temperature)
+        return max(OCVoltage, 0.0) * self._numCells
+
+    def getMPPVoltage(self, irradiance, temperature):
+        """
+        Predicts the maximum power point voltage of the string.
+
+        Parameters
+        ----------
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        float: The predicted VMPP in V.
+        """
+        (OCVoltage, thermalVoltage) = self._getCellOCVoltage(irradiance, temperature)
+        if OCVoltage <= 0.0:
+            return 0.0
+
+        # Solve x + ln(1 + x) = ln(ISC / I0 + 1), with ISC / I0 = exp(VOC / VT).
+        x = OCVoltage / thermalVoltage
+        target = x + log(1 + exp(-x))
+        for _ in range(CellSurrogate.ITERATIONS):
+            x -= (x + log(1 + x) - target) / (1 + 1 / (1 + x))
+
+        return x * thermalVoltage * self._numCells
+
+    def _getCellOCVoltage(self, irradiance, temperature):
+        """
+        Returns the open circuit voltage and the thermal voltage of a cell.
+
+        Parameters
+        ----------
+        irradiance: float
+            Irradiance in W/M^2 (G)
+        temperature: float
+            Cell Temperature in C.
+
+        Return
+        ------
+        tuple: (VOC, VT) in V. VOC may be negative at low irradiance.
+        """
+        cellTemperature = temperature + 273.15
+        irradiance = max(irradiance, CellSurrogate.MIN_IRRADIANCE)
+        thermalVoltage = CellSurrogate.k * cellTemperature / CellSurrogate.q
+
+        OCVoltage = (
+            CellSurrogate.refOCVoltage
+            + CellSurrogate.beta * (cellTemperature - CellSurrogate.refTemp)
+            + thermalVoltage * log(irradiance / CellSurrogate.refIrrad)
+        )
+        return (OCVoltage, thermalVoltage)
@@ -59,7 +59,7 @@ class Stride:
         # User defined error for determining variable minimum stride distance.
         self.error = error
 
-    def setup(self, VMPP=0.621, error=0.05):
+    def setup(self, VMPP=0.621, error=None):
         """
         Reinitializes the predicted parameters for the local MPPT algorithms context.
 
@@ -69,11 +69,13 @@ class Stride:
             Our estimation of the PVSource voltage at the maximum power point.
             Note that the default value is for a single cell and is an
             experimental estimate; according to Sunniva the cell VMPP is 0.621.
-        error: float
+        error: float|None
             The minimum error percentage of V_best to serve as our minimum stride.
+            If None, the error the stride model was set up with is kept.
         """
         self.VMPP = VMPP
-        self.error = error
+        if error is not None:
+            self.error = error
 
     def getStride(self, arrVoltage, arrCurrent, irradiance, temperature):
         """
@@ -1,18 +1,21 @@
 """
-PVSource.py
+PVEnvironment.py
 
 Author: Matthew Yu, Array Lead (2020).
 Contact: matthewjkyu@gmail.com
 Created: 11/14/20
-Last Modified: 03/07/21
+Last Modified: 10/19/26
 
 Description: Implementation of the PVEnvironment class.
 """
 # Library Imports.
+import copy
 import json
 import jsbeautifier
+import numpy as np
 
 # Custom Imports.
+from ArraySimulation.PVEnvironment.StochasticEnvironment import StochasticEnvironment
 
 
 class PVEnvironment:
@@ -21,14 +24,22 @@ class PVEnvironment:
     environmental conditions received by the PVSource at any cycle. In fact, it
     manages the cycle time of the entire simulation, and outputs the
     environmental conditions based on that cycle. It has the ability to extract
-    environmental regimes from JSON files, as well as generate a unit step
-    function with a fixed irradiance and temperature for steady state behavior
-    testing.
+    environmental regimes from JSON files, generate seeded stochastic regimes
+    (see StochasticEnvironment), as well as generate a unit step function with
+    a fixed irradiance and temperature for steady state behavior testing.
     """
 
     # The smallest cycle number the simulation can be.
     MIN_CYCLES = 0
 
+    # The default amount of time between consecutive cycles of the
+    # environmental regime, in seconds.
+    DEFAULT_CYCLE_PERIOD = 1.0
+
+    # Tolerance, in cycles, used to snap accumulated times onto cycle
+    # boundaries.
+    _CYCLE_TOLERANCE = 1e-6
+
     # A dictionary referencing module_type strings to the number of cells.
     _cellDefinitions = {"1x1": 1, "1x2": 2, "2x2": 4, "2x4": 8}
 
@@ -38,18 +49,26 @@ class PVEnvironment:
     def __init__(self):
         pass
 
-    def setupModel(self, source=(1, 1000, 25), maxCycles=200):
+    def setupModel(
+        self, source=(1, 1000, 25), maxCycles=200, cyclePeriod=None, dt=None
+    ):
         """
         Sets up the initial source parameters.
 
         Parameters
         ----------
-        source: Union -> tuple `(1, 1000, 255)` or string `single_cell.json`
+        source: Union -> tuple `(1, 1000, 255)`, string `single_cell.json`, or
+            dict
             Specifies how and/or where the source model is defined and its
             environmental regime over time. It checks for either a tuple of
-            initial conditions (Step response mode) or a string pointing to a
-            JSON file in 'External/'. Step response mode can only performed with
-            a single module of arbitrary cell length.
+            initial conditions (Step response mode), a string pointing to a
+            JSON file in 'External/', or a dictionary in the same format as the
+            JSON files (i.e. generated by StochasticEnvironment). Step response
+            mode can only performed with a single module of arbitrary cell
+            length.
+
+            Modules with the env_type "Stochastic" have their env_regime
+            generated from the model parameters it contains.
 
             The method builds a data model of the modules in the PVSource and
             a mapping of their environmental regime to return on demand.
@@ -57,6 +76,14 @@ class PVEnvironment:
             A tuple may only have 1, 2, 4, or 8 cells in the step response.
         maxCycles: int
             Maximum number of cycles our environment should extend to.
+        cyclePeriod: float|None
+            Time between consecutive cycles of the environmental regime, in
+            seconds. If None, the "cycle_period" entry of the source model is
+            used if it exists, otherwise DEFAULT_CYCLE_PERIOD.
+        dt: float|None
+            Default time step, in seconds, used by incrementTime(). If None,
+            it is one cycle period. Smaller steps interpolate the environment
+            between cycles; larger steps skip over cycles.
 
         Return
         ------
@@ -67,6 +94,10 @@ class PVEnvironment:
         # conditions come out at the time. Adjustable.
         self._cycle = PVEnvironment.MIN_CYCLES
 
+        # Current time of the PVEnvironment, in seconds. The current cycle is
+        # the cycle that the current time falls within.
+        self._time = 0.0
+
         # Maximum cycle in the environment. We extrapolate data up to this point.
         self._maxCycle = maxCycles
 
@@ -79,11 +110,19 @@ class PVEnvironment:
 
                 # Check for relevant filename at /External/
                 self._source = json.load(open(PVEnvironment._fileRoot + source))
-
-                return True
+                self._generateStochasticRegimes()
 
                 # TODO: validate whether the header matches.
+            elif isinstance(source, dict):
+                # In memory source model input.
+                # The source is copied, so that generating the stochastic
+                # regimes does not modify the caller's model.
+                self._sourceFile = None
+                self._source = copy.deepcopy(source)
+                self._generateStochasticRegimes()
             elif isinstance(source, tuple):
+                self._sourceFile = None
+                self._stochasticModules = {}
                 self._source = {
                     "name": "Single String Model.",
                     "description": str(source[0])
@@ -118,18 +157,124 @@ class PVEnvironment:
                         }
                     },
                 }
-                return True
             else:
                 raise Exception(
                     "Invalid source. Currently supported types are a "
-                    + "properly formatted JSON file or a step response tuple in "
-                    + "the format (irradiance, temperature)."
+                    + "properly formatted JSON file, a source model dictionary, "
+                    + "or a step response tuple in the format (irradiance, "
+                    + "temperature)."
                 )
+
+            if cyclePeriod is None:
+                cyclePeriod = self._source.get(
+                    "cycle_period", PVEnvironment.DEFAULT_CYCLE_PERIOD
+                )
+            if cyclePeriod <= 0:
+                raise Exception("The cycle period must be positive.")
+            self._cyclePeriod = cyclePeriod
+            self._dt = cyclePeriod if dt is None else dt
+
+            self._buildCache()
+            return True
         except Exception as e:
             print(e)
             self._source = None
             return False
 
+    def _generateStochasticRegimes(self):
+        """
+        Replaces the env_regime of every "Stochastic" module in the source
+        with a regime generated up to the max cycle. The module is then
+        treated as an already interpolated "Array" module.
+
+        The original definitions of the "Stochastic" modules are kept, so that
+        saveEnvironment writes back the model rather than the regime.
+        """
+        # Dictionary of the original definitions of "Stochastic" modules.
+        self._stochasticModules = {}
+        for (moduleName, module) in self._source["pv_model"].items():
+            if module["env_type"] == "Stochastic":
+                self._stochasticModules[moduleName] = copy.deepcopy(module)
+                model = StochasticEnvironment.fromJSON(module["env_regime"])
+                (irradiance, temperature) = model.generateRegime(self._maxCycle)
+                module["env_type"] = "Array"
+                module["needs_interp"] = True
+                module["env_regime"] = [
+                    list(entry)
+                    for entry in zip(
+                        range(self._maxCycle + 1),
+                        irradiance.tolist(),
+                        temperature.tolist(),
+                    )
+                ]
+
+    def _buildCache(self):
+        """
+        Caches the parts of the source that are fixed for the lifetime of the
+        model (the module mapping and cell counts) and the environmental
+        conditions of every module at every cycle.
+
+        The environmental conditions are stored as arrays indexed by
+        [cycle, module], so retrieving the conditions at any cycle is a single
+        array lookup regardless of the number of modules. "Array" modules are
+        linearly interpolated between entries in their env_regime, and the
+        last entry is held until the max cycle.
+
+        Throws an exception for invalid module types.
+        """
+        modules = self._source["pv_model"]
+
+        # Immutable module properties.
+        self._moduleMapping = {}
+        self._moduleNumCells = {}
+        self._moduleIndices = {}
+        for (idx, (moduleName, module)) in enumerate(modules.items()):
+            self._moduleMapping[moduleName] = module["module_type"]
+            self._moduleNumCells[moduleName] = PVEnvironment._cellDefinitions[
+                module["module_type"]
+            ]
+            self._moduleIndices[moduleName] = idx
+        self._sourceNumCells = sum(self._moduleNumCells.values())
+
+        # Per cycle environment snapshots for each module.
+        cycles = np.arange(self._maxCycle + 1)
+        self._irradiance = np.empty((len(cycles), len(modules)))
+        self._temperature = np.empty((len(cycles), len(modules)))
+        for (moduleName, module) in modules.items():
+            idx = self._moduleIndices[moduleName]
+            if module["env_type"] == "Array":
+                events = np.asarray(module["env_regime"], dtype=float)
+                self._irradiance[:, idx] = np.interp(cycles, events[:, 0], events[:, 1])
+                self._temperature[:, idx] = np.interp(
+                    cycles, events[:, 0], events[:, 2]
+                )
+            elif module["env_type"] == "Step":
+                self._irradiance[:, idx] = module["env_regime"][0]
+                self._temperature[:, idx] = module["env_regime"][1]
+            else:
+                raise Exception("Undefined environment type " + module["env_type"])
+
+        # Per cycle environment snapshots of the entire source, weighted by the
+        # number of cells in each module.
+        weights = np.array(
+            [self._moduleNumCells[moduleName] for moduleName in modules.keys()]
+        )
+        weights = weights / self._sourceNumCells
+        self._sourceIrradiance = self._irradiance @ weights
+        self._sourceTemperature = self._temperature @ weights
+
+        # Cycles at which the environment differs from the previous cycle.
+        # The environment is static between cycle c - 1 and the next change
+        # cycle after it.
+        changed = np.any(np.diff(self._irradiance, axis=0) != 0, axis=1) | np.any(
+            np.diff(self._temperature, axis=0) != 0, axis=1
+        )
+        self._changeCycles = np.flatnonzero(changed) + 1
+
+        # Snapshot of the environment at the current time. See _getSnapshot().
+        self._snapshotTime = None
+        self._snapshot = None
+
     def getCycle(self):
         """
         Returns the current cycle of the environment.
@@ -143,7 +288,7 @@ class PVEnvironment:
     def setCycle(self, cycle):
         """
         Sets the internal cycle of the PVEnvironment. Cannot be larger than max
-        cycle.
+        cycle. The time is set to the start of the cycle.
 
         Parameters
         ----------
@@ -156,6 +301,7 @@ class PVEnvironment:
         """
         if PVEnvironment.MIN_CYCLES <= cycle and cycle <= self._maxCycle:
             self._cycle = cycle
+            self._time = cycle * self._cyclePeriod
             return True
         else:
             print(
@@ -167,8 +313,8 @@ class PVEnvironment:
 
     def incrementCycle(self):
         """
-        Cycles the internal clock once. Halts the clock when the max cycle is
-        reached.
+        Cycles the internal clock once, to the start of the next cycle. Halts
+        the clock when the max cycle is reached.
 
         Return
         ------
@@ -176,9 +322,287 @@ class PVEnvironment:
         """
         if self._cycle < self._maxCycle:
             self._cycle += 1
+            self._time = self._cycle * self._cyclePeriod
+            return True
+        return False
+
+    def getTime(self):
+        """
+        Returns the current time of the environment.
+
+        Return
+        ------
+        float: Current time in seconds.
+        """
+        return self._time
+
+    def getMaxTime(self):
+        """
+        Returns the time of the max cycle of the environment.
+
+        Return
+        ------
+        float: Max time in seconds.
+        """
+        return self._maxCycle * self._cyclePeriod
+
+    def setTime(self, time):
+        """
+        Sets the internal time of the PVEnvironment. Cannot be larger than the
+        time of the max cycle.
+
+        Parameters
+        ----------
+        time: float
+            The current moment in time, in seconds, the environment should be
+            set to.
+
+        Return
+        ------
+        bool: Whether the time was successfully set or not.
+        """
+        if 0 <= time and time <= self.getMaxTime():
+            # Snap onto the nearest cycle boundary to drop the floating point
+            # error accumulated by repeated time steps.
+            cycle = round(time / self._cyclePeriod)
+            if abs(time / self._cyclePeriod - cycle) < PVEnvironment._CYCLE_TOLERANCE:
+                time = cycle * self._cyclePeriod
+
+            self._time = time
+            self._cycle = int(self.timeToCycle(time))
             return True
+        else:
+            print(
+                "We can never have a negative time in the PVEnvironment, nor "
+                + "can we exceed the time of the maximum cycle defined at "
+                + "initialization. As such, the current time is not changed."
+            )
+            return False
+
+    def incrementTime(self, dt=None):
+        """
+        Advances the internal clock by a time step. The last step is truncated
+        to end at the time of the max cycle, and the clock halts there.
+
+        Parameters
+        ----------
+        dt: float|None
+            Time step in seconds. If None, the default time step defined at
+            setup is used.
+
+        Return
+        ------
+        bool: Whether the time was successfully incremented or not.
+        """
+        if dt is None:
+            dt = self._dt
+        maxTime = self.getMaxTime()
+        if self._time < maxTime:
+            return self.setTime(min(self._time + dt, maxTime))
         return False
 
+    def getTimeStep(self):
+        """
+        Returns the default time step used by incrementTime().
+
+        Return
+        ------
+        float: Time step in seconds.
+        """
+        return self._dt
+
+    def setTimeStep(self, dt):
+        """
+        Sets the default time step used by incrementTime().
+
+        Parameters
+        ----------
+        dt: float
+            Time step in seconds.
+        """
+        self._dt = dt
+
+    def getCyclePeriod(self):
+        """
+        Returns the time between consecutive cycles of the environment.
+
+        Return
+        ------
+        float: Cycle period in seconds.
+        """
+        return self._cyclePeriod
+
+    def cycleToTime(self, cycles):
+        """
+        Converts cycles into the time at the start of each cycle.
+
+        Parameters
+        ----------
+        cycles: int|numpy array
+            Cycle or cycles to convert.
+
+        Return
+        ------
+        float|numpy array: Time or times in seconds.
+        """
+        return np.asarray(cycles) * self._cyclePeriod
+
+    def timeToCycle(self, times):
+        """
+        Converts times into the cycle that each time falls within. Times within
+        a small tolerance of the start of a cycle are considered to be in that
+        cycle, so accumulated floating point error does not drop a cycle.
+
+        Parameters
+        ----------
+        times: float|numpy array
+            Time or times in seconds to convert.
+
+        Return
+        ------
+        int|numpy array: Cycle or cycles.
+        """
+        return np.floor(
+            np.asarray(times) / self._cyclePeriod + PVEnvironment._CYCLE_TOLERANCE
+        ).astype(np.int64)
+
+    def getNextChangeTime(self, time=None):
+        """
+        Returns the time at which the environment next starts to change. The
+        environment is guaranteed to be static between the given time and the
+        returned time, so the clock can be stepped across that interval in one
+        go.
+
+        Parameters
+        ----------
+        time: float|None
+            Time to start looking from, in seconds. If None, the current time
+            is used.
+
+        Return
+        ------
+        float: The time at which the environment starts to change, or the time
+        of the max cycle if it never changes again. Equal to the given time if
+        the environment is changing at that time.
+        """
+        if time is None:
+            time = self._time
+        cycle = int(self.timeToCycle(time))
+
+        # Find the first cycle after the current cycle that differs from its
+        # predecessor; the environment starts moving at its predecessor.
+        idx = np.searchsorted(self._changeCycles, cycle + 1)
+        if idx == len(self._changeCycles):
+            return self.getMaxTime()
+        return max(time, float(self.cycleToTime(self._changeCycles[idx] - 1)))
+
+    def getEnvironmentAtTimes(self, times):
+        """
+        Returns the environment of every module at a set of times. Times
+        between cycles are linearly interpolated between the two cycles.
+
+        Parameters
+        ----------
+        times: numpy array
+            Times in seconds. Clipped to [0, max time].
+
+        Return
+        ------
+        tuple: (irradiance: numpy array, temperature: numpy array)
+            Arrays of shape (len(times), number of modules), with the modules
+            in the same order as getModuleMapping().
+        """
+        (lower, upper, frac) = self._getInterpolationWeights(times)
+        frac = frac[:, np.newaxis]
+        irradiance = self._irradiance[lower] + frac * (
+            self._irradiance[upper] - self._irradiance[lower]
+        )
+        temperature = self._temperature[lower] + frac * (
+            self._temperature[upper] - self._temperature[lower]
+        )
+        return (irradiance, temperature)
+
+    def getSourceEnvironmentAtTimes(self, times):
+        """
+        Returns the weighted average environment of the source at a set of
+        times. See getSourceEnvironmentDefinition().
+
+        Parameters
+        ----------
+        times: numpy array
+            Times in seconds. Clipped to [0, max time].
+
+        Return
+        ------
+        tuple: (irradiance: numpy array, temperature: numpy array)
+            Arrays of length len(times).
+        """
+        (lower, upper, frac) = self._getInterpolationWeights(times)
+        irradiance = self._sourceIrradiance[lower] + frac * (
+            self._sourceIrradiance[upper] - self._sourceIrradiance[lower]
+        )
+        temperature = self._sourceTemperature[lower] + frac * (
+            self._sourceTemperature[upper] - self._sourceTemperature[lower]
+        )
+        return (irradiance, temperature)
+
+    def _getInterpolationWeights(self, times):
+        """
+        Finds the cycles surrounding each time and the fraction of the way
+        each time is between them.
+
+        Parameters
+        ----------
+        times: float|numpy array
+            Times in seconds. Clipped to [0, max time].
+
+        Return
+        ------
+        tuple: (lower: numpy array, upper: numpy array, frac: numpy array)
+        """
+        times = np.clip(np.atleast_1d(np.asarray(times, dtype=float)), 0, None)
+        lower = np.minimum(self.timeToCycle(times), self._maxCycle)
+        upper = np.minimum(lower + 1, self._maxCycle)
+        frac = np.clip(times / self._cyclePeriod - lower, 0.0, 1.0)
+        frac[frac < PVEnvironment._CYCLE_TOLERANCE] = 0.0
+        return (lower, upper, frac)
+
+    def _getSnapshot(self):
+        """
+        Returns the environment at the current time. On a cycle boundary this
+        is the cached cycle entry; in between cycles it is interpolated. The
+        result is cached until the time changes.
+
+        Return
+        ------
+        tuple: (irradiances: list, temperatures: list, envDef: dict)
+            The irradiance and temperature of each module, and the weighted
+            environment definition of the source.
+        """
+        if self._snapshotTime != self._time:
+            (lower, upper, frac) = self._getInterpolationWeights(self._time)
+            if frac[0] == 0.0:
+                irradiances = self._irradiance[lower[0]]
+                temperatures = self._temperature[lower[0]]
+                envDef = {
+                    "irradiance": float(self._sourceIrradiance[lower[0]]),
+                    "temperature": float(self._sourceTemperature[lower[0]]),
+                }
+            else:
+                (irradiances, temperatures) = self.getEnvironmentAtTimes(self._time)
+                irradiances = irradiances[0]
+                temperatures = temperatures[0]
+                (sourceIrradiance, sourceTemperature) = (
+                    self.getSourceEnvironmentAtTimes(self._time)
+                )
+                envDef = {
+                    "irradiance": float(sourceIrradiance[0]),
+                    "temperature": float(sourceTemperature[0]),
+                }
+            self._snapshot = (irradiances.tolist(), temperatures.tolist(), envDef)
+            self._snapshotTime = self._time
+        return self._snapshot
+
     def getModuleDefinition(self, moduleName, voltage):
         """
         Gets the module definition of a specific module at the current cycle.
@@ -204,71 +628,21 @@ class PVEnvironment:
         -------
         dict:  moduleDef
             A dictionary of the selected module's properties.
-        Throws an exception for non existent modules and invalid module types.
+        Throws an exception for non existent modules.
 
-        If the entry in the env_regime does not exist for the module, this
-        method will perform a comprehensive interpolation for the profile up
-        until the max cycle.
+        The environmental conditions are read from the per cycle snapshots
+        built at setup, and interpolated if the current time is between
+        cycles.
         """
-        module = self._source["pv_model"].get(moduleName)
-        if module is not None:
-            if module["env_type"] == "Array":
-                if (
-                    module["needs_interp"] == False
-                    or module["env_regime"][self._cycle][0] != self._cycle
-                ):
-                    # Take the current and next entry and add all interpolations
-                    # to a new list.
-                    events = []
-                    for (idx, event) in enumerate(module["env_regime"][0:-1]):
-                        currEvent = event
-                        nextEvent = module["env_regime"][
-                            (idx + 1) % len(module["env_regime"])
-                        ]
-                        numEntries = nextEvent[0] - currEvent[0]
-                        slopeIrrad = (nextEvent[1] - currEvent[1]) / numEntries
-                        slopeTemp = (nextEvent[2] - currEvent[2]) / numEntries
-
-                        for idx in range(currEvent[0], nextEvent[0]):
-                            events.append(
-                                [
-                                    idx,
-                                    currEvent[1] + slopeIrrad * (idx - currEvent[0]),
-                                    currEvent[2] + slopeTemp * (idx - currEvent[0]),
-                                ]
-                            )
-
-                    # Append the last event.
-                    events.append(module["env_regime"][-1])
-
-                    # Write the last interpolated event for all cycles extending
-                    # to max_cycles.
-                    lastEvent = events[-1]
-                    for idx in range(lastEvent[0] + 1, self._maxCycle + 1):
-                        events.append([idx, lastEvent[1], lastEvent[2]])
-
-                    module["env_regime"] = events
-                    module["needs_interp"] = True
-
-                # Get current model conditions.
-                envConditions = module["env_regime"][self._cycle]
-
-                # An array of size 2 is returned.
-                return {
-                    "numCells": PVEnvironment._cellDefinitions[module["module_type"]],
-                    "voltage": voltage,
-                    "irradiance": envConditions[1],
-                    "temperature": envConditions[2],
-                }
-            elif module["env_type"] == "Step":
-                return {
-                    "numCells": PVEnvironment._cellDefinitions[module["module_type"]],
-                    "voltage": voltage,
-                    "irradiance": module["env_regime"][0],
-                    "temperature": module["env_regime"][1],
-                }
-            else:
-                raise Exception("Undefined environment type " + module["env_type"])
+        idx = self._moduleIndices.get(moduleName)
+        if idx is not None:
+            (irradiances, temperatures, _) = self._getSnapshot()
+            return {
+                "numCells": self._moduleNumCells[moduleName],
+                "voltage": voltage,
+                "irradiance": irradiances[idx],
+                "temperature": temperatures[idx],
+            }
         else:
             raise Exception(
                 "Module does not exist in PVEnvironment with the name " + moduleName
@@ -276,7 +650,7 @@ class PVEnvironment:
 
     def getSourceDefinition(self, voltage):
         """
-        Gets the source definition at the current cycle.
+        Gets the source definition at the current time.
 
         The modules definition is in the following format:
 
@@ -298,13 +672,19 @@ class PVEnvironment:
         Returns
         -------
         dict:  modulesDef
-            A dictionary of the source properties.
-        Throws an exception for non existent modules and invalid module types.
+            A dictionary of the source properties. A new dictionary is built
+            every call, since consumers (i.e. PVSource.getIV) modify the
+            voltage of each module in place.
         """
+        (irradiances, temperatures, _) = self._getSnapshot()
         modulesDef = {}
-        modules = self._source["pv_model"]
-        for key in modules.keys():
-            modulesDef[key] = self.getModuleDefinition(key, voltage)
+        for (moduleName, idx) in self._moduleIndices.items():
+            modulesDef[moduleName] = {
+                "numCells": self._moduleNumCells[moduleName],
+                "voltage": voltage,
+                "irradiance": irradiances[idx],
+                "temperature": temperatures[idx],
+            }
         return modulesDef
 
     def getModuleNumCells(self, moduleName):
@@ -321,8 +701,7 @@ class PVEnvironment:
         -------
         int: Number of cells in series within this module.
         """
-        modulesDict = self.getModuleMapping()
-        return PVEnvironment._cellDefinitions[modulesDict[moduleName]]
+        return self._moduleNumCells[moduleName]
 
     def getSourceNumCells(self):
         """
@@ -332,10 +711,7 @@ class PVEnvironment:
         -------
         int: Number of cells in series within the entire array.
         """
-        numCells = 0
-        for moduleName in self._source["pv_model"].keys():
-            numCells += self.getModuleNumCells(moduleName)
-        return numCells
+        return self._sourceNumCells
 
     def getModuleEnvironmentDefinition(self, moduleName):
         """
@@ -359,7 +735,7 @@ class PVEnvironment:
         -------
         dict:  moduleDef
             A dictionary of the source environment properties.
-        Throws an exception for non existent modules and invalid module types.
+        Throws an exception for non existent modules.
         """
         moduleDef = self.getModuleDefinition(moduleName, 0)
         return {
@@ -383,27 +759,7 @@ class PVEnvironment:
         dict: envDef
             A dictionary of the source environment properties, weighted.
         """
-        totalIrrad = 0
-        totalTemp = 0
-        cellCount = 0
-        modules = self._source["pv_model"]
-        for key in modules.keys():
-            module = modules[key]
-            numCells = PVEnvironment._cellDefinitions[module["module_type"]]
-            cellCount += numCells
-            if module["env_type"] == "Array":
-                totalIrrad += numCells * module["env_regime"][self._cycle][1]
-                totalTemp += numCells * module["env_regime"][self._cycle][2]
-            elif module["env_type"] == "Step":
-                totalIrrad += numCells * module["env_regime"][0]
-                totalTemp += numCells * module["env_regime"][1]
-            else:
-                raise Exception("Undefined environment type.")
-
-        return {
-            "irradiance": totalIrrad / cellCount,
-            "temperature": totalTemp / cellCount,
-        }
+        return dict(self._getSnapshot()[2])
 
     def getModuleMapping(self):
         """
@@ -416,18 +772,44 @@ class PVEnvironment:
             A dictionary of modules where each module key defines the cell
             layout of the module.
         """
-        modulesDict = {}
-        for module in self._source["pv_model"].items():
-            modulesDict[module[0]] = module[1]["module_type"]
-        return modulesDict
+        return dict(self._moduleMapping)
 
     def saveEnvironment(self):
         """
         This function saves the environment file in place of the previous
         environment file. Useful if the user wants to retain interpolation.
+
+        "Stochastic" modules are saved with their original model definition,
+        not the regime generated from it, so the seeded model is kept.
         """
+        if self._sourceFile is None:
+            raise Exception(
+                "The environment has no source file to save to. Only sources "
+                + "loaded from a JSON file in 'External/' can be saved."
+            )
+
+        cycles = range(self._maxCycle + 1)
+        for (moduleName, module) in self._source["pv_model"].items():
+            if (
+                module["env_type"] == "Array"
+                and moduleName not in self._stochasticModules
+            ):
+                idx = self._moduleIndices[moduleName]
+                module["env_regime"] = [
+                    list(entry)
+                    for entry in zip(
+                        cycles,
+                        self._irradiance[:, idx].tolist(),
+                        self._temperature[:, idx].tolist(),
+                    )
+                ]
+                module["needs_interp"] = True
+
+        source = dict(self._source)
+        source["pv_model"] = dict(self._source["pv_model"])
+        source["pv_model"].update(self._stochasticModules)
+
         with open(PVEnvironment._fileRoot + self._sourceFile, "w") as fp:
             options = jsbeautifier.default_options()
             options.indent_size = 4
-            fp.write(jsbeautifier.beautify(json.dumps(self._source), options))
-            json.dump(self._source, fp)
+            fp.write(jsbeautifier.beautify(json.dumps(source), options))
@@ -0,0 +1,371 @@
+"""
+StochasticEnvironment.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Implementation of the StochasticEnvironment class.
+
+The StochasticEnvironment synthesizes environmental regimes (irradiance and
+temperature over cycle time) from a seeded stochastic model instead of reading
+them from a hand written JSON profile. The model is composed of three parts:
+
+    1. A clear sky envelope. This is a half sine over the daylight period,
+
+        G_clear(c) = G_peak * sin(pi * (c - dayOffset) / dayLength)
+
+       clipped at 0 outside of daylight. If no day length is given, the
+       envelope is flat at G_peak.
+
+    2. A Markov chain of cloud states. Each state has a transmittance
+       (the fraction of the clear sky irradiance that reaches the cell) and
+       the chain transitions between states every cycle according to a
+       row-stochastic transition matrix. The chain is generated by sampling
+       the geometric dwell time of each state, so the work done is
+       proportional to the number of cloud events rather than the number of
+       cycles.
+
+        G(c) = G_clear(c) * transmittance[state(c)]
+
+    3. A first order thermal lag on the cell temperature. The cell approaches
+       the steady state temperature
+
+        T_target(c) = T_ambient + thermalCoefficient * G(c)
+
+       with a time constant of tau cycles,
+
+        T(c) = a * T(c - 1) + (1 - a) * T_target(c),   a = exp(-1 / tau)
+
+       which is solved exactly in blocks of cycles, in time linear in the
+       number of cycles.
+
+Every random draw comes from a numpy Generator built from the seed, so the
+same parameters and seed always produce the same regime. This allows
+thousands of reproducible scenarios to be generated on demand (i.e. in worker
+processes) without storing them.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+class StochasticEnvironment:
+    """
+    The StochasticEnvironment class generates seeded irradiance and temperature
+    regimes for one or more modules. The output can either be consumed
+    directly as arrays or be packaged into a source model dictionary that the
+    PVEnvironment ingests in the same way as a JSON file.
+    """
+
+    # Default cloud states: clear sky, thin cloud, and thick cloud.
+    DEFAULT_TRANSMITTANCE = [1.0, 0.6, 0.2]
+
+    # Default per cycle transition probabilities between the cloud states.
+    # Row i is the probability distribution of the next state given state i.
+    DEFAULT_TRANSITIONS = [
+        [0.990, 0.008, 0.002],
+        [0.030, 0.950, 0.020],
+        [0.010, 0.040, 0.950],
+    ]
+
+    # The thermal lag is solved in blocks, short enough that the decay over a
+    # block stays above the inverse of this value.
+    _BLOCK_RANGE = 1e6
+
+    # A mapping of the parameter names used in JSON source files to the
+    # constructor arguments of this class.
+    _JSON_KEYS = {
+        "seed": "seed",
+        "peak_irradiance": "peakIrradiance",
+        "day_length": "dayLength",
+        "day_offset": "dayOffset",
+        "cloud_transmittance": "transmittance",
+        "cloud_transitions": "transitions",
+        "ambient_temperature": "ambientTemperature",
+        "thermal_coefficient": "thermalCoefficient",
+        "thermal_time_constant": "thermalTimeConstant",
+    }
+
+    def __init__(
+        self,
+        seed=0,
+        peakIrradiance=1000,
+        dayLength=None,
+        dayOffset=0,
+        transmittance=DEFAULT_TRANSMITTANCE,
+        transitions=DEFAULT_TRANSITIONS,
+        ambientTemperature=25,
+        thermalCoefficient=0.03,
+        thermalTimeConstant=30,
+    ):
+        """
+        Sets up the stochastic model parameters.
+
+        Parameters
+        ----------
+        seed: int
+            Seed of the random number generator. Identical seeds and parameters
+            generate identical regimes.
+        peakIrradiance: float
+            Clear sky irradiance at solar noon in W/M^2 (G).
+        dayLength: int|None
+            Number of cycles between sunrise and sunset. If None, the clear sky
+            envelope is flat at the peak irradiance.
+        dayOffset: int
+            The cycle at which sunrise occurs.
+        transmittance: List of floats
+            Fraction of the clear sky irradiance transmitted in each cloud
+            state. The first state is the initial state of the chain.
+        transitions: List of lists of floats
+            Row-stochastic matrix of per cycle transition probabilities
+            between cloud states.
+        ambientTemperature: float
+            Ambient temperature in C.
+        thermalCoefficient: float
+            Steady state rise of the cell temperature over ambient per unit of
+            irradiance, in C/(W/M^2).
+        thermalTimeConstant: float
+            Time constant of the cell temperature, in cycles. A value of 0
+            disables the thermal lag.
+        """
+        self._seed = seed
+        self._peakIrradiance = peakIrradiance
+        self._dayLength = dayLength
+        self._dayOffset = dayOffset
+        self._transmittance = np.asarray(transmittance, dtype=float)
+        self._transitions = np.asarray(transitions, dtype=float)
+        self._ambientTemperature = ambientTemperature
+        self._thermalCoefficient = thermalCoefficient
+        self._thermalTimeConstant = thermalTimeConstant
+
+        numStates = len(self._transmittance)
+        if self._transitions.shape != (numStates, numStates):
+            raise Exception(
+                "The cloud transition matrix must be of shape "
+                + str((numStates, numStates))
+                + ", not "
+                + str(self._transitions.shape)
+                + "."
+            )
+        if not np.allclose(self._transitions.sum(axis=1), 1.0):
+            raise Exception("Each row of the cloud transition matrix must sum to 1.")
+
+    @classmethod
+    def fromJSON(cls, params):
+        """
+        Builds a StochasticEnvironment from the env_regime dictionary of a
+        module of type "Stochastic" in a JSON source file.
+
+        Parameters
+        ----------
+        params: Dict
+            A dictionary of model parameters keyed by their JSON names, i.e.
+            {"seed": 4, "day_length": 3600, "thermal_time_constant": 60}.
+            Omitted parameters take on their default values.
+
+        Return
+        ------
+        StochasticEnvironment: The model described by the parameters.
+        """
+        kwargs = {}
+        for (key, value) in params.items():
+            if key not in cls._JSON_KEYS:
+                raise Exception("Undefined stochastic environment parameter " + key)
+            kwargs[cls._JSON_KEYS[key]] = value
+        return cls(**kwargs)
+
+    def generateRegime(self, maxCycles, seed=None):
+        """
+        Generates the irradiance and temperature for every cycle in
+        [0, maxCycles].
+
+        Parameters
+        ----------
+        maxCycles: int
+            The last cycle to generate conditions for.
+        seed: int|numpy.random.SeedSequence|None
+            Overrides the seed of the model for this regime. Used to derive
+            independent cloud chains for each module.
+
+        Return
+        ------
+        tuple: (irradiance: numpy array, temperature: numpy array)
+            Arrays of length maxCycles + 1 indexed by cycle.
+        """
+        rng = np.random.default_rng(self._seed if seed is None else seed)
+        numCycles = maxCycles + 1
+
+        irradiance = self._getClearSkyIrradiance(numCycles)
+        states = self._getCloudStates(rng, numCycles)
+        irradiance *= self._transmittance[states]
+
+        temperature = self._getCellTemperature(irradiance)
+
+        return (irradiance, temperature)
+
+    def generateSource(
+        self, maxCycles, numModules=1, moduleType="1x1", sharedClouds=True
+    ):
+        """
+        Generates a source model dictionary of the same format as the JSON
+        files in External/. It can be passed directly into
+        PVEnvironment.setupModel().
+
+        Parameters
+        ----------
+        maxCycles: int
+            The last cycle to generate conditions for.
+        numModules: int
+            Number of modules in the source.
+        moduleType: String
+            Cell layout of each module, i.e. "1x1".
+        sharedClouds: bool
+            If True, every module sees the same cloud chain (a small array
+            under a large cloud). Otherwise each module is assigned an
+            independent chain derived from the seed, emulating partial shading.
+
+        Return
+        ------
+        dict: The source model.
+        """
+        if sharedClouds:
+            seeds = [self._seed] * numModules
+        else:
+            seeds = np.random.SeedSequence(self._seed).spawn(numModules)
+
+        cycles = list(range(maxCycles + 1))
+        pvModel = {}
+        for moduleNum, seed in enumerate(seeds):
+            (irradiance, temperature) = self.generateRegime(maxCycles, seed)
+            pvModel[str(moduleNum)] = {
+                "module_num": moduleNum,
+                "module_type": moduleType,
+                "env_type": "Array",
+                # The regime has an entry for every cycle and does not need to
+                # be interpolated.
+                "needs_interp": True,
+                "env_regime": [
+                    list(entry)
+                    for entry in zip(cycles, irradiance.tolist(), temperature.tolist())
+                ],
+            }
+
+        return {
+            "name": "Stochastic Scenario " + str(self._seed),
+            "description": str(numModules)
+            + " module(s) with a seeded clear sky envelope, Markov cloud "
+            + "transitions, and a first order thermal lag.",
+            "num_modules": numModules,
+            "pv_model": pvModel,
+        }
+
+    def _getClearSkyIrradiance(self, numCycles):
+        """
+        Generates the clear sky irradiance envelope.
+
+        Parameters
+        ----------
+        numCycles: int
+            Number of cycles to generate.
+
+        Return
+        ------
+        numpy array: Clear sky irradiance for each cycle.
+        """
+        if self._dayLength is None:
+            return np.full(numCycles, float(self._peakIrradiance))
+
+        phase = (np.arange(numCycles) - self._dayOffset) / self._dayLength
+        envelope = np.sin(np.pi * phase)
+        envelope[(phase < 0) | (phase > 1)] = 0.0
+        return self._peakIrradiance * np.clip(envelope, 0.0, None)
+
+    def _getCloudStates(self, rng, numCycles):
+        """
+        Generates the cloud state of each cycle from the Markov chain. The
+        chain is built one dwell period at a time; the dwell time in state i
+        is geometrically distributed with parameter 1 - P[i, i].
+
+        Parameters
+        ----------
+        rng: numpy.random.Generator
+            Seeded random number generator.
+        numCycles: int
+            Number of cycles to generate.
+
+        Return
+        ------
+        numpy array: Cloud state index for each cycle.
+        """
+        stayProbs = np.diag(self._transitions)
+        states = np.empty(numCycles, dtype=np.int64)
+
+        state = 0
+        idx = 0
+        while idx < numCycles:
+            if stayProbs[state] >= 1.0:
+                dwell = numCycles - idx
+            else:
+                dwell = int(rng.geometric(1.0 - stayProbs[state]))
+            states[idx : idx + dwell] = state
+            idx += dwell
+
+            # Pick the next state given that we leave the current one.
+            exitProbs = self._transitions[state].copy()
+            exitProbs[state] = 0.0
+            if exitProbs.sum() > 0.0:
+                state = int(rng.choice(len(exitProbs), p=exitProbs / exitProbs.sum()))
+
+        return states
+
+    def _getCellTemperature(self, irradiance):
+        """
+        Applies the first order thermal lag to the steady state cell
+        temperature. The cell is assumed to start in thermal equilibrium.
+
+        Parameters
+        ----------
+        irradiance: numpy array
+            Irradiance for each cycle.
+
+        Return
+        ------
+        numpy array: Cell temperature for each cycle.
+        """
+        target = self._ambientTemperature + self._thermalCoefficient * irradiance
+        if self._thermalTimeConstant <= 0:
+            return target
+
+        # The recurrence T(c) = a * T(c - 1) + (1 - a) * T_target(c) is solved
+        # in closed form within each block, scaling by a^-j so that a cumulative
+        # sum gives the lag response from rest. Only the last temperature of
+        # each block is carried over to the next block sequentially.
+        decay = np.exp(-1.0 / self._thermalTimeConstant)
+        blockLength = int(
+            np.clip(
+                np.log(StochasticEnvironment._BLOCK_RANGE) / -np.log(decay),
+                1,
+                len(target),
+            )
+        )
+        numBlocks = -(-len(target) // blockLength)
+        blocks = np.resize(target, numBlocks * blockLength)
+        blocks[len(target) :] = target[-1]
+        blocks = blocks.reshape(numBlocks, blockLength)
+
+        powers = decay ** np.arange(blockLength)
+        response = (1 - decay) * powers * np.cumsum(blocks / powers, axis=1)
+
+        # The temperature before each block. The cell starts at equilibrium.
+        carry = np.empty(numBlocks)
+        temperature = target[0]
+        blockDecay = decay**blockLength
+        for (idx, end) in enumerate(response[:, -1].tolist()):
+            carry[idx] = temperature
+            temperature = blockDecay * temperature + end
+
+        response += carry[:, np.newaxis] * (decay * powers)
+        return response.ravel()[: len(target)]
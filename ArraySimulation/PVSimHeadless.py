@@ -0,0 +1,411 @@
+"""
+PVSimHeadless.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: The PVSimHeadless file is a command line entry point to the MPPT
+simulation. Unlike PVSim, it does not start the UI; the data pipeline is run
+by the DataController as fast as possible and the results are written to a
+file. This allows simulations to be run in CI and in batch jobs.
+
+Usage, from the root directory of ArraySimulation:
+
+    python3 PVSimHeadless.py --model Ideal --environment SingleCell.json \\
+        --cycles 1000 --global "Voltage Sweep" --local PandO --stride Fixed \\
+        --output results.csv
+
+The output format is determined by the file extension. A .csv file contains a
+row per cycle, a .ndjson file contains a JSON object per cycle, and a .bin file
+is a binary columnar file (see BinaryWriter). The irradiance and temperature
+columns are suffixed by the module name, i.e. irradiance_0. Results are
+streamed to the file as the simulation runs, so memory use does not grow with
+the number of cycles, and an interrupted simulation leaves the cycles run so
+far in the file. Unless the results are streamed, the summary includes the
+tracking metrics of the run (see Metrics).
+
+The global MPPT algorithm is tuned with --global-params, i.e. passing
+'{"coarseStride": 0.5}' with the Voltage Sweep runs a coarse to fine sweep
+instead of sweeping the whole voltage range at 0.01 V, and '{"rescan": true}'
+searches again when a change in shading is detected. The energy lost while
+sweeping and the number of rescans are reported in the summary.
+
+Long simulations can be checkpointed by passing --checkpoint run.pkl. The state
+of the simulation is saved every --checkpoint-interval cycles, and if the
+checkpoint exists when the command is rerun, the simulation resumes from it
+instead of starting over. The checkpoint is removed once the simulation
+completes.
+
+The stream seen by the MPPT, and the IV curves of the source, can be recorded
+by passing --trace run.trace, and replayed against other MPPT configurations
+without simulating the source again (see MPPTTrace).
+
+Passing --surface computes the IV curve of every distinct environment of the
+profile before the run, and reads the source current from them each cycle,
+which is much faster than evaluating the source model every cycle.
+
+A matrix of simulations can be run across multiple processes by passing a
+sweep definition (see SweepController.fromJSON) instead:
+
+    python3 PVSimHeadless.py --sweep sweep.json --processes 8 \\
+        --output sweep.csv
+
+In which case the output contains a row of metrics per scenario, and
+--checkpoint names a directory holding a checkpoint per scenario.
+
+The stride parameters of pairs of local MPPT algorithm and stride model can be
+tuned for tracking efficiency over a set of profiles by passing a tuning
+definition (see StrideTuner.setupTuning) instead:
+
+    python3 PVSimHeadless.py --tune tune.json --processes 8 --output tuned.csv
+
+In which case the output contains a row per pair, with the tuned parameters.
+"""
+# Library Imports.
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.Metrics import Metrics
+from ArraySimulation.Controller.ResultsWriter import ResultsWriter
+from ArraySimulation.Controller.StrideTuner import StrideTuner
+from ArraySimulation.Controller.SweepController import SweepController
+
+
+def parseArguments(args):
+    """
+    Parses the command line arguments of the headless simulation.
+
+    Parameters
+    ----------
+    args: List of Strings
+        Command line arguments, excluding the program name.
+
+    Return
+    ------
+    argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Runs the MPPT simulation without the UI."
+    )
+    parser.add_argument("--model", default="Ideal", help="PVSource cell model.")
+    parser.add_argument(
+        "--environment",
+        default="SingleCell.json",
+        help="PVEnvironment profile in External/.",
+    )
+    parser.add_argument(
+        "--cycles", type=int, default=200, help="Max cycle to simulate to."
+    )
+    parser.add_argument(
+        "--global",
+        dest="globalAlgo",
+        default="Voltage Sweep",
+        help="Global MPPT algorithm.",
+    )
+    parser.add_argument(
+        "--local", dest="localAlgo", default="PandO", help="Local MPPT algorithm."
+    )
+    parser.add_argument(
+        "--stride", dest="strideAlgo", default="Fixed", help="MPPT stride algorithm."
+    )
+    parser.add_argument(
+        "--stride-params",
+        dest="strideParams",
+        type=json.loads,
+        default=None,
+        help='Stride model arguments as JSON, i.e. \'{"minStride": 0.02}\'.',
+    )
+    parser.add_argument(
+        "--global-params",
+        dest="globalParams",
+        type=json.loads,
+        default=None,
+        help="Global MPPT algorithm arguments as JSON, i.e. "
+        + '\'{"coarseStride": 0.5}\'.',
+    )
+    parser.add_argument(
+        "--sweep",
+        default=None,
+        help="Sweep definition JSON file. Overrides the single run arguments.",
+    )
+    parser.add_argument(
+        "--tune",
+        default=None,
+        help="Stride tuning definition JSON file. Overrides the single run "
+        + "arguments.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of processes used by a sweep or tuning. Defaults to one per "
+        + "CPU.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Results file, ending in .csv, .ndjson or .bin. A sweep or tuning "
+        + "only supports .csv.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file to save to and resume from. For a sweep, the "
+        + "directory holding a checkpoint per scenario.",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        dest="checkpointInterval",
+        type=int,
+        default=10000,
+        help="Number of cycles between checkpoints.",
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        help="MPPT trace file to record the run to. See MPPTTrace.",
+    )
+    parser.add_argument(
+        "--surface",
+        action="store_true",
+        help="Precompute the source response over the profile before the run.",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        dest="fastForward",
+        action="store_true",
+        help="Skip over periodic steady states.",
+    )
+    return parser.parse_args(args)
+
+
+def runSimulation(
+    model,
+    environment,
+    maxCycles,
+    globalAlgo,
+    localAlgo,
+    strideAlgo,
+    fastForward,
+    strideParams=None,
+    writer=None,
+    checkpoint=None,
+    checkpointInterval=10000,
+    globalParams=None,
+    trace=None,
+    surface=False,
+):
+    """
+    Runs the MPPT simulation to completion.
+
+    Parameters
+    ----------
+    model: String
+        The source model type.
+    environment: String
+        PVEnvironment profile used.
+    maxCycles: int
+        Maximum number of cycles to execute for.
+    globalAlgo: String
+        The global MPPT algorithm type.
+    localAlgo: String
+        The local MPPT algorithm type.
+    strideAlgo: String
+        The stride MPPT algorithm type.
+    fastForward: bool
+        Whether to fast forward across periodic steady states.
+    strideParams: dict|None
+        Keyword arguments passed to the stride model constructor.
+    writer: ResultsWriter|None
+        The writer to stream the results to. If None, every entry is kept in
+        the datastore of the controller instead.
+    checkpoint: String|None
+        Path of the checkpoint file. If it exists, the simulation is resumed
+        from it and the other arguments are ignored.
+    checkpointInterval: int
+        Number of cycles between checkpoints.
+    globalParams: dict|None
+        Keyword parameters of the global MPPT algorithm.
+    trace: String|None
+        Path of the MPPT trace file to record the simulation to. The IV curves
+        and every entry are then kept in memory for the duration of the run.
+    surface: bool
+        Whether to precompute the source response over the profile before the
+        run. See DataController.setupSurface.
+
+    Return
+    ------
+    DataController: The controller, holding the results of the simulation.
+    """
+    if checkpoint is not None and os.path.exists(checkpoint):
+        controller = DataController.loadCheckpoint(checkpoint)
+        print("Resuming from " + checkpoint + ".")
+    else:
+        controller = DataController()
+        controller.setupFastForward(fastForward)
+        controller.setupSurface(surface)
+        if writer is not None:
+            controller.setupSink(writer, retain=trace is not None)
+        controller.resetPipeline(
+            model,
+            environment,
+            maxCycles,
+            globalAlgo,
+            localAlgo,
+            strideAlgo,
+            strideParams,
+            storeIV=trace is not None,
+            globalParams=globalParams,
+        )
+        controller.setupCheckpoint(checkpoint, checkpointInterval)
+
+    try:
+        continueBool = True
+        while continueBool:
+            (_, continueBool) = controller.iteratePipelineCycleMPPT()
+    finally:
+        # Keep the results up to an interruption.
+        controller.closeSink()
+
+    if trace is not None:
+        controller.getTrace().save(trace)
+    return controller
+
+
+if __name__ == "__main__":
+    if sys.version_info[0] < 3:
+        raise Exception("This program only supports Python 3.")
+
+    args = parseArguments(sys.argv[1:])
+
+    if args.sweep is not None:
+        sweep = SweepController.fromJSON(
+            args.sweep, args.processes, args.checkpoint, args.checkpointInterval
+        )
+        startTime = time.time()
+        results = sweep.runSweep()
+        print(
+            "Simulated "
+            + str(len(results))
+            + " scenarios in "
+            + str(round(time.time() - startTime, 3))
+            + " s."
+        )
+        for result in results:
+            if result["error"] is not None:
+                print("Scenario " + str(result) + " failed.")
+        if args.output is not None:
+            sweep.writeResults(args.output)
+        sys.exit(0)
+
+    if args.tune is not None:
+        tuner = StrideTuner.fromJSON(args.tune, args.processes)
+        startTime = time.time()
+        results = tuner.runTuning()
+        print(
+            "Tuned "
+            + str(len(results))
+            + " pairs in "
+            + str(round(time.time() - startTime, 3))
+            + " s."
+        )
+        for result in results:
+            if result["error"] is not None:
+                print("Pair " + str(result) + " failed.")
+            else:
+                print(
+                    result["localAlgo"]
+                    + " with "
+                    + result["strideAlgo"]
+                    + ": "
+                    + json.dumps(result["strideParams"])
+                    + ", tracking efficiency "
+                    + str(round(result["defaultTrackingEff"] * 100, 2))
+                    + "% -> "
+                    + str(round(result["trackingEff"] * 100, 2))
+                    + "%."
+                )
+        if args.output is not None:
+            tuner.writeResults(args.output)
+        sys.exit(0)
+
+    writer = None
+    if args.output is not None:
+        writer = ResultsWriter.fromFileName(args.output)
+
+    startTime = time.time()
+    controller = runSimulation(
+        args.model,
+        args.environment,
+        args.cycles,
+        args.globalAlgo,
+        args.localAlgo,
+        args.strideAlgo,
+        args.fastForward,
+        args.strideParams,
+        writer,
+        args.checkpoint,
+        args.checkpointInterval,
+        args.globalParams,
+        args.trace,
+        args.surface,
+    )
+    elapsedTime = time.time() - startTime
+
+    (actualEnergy, theoreticalEnergy) = controller.getEnergy()
+    trackingEff = 0.0
+    if theoreticalEnergy > 0:
+        trackingEff = actualEnergy / theoreticalEnergy
+    numCycles = controller.datastore["numEntries"]
+    if controller.getSink() is not None:
+        numCycles = controller.getSink().getNumRows()
+    rescans = controller.getRescanCounts()
+    print(
+        "Simulated "
+        + str(numCycles)
+        + " cycles in "
+        + str(round(elapsedTime, 3))
+        + " s. Energy: "
+        + str(round(actualEnergy, 3))
+        + " J of "
+        + str(round(theoreticalEnergy, 3))
+        + " J. Tracking efficiency: "
+        + str(round(trackingEff * 100, 2))
+        + "%. Sweep loss: "
+        + str(round(controller.getSweepLoss(), 3))
+        + " J. Rescans: "
+        + str(rescans["partial"])
+        + " partial, "
+        + str(rescans["full"])
+        + " full."
+    )
+
+    # The tracking metrics need every entry, which streamed runs do not keep.
+    if writer is None or args.trace is not None:
+        metrics = controller.getMetrics()
+        print(
+            "Cycles below "
+            + str(round(Metrics.THRESHOLD * 100))
+            + "% yield: "
+            + str(metrics["cyclesBelowThreshold"])
+            + ". Settling time: "
+            + str(round(metrics["settlingTime"], 3))
+            + " s mean, "
+            + str(round(metrics["maxSettlingTime"], 3))
+            + " s max over "
+            + str(metrics["numSteps"] - metrics["unsettledSteps"])
+            + " of "
+            + str(metrics["numSteps"])
+            + " environment steps. Oscillation: "
+            + str(round(metrics["oscillation"], 4))
+            + " V."
+        )
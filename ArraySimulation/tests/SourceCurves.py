@@ -0,0 +1,42 @@
+"""
+SourceCurves.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: IV curves shared by the MPPT algorithm tests.
+"""
+# Library Imports.
+import numpy as np
+
+# Custom Imports.
+
+
+def getShadedStringCurve(shadedCurrent=3.0):
+    """
+    Returns the IV curve of a 40 cell string made of two 20 cell substrings
+    with bypass diodes, one of which is shaded to shadedCurrent (by default
+    half its current). The P-V curve has a local maximum below the global
+    maximum.
+
+    Parameters
+    ----------
+    shadedCurrent: float
+        Short circuit current of the shaded substring (A). The unshaded
+        substring has a short circuit current of 6 A.
+
+    Return
+    ------
+    tuple: (voltages, currents), sorted by increasing voltage.
+    """
+    currents = np.linspace(0, 6, 60001)
+    voltages = np.zeros(len(currents))
+    for shortCircuit in [6.0, shadedCurrent]:
+        clipped = np.minimum(currents / shortCircuit, 1.0)
+        voltages += np.maximum(
+            20 * 0.05 * np.log(np.maximum(1 - clipped, 1e-300)) + 20 * 0.7, -0.5
+        )
+    order = np.argsort(voltages)
+    return (voltages[order], currents[order])
@@ -0,0 +1,104 @@
+"""
+test_BatchMPPT.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the BatchMPPT trackers follow the same
+trajectories as individual MPPT trackers.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.MPPT.BatchMPPT import BatchMPPT
+from ArraySimulation.MPPT.MPPT import MPPT
+
+
+class TestBatchMPPT:
+    def _getCurrents(self, voltages, shortCircuit, openCircuit):
+        """
+        A simple diode shaped IV curve per tracker.
+        """
+        return np.maximum(
+            shortCircuit * (1 - np.exp((voltages - openCircuit) / 0.05)), 0.0
+        )
+
+    def test_BatchMPPTLockstep(self):
+        """
+        Testing that every local algorithm and stride model advances each
+        tracker of the batch exactly like a scalar tracker.
+        """
+        numTrackers = 16
+        rng = np.random.default_rng(0)
+        shortCircuit = rng.uniform(3.0, 6.5, numTrackers)
+        openCircuit = rng.uniform(0.6, 0.75, numTrackers)
+        irradiances = rng.uniform(200, 1000, numTrackers)
+        temperatures = rng.uniform(15, 45, numTrackers)
+
+        for algorithm in ["PandO", "IC", "FC", "Golden", "Ternary", "Bisection"]:
+            for stride in ["Fixed", "Adaptive", "Bisection", "Optimal"]:
+                batch = BatchMPPT()
+                batch.setupModel(numTrackers, 1, algorithm, stride)
+                trackers = []
+                for _ in range(numTrackers):
+                    tracker = MPPT()
+                    tracker.setupModel(1, "Default", algorithm, stride)
+                    trackers.append(tracker)
+
+                try:
+                    voltages = np.zeros(numTrackers)
+                    for cycle in range(200):
+                        currents = self._getCurrents(
+                            voltages, shortCircuit, openCircuit
+                        )
+                        vRefs = batch.getReferenceVoltages(
+                            voltages, currents, irradiances, temperatures
+                        )
+                        expected = [
+                            tracker.getReferenceVoltage(
+                                voltages[idx],
+                                currents[idx],
+                                irradiances[idx],
+                                temperatures[idx],
+                            )
+                            for (idx, tracker) in enumerate(trackers)
+                        ]
+                        assert np.allclose(vRefs, expected, rtol=0, atol=1e-12), (
+                            algorithm + " " + stride + " cycle " + str(cycle)
+                        )
+                        voltages = np.asarray(expected)
+                except Exception as e:
+                    pytest.fail(str(e))
+
+    def test_BatchMPPTReset(self):
+        """
+        Testing that resetting a subset of trackers restarts only those.
+        """
+        batch = BatchMPPT()
+        batch.setupModel(4, 1, "Golden", "Fixed")
+
+        try:
+            voltages = np.zeros(4)
+            first = batch.getReferenceVoltages(voltages, voltages, voltages, voltages)
+            for _ in range(5):
+                currents = self._getCurrents(voltages, 5.0, 0.7)
+                voltages = batch.getReferenceVoltages(
+                    voltages, currents, voltages, voltages
+                )
+
+            mask = np.array([True, False, True, False])
+            batch.reset(mask)
+            vRefs = batch.getReferenceVoltages(voltages, currents, voltages, voltages)
+            assert np.array_equal(vRefs[mask], first[mask])
+            assert not np.any(vRefs[~mask] == first[~mask])
+            assert batch.getNumTrackers() == 4
+            assert batch.getLocalMPPTType() == "Golden"
+        except Exception as e:
+            pytest.fail(str(e))
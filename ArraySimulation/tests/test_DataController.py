@@ -0,0 +1,336 @@
+"""
+test_DataController.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the DataController pipeline produces the same
+results when fast forwarding across steady states, when resumed from a
+checkpoint, when seeked, and when run against the precomputed source
+response, and if it accounts for the energy lost while sweeping.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.ResultsWriter import BinaryWriter, ResultsWriter
+
+
+class TestDataController:
+    def test_DataControllerFastForward(self):
+        """
+        Testing that fast forwarding reproduces the cycle by cycle pipeline.
+        """
+        try:
+            for (localAlgo, strideAlgo) in [("PandO", "Fixed"), ("IC", "Optimal")]:
+                results = []
+                for fastForward in [False, True]:
+                    controller = DataController()
+                    controller.setupFastForward(fastForward)
+                    controller.resetPipeline(
+                        "Ideal",
+                        "TwoCellsWithDiode.json",
+                        400,
+                        "Voltage Sweep",
+                        localAlgo,
+                        strideAlgo,
+                    )
+
+                    numIterations = 0
+                    continueBool = True
+                    while continueBool:
+                        (datastore, continueBool) = (
+                            controller.iteratePipelineCycleMPPT()
+                        )
+                        numIterations += 1
+                    results.append(
+                        (datastore, controller.getEnergy(), numIterations)
+                    )
+
+                (expected, expectedEnergy, _) = results[0]
+                (actual, actualEnergy, numIter) = results[1]
+
+                # Assert that every cycle is recorded with identical outputs.
+                assert actual["numEntries"] == 401
+                assert actual["cycle"].tolist() == list(range(401))
+                for column in [
+                    "cycle",
+                    "time",
+                    "arrayVoltage",
+                    "sourceCurrent",
+                    "irradiance",
+                    "temperature",
+                    "vMPP",
+                    "mpptOutput",
+                    "outputPower",
+                    "dcdcOutput",
+                ]:
+                    assert np.array_equal(actual[column], expected[column])
+                assert actualEnergy == pytest.approx(expectedEnergy)
+
+                # Assert that the static stretches were skipped over.
+                assert numIter < 401
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_DataControllerDatastore(self):
+        """
+        Testing the preallocated columnar datastore.
+        """
+        controller = DataController()
+        controller.resetPipeline(
+            "Ideal",
+            "TwoCellsWithDiode.json",
+            100,
+            "Voltage Sweep",
+            "PandO",
+            "Fixed",
+            storeIV=True,
+        )
+
+        try:
+            # Assert that the datastore is preallocated for every cycle.
+            datastore = controller.datastore
+            assert datastore["modules"] == ["0", "1"]
+            assert len(datastore["cycle"]) == 101
+            assert datastore["irradiance"].shape == (101, 2)
+            assert datastore["numEntries"] == 0
+
+            continueBool = True
+            while continueBool:
+                (datastore, continueBool) = controller.iteratePipelineCycleMPPT()
+            assert datastore["numEntries"] == 101
+            assert len(datastore["cycle"]) == 101
+
+            # Assert that the IV curves are interned; the environment is static
+            # for the first 200 cycles of the profile, so every entry refers to
+            # the same curve.
+            pool = datastore["IVPool"]
+            assert pool.getNumCurves() == 1
+            assert np.all(datastore["IVRef"][:101] == 0)
+
+            # Assert that the stored IV curves are consistent with the output.
+            idx = 90
+            curve = pool.getCurve(datastore["IVRef"][idx])
+            assert curve.dtype == np.float32
+            current = np.interp(
+                datastore["mpptOutput"][idx], pool.getVoltages(), curve
+            )
+            assert datastore["outputPower"][idx] == pytest.approx(
+                datastore["mpptOutput"][idx] * current, rel=1e-4
+            )
+
+            # Assert that the datastore grows past its preallocated capacity.
+            mpptOutput = datastore["mpptOutput"]
+            controller._reserveDatastore(10)
+            assert len(datastore["cycle"]) == 202
+            assert datastore["IVRef"].shape[0] == 202
+            assert np.array_equal(datastore["mpptOutput"][:101], mpptOutput)
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_DataControllerCheckpoint(self, tmp_path):
+        """
+        Testing that a simulation resumed from a checkpoint reproduces an
+        uninterrupted one.
+        """
+        checkpoint = str(tmp_path / "run.pkl")
+        try:
+            for (localAlgo, stream) in [("Golden", False), ("Ternary", True)]:
+                results = []
+                for interrupt in [False, True]:
+                    fileName = str(tmp_path / ("results" + str(interrupt) + ".bin"))
+                    controller = DataController()
+                    controller.setupFastForward(False)
+                    if stream:
+                        controller.setupSink(
+                            ResultsWriter.fromFileName(fileName, blockSize=64), False
+                        )
+                    controller.resetPipeline(
+                        "Ideal",
+                        "TwoCellsWithDiode.json",
+                        600,
+                        "Voltage Sweep",
+                        localAlgo,
+                        "Fixed",
+                        storeIV=True,
+                        maxIVCurves=1,
+                    )
+                    if interrupt:
+                        controller.setupCheckpoint(checkpoint, 100)
+
+                    resumed = False
+                    continueBool = True
+                    while continueBool:
+                        (datastore, continueBool) = (
+                            controller.iteratePipelineCycleMPPT()
+                        )
+                        # Abandon the run partway through, past a checkpoint.
+                        cycle = controller._PVEnv.getCycle()
+                        if interrupt and not resumed and cycle >= 350:
+                            if stream:
+                                controller.getSink().flush()
+                            controller = DataController.loadCheckpoint(checkpoint)
+                            resumed = True
+
+                    # Assert that the checkpoint is removed once completed.
+                    assert resumed == interrupt
+                    assert not (tmp_path / "run.pkl").exists()
+
+                    if stream:
+                        results.append(BinaryWriter.read(fileName))
+                    else:
+                        numEntries = datastore["numEntries"]
+                        pool = datastore["IVPool"]
+                        results.append(
+                            {
+                                "cycle": datastore["cycle"][:numEntries],
+                                "vRef": datastore["mpptOutput"][:numEntries],
+                                "IV": pool.getCurve(datastore["IVRef"][numEntries - 1]),
+                            }
+                        )
+                    results[-1]["energy"] = controller.getEnergy()
+
+                (expected, actual) = results
+                for key in expected:
+                    assert np.array_equal(expected[key], actual[key])
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_DataControllerSeek(self):
+        """
+        Testing that seeking to a cycle reproduces running up to it.
+        """
+        expected = DataController()
+        expected.resetPipeline(
+            "Ideal", "TwoCellsWithDiode.json", 600, "Voltage Sweep", "PandO", "Fixed"
+        )
+        continueBool = True
+        while continueBool:
+            (expectedResults, continueBool) = expected.iteratePipelineCycleMPPT()
+
+        try:
+            for fastForward in [False, True]:
+                controller = DataController()
+                controller.setupFastForward(fastForward)
+                controller.setupSnapshots(50)
+                controller.resetPipeline(
+                    "Ideal",
+                    "TwoCellsWithDiode.json",
+                    600,
+                    "Voltage Sweep",
+                    "PandO",
+                    "Fixed",
+                )
+                for cycle in [400, 120, 599, 3, 600, 0, 275]:
+                    (results, continueBool) = controller.seekCycle(cycle)
+                    numEntries = results["numEntries"]
+
+                    # Assert that the datastore ends at the seeked cycle.
+                    assert numEntries == cycle + 1
+                    assert continueBool == (cycle < 600)
+                    assert np.array_equal(
+                        results["cycle"][:numEntries], range(cycle + 1)
+                    )
+                    assert np.array_equal(
+                        results["mpptOutput"][:numEntries],
+                        expectedResults["mpptOutput"][:numEntries],
+                    )
+
+                # Assert that the simulation continues as if never seeked.
+                while continueBool:
+                    (results, continueBool) = controller.iteratePipelineCycleMPPT()
+                assert np.array_equal(
+                    results["mpptOutput"][:601], expectedResults["mpptOutput"][:601]
+                )
+                assert controller.getEnergy()[0] == pytest.approx(
+                    expected.getEnergy()[0]
+                )
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_DataControllerSweepLoss(self):
+        """
+        Testing that the energy lost while sweeping is accounted for, and that
+        the coarse to fine sweep loses less of it.
+        """
+        try:
+            losses = []
+            for globalParams in [None, {"coarseStride": 0.1}]:
+                controller = DataController()
+                controller.setupFastForward(True)
+                controller.resetPipeline(
+                    "Ideal",
+                    "TwoCellsWithDiode.json",
+                    400,
+                    "Voltage Sweep",
+                    "PandO",
+                    "Fixed",
+                    globalParams=globalParams,
+                )
+                continueBool = True
+                while continueBool:
+                    (_, continueBool) = controller.iteratePipelineCycleMPPT()
+
+                (actual, theoretical) = controller.getEnergy()
+                loss = controller.getSweepLoss()
+                assert 0 < loss <= theoretical - actual + 1e-6
+                losses.append(loss)
+
+            assert losses[1] < losses[0]
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_DataControllerSurface(self):
+        """
+        Testing that running against the precomputed source response reproduces
+        the pipeline evaluating the source model, and that the response is
+        reused across resets of the same profile.
+        """
+        try:
+            results = []
+            for surface in [False, True]:
+                controller = DataController()
+                controller.setupSurface(surface)
+                controller.resetPipeline(
+                    "Ideal",
+                    "TwoCellsWithDiode.json",
+                    400,
+                    "Voltage Sweep",
+                    "PandO",
+                    "Fixed",
+                )
+                continueBool = True
+                while continueBool:
+                    (datastore, continueBool) = controller.iteratePipelineCycleMPPT()
+                results.append((datastore, controller.getEnergy()))
+
+            ((expected, expectedEnergy), (actual, actualEnergy)) = results
+            numEntries = expected["numEntries"]
+            assert actual["numEntries"] == numEntries
+            for column in ["sourceCurrent", "vMPP", "iMPP", "mpptOutput"]:
+                assert np.allclose(
+                    actual[column][:numEntries],
+                    expected[column][:numEntries],
+                    atol=1e-6,
+                )
+            assert actualEnergy == pytest.approx(expectedEnergy, rel=1e-6)
+
+            IV = controller._surface["IV"]
+            controller.resetPipeline(
+                "Ideal", "TwoCellsWithDiode.json", 400, "Voltage Sweep", "IC", "Fixed"
+            )
+            assert controller._surface["IV"] is IV
+            controller.resetPipeline(
+                "Ideal", "SingleCell.json", 400, "Voltage Sweep", "IC", "Fixed"
+            )
+            assert controller._surface["IV"] is not IV
+        except Exception as e:
+            pytest.fail(str(e))
@@ -0,0 +1,81 @@
+"""
+test_IVPool.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the IVPool deduplicates IV curves and spills
+or evicts them when full.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.IVPool import IVPool
+
+
+class TestIVPool:
+    def test_IVPoolIntern(self):
+        """
+        Testing that curves are deduplicated by quantized conditions.
+        """
+        pool = IVPool(irradianceQuantum=1, temperatureQuantum=0.1)
+        voltages = np.linspace(0, 0.8, 81)
+
+        try:
+            keyA = pool.getKey([1000, 500], [25, 25])
+            refA = pool.intern(keyA, voltages, 6 - voltages)
+
+            # Assert that conditions within the quanta map to the same curve.
+            keyB = pool.getKey([1000.2, 499.9], [25.01, 24.99])
+            assert keyB == keyA
+            assert pool.intern(keyB, voltages, 5 - voltages) == refA
+            assert pool.getNumCurves() == 1
+
+            # Assert that different conditions map to a new curve.
+            keyC = pool.getKey([1000, 500], [26, 25])
+            refC = pool.intern(keyC, voltages, 4 - voltages)
+            assert refC != refA
+            assert pool.getRef(keyC) == refC
+            assert np.allclose(pool.getCurve(refA), 6 - voltages)
+            assert np.array_equal(pool.getVoltages(), voltages)
+
+            # Assert that curves with a different voltage axis are rejected.
+            with pytest.raises(Exception):
+                pool.intern(pool.getKey([0], [0]), voltages[:10], voltages[:10])
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_IVPoolLimit(self):
+        """
+        Testing the spill and evict policies of a full pool.
+        """
+        voltages = np.linspace(0, 0.8, 81)
+
+        try:
+            spillPool = IVPool(maxCurves=2, policy="spill")
+            evictPool = IVPool(maxCurves=2, policy="evict")
+            for pool in [spillPool, evictPool]:
+                for irradiance in range(5):
+                    pool.intern(
+                        pool.getKey([irradiance], [25]), voltages, irradiance - voltages
+                    )
+                assert pool.getNumCurves() == 5
+                assert pool.getNumCurvesInMemory() == 2
+
+            # Assert that spilled curves are read back intact.
+            for ref in range(5):
+                assert np.allclose(spillPool.getCurve(ref), ref - voltages)
+                assert spillPool.getNumCurvesInMemory() <= 2
+
+            # Assert that only the most recently used curves survive eviction.
+            assert evictPool.getCurve(0) is None
+            assert np.allclose(evictPool.getCurve(4), 4 - voltages)
+        except Exception as e:
+            pytest.fail(str(e))
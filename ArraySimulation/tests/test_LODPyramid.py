@@ -0,0 +1,92 @@
+"""
+test_LODPyramid.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the LODPyramid downsamples a series to the
+width of the view while keeping its envelope.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.LODPyramid import LODPyramid
+
+
+class TestLODPyramid:
+    def test_LODPyramidEnvelope(self):
+        """
+        Testing that the points drawn are bounded by the width of the view, and
+        that the extrema of the series in view are kept.
+        """
+        rng = np.random.default_rng(0)
+        x = np.arange(200000, dtype=float)
+        y = rng.normal(size=len(x))
+        y[54321] = 100.0
+        y[123456] = -100.0
+
+        try:
+            # Build the pyramid incrementally, and check it against building it
+            # all at once.
+            pyramid = LODPyramid()
+            for stop in range(0, len(x) + 1, 9999):
+                pyramid.update(x[:stop], y[:stop])
+            pyramid.update(x, y)
+            reference = LODPyramid()
+            reference.update(x, y)
+            assert pyramid.getNumLevels() == reference.getNumLevels() > 0
+            for (xMin, xMax, numPixels) in [
+                (-np.inf, np.inf, 500),
+                (1000.5, 150000.5, 300),
+                (54000, 55000, 1000),
+            ]:
+                (lodX, lodY) = pyramid.query(x, y, xMin, xMax, numPixels)
+                (refX, refY) = reference.query(x, y, xMin, xMax, numPixels)
+                assert np.array_equal(lodX, refX) and np.array_equal(lodY, refY)
+
+                # Assert that the points are in order, bounded, and run to the
+                # edges of the view.
+                assert np.all(np.diff(lodX) > 0)
+                assert len(lodX) <= 2 * LODPyramid.FACTOR * numPixels + 6
+                visible = x[(x >= xMin) & (x <= xMax)]
+                assert lodX[0] <= visible[0] and lodX[-1] >= visible[-1]
+
+                # Assert that the extrema in view, i.e. the spikes, are drawn.
+                inView = y[(x >= xMin) & (x <= xMax)]
+                assert inView.max() in lodY and inView.min() in lodY
+
+            # Assert that small ranges are drawn in full.
+            (lodX, lodY) = pyramid.query(x, y, 10, 20, 100)
+            assert np.array_equal(lodX, x[9:22])
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_LODPyramidReset(self):
+        """
+        Testing that the pyramid is rebuilt for shorter series, and that
+        unsorted series are drawn in full.
+        """
+        pyramid = LODPyramid()
+
+        try:
+            x = np.arange(10000, dtype=float)
+            pyramid.update(x, np.sin(x))
+            pyramid.update(x[:100], -x[:100])
+            (lodX, lodY) = pyramid.query(x[:100], -x[:100], -np.inf, np.inf, 10)
+            assert lodY.min() == -99 and lodY.max() == 0
+            assert len(lodX) <= 2 * LODPyramid.FACTOR * 10 + 6
+
+            pyramid.reset()
+            unsorted = x[::-1].copy()
+            pyramid.update(unsorted, x)
+            (lodX, lodY) = pyramid.query(unsorted, x, 0, 100, 10)
+            assert len(lodX) == len(x)
+        except Exception as e:
+            pytest.fail(str(e))
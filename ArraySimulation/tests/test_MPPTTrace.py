@@ -0,0 +1,123 @@
+"""
+test_MPPTTrace.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if MPPT traces recorded from simulations and
+bench logs are saved and loaded losslessly, and replay the MPPT that was
+recorded.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.MPPTTrace import MPPTTrace
+from ArraySimulation.MPPT.BatchMPPT import BatchMPPT
+from ArraySimulation.MPPT.MPPT import MPPT
+
+
+class TestMPPTTrace:
+    def test_MPPTTraceSimulation(self, tmp_path):
+        """
+        Testing that replaying the trace of a simulation against the same MPPT
+        reproduces its reference voltages open loop, and its energy closed
+        loop against the response surface.
+        """
+        controller = DataController()
+        controller.resetPipeline(
+            "Ideal",
+            "SingleCell.json",
+            400,
+            "Voltage Sweep",
+            "PandO",
+            "Fixed",
+            storeIV=True,
+        )
+        continueBool = True
+        while continueBool:
+            (_, continueBool) = controller.iteratePipelineCycleMPPT()
+
+        try:
+            fileName = str(tmp_path / "run.trace")
+            controller.getTrace().save(fileName)
+            trace = MPPTTrace.load(fileName)
+            recorded = controller.getTrace()
+            assert len(trace) == 401
+            for name in MPPTTrace.COLUMNS:
+                assert np.array_equal(
+                    trace.getColumns()[name], recorded.getColumns()[name]
+                )
+            assert np.array_equal(
+                trace.getSurface().getIndex(), recorded.getSurface().getIndex()
+            )
+
+            model = MPPT()
+            model.setupModel(trace.getNumCells(), "Voltage Sweep", "PandO", "Fixed")
+            result = trace.replay(model, closedLoop=False)
+            assert np.array_equal(result["vRef"], trace.getColumns()["vRef"])
+
+            model.reset()
+            result = trace.replay(model)
+            (actual, theoretical) = controller.getEnergy()
+            assert result["energy"][0] == pytest.approx(actual, rel=1e-4)
+            assert result["energy"][1] == pytest.approx(theoretical, rel=1e-4)
+
+            batch = BatchMPPT()
+            batch.setupModel(8, trace.getNumCells(), "Golden", "Fixed")
+            result = trace.replay(batch)
+            assert result["vRef"].shape == (401, 8)
+            assert np.all(result["energy"][0] == result["energy"][0][0])
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_MPPTTraceBench(self, tmp_path):
+        """
+        Testing that a bench log is read into a trace whose response surface
+        reproduces the logged currents.
+        """
+        fileName = str(tmp_path / "bench.csv")
+        voltages = np.tile(np.linspace(0.5, 0.7, 21), 4)
+        irradiance = np.repeat([1000.0, 600.0], 42)
+        currents = irradiance / 1000 * (6.0 - np.exp((voltages - 0.7) / 0.03))
+        with open(fileName, "w") as file:
+            file.write("time,arrVoltage,arrCurrent,irradiance,temperature,vRef\n")
+            for idx in range(len(voltages)):
+                file.write(
+                    ",".join(
+                        str(value)
+                        for value in [
+                            idx,
+                            voltages[idx],
+                            currents[idx],
+                            irradiance[idx],
+                            25.0,
+                            voltages[(idx + 1) % len(voltages)],
+                        ]
+                    )
+                    + "\n"
+                )
+
+        try:
+            trace = MPPTTrace.fromCSV(fileName)
+            surface = trace.getSurface()
+            assert len(trace) == 84
+            assert surface.getNumConditions() == 2
+            assert np.allclose(
+                surface.getCurrents(np.arange(84), voltages), currents, atol=1e-5
+            )
+            assert surface.getCurrent(0, 1.0) == 0.0
+
+            model = MPPT()
+            model.setupModel(1, "Default", "PandO", "Fixed")
+            result = trace.replay(model)
+            assert result["vRef"].shape == (84,)
+        except Exception as e:
+            pytest.fail(str(e))
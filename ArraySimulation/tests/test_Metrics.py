@@ -0,0 +1,81 @@
+"""
+test_Metrics.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the Metrics class computes the tracking
+metrics of a run, and if its running metrics match the whole run.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.Metrics import Metrics
+
+
+class TestMetrics:
+    def test_Metrics(self):
+        """
+        Testing the metrics of a run with three environment steps: the start,
+        settled after 3 entries; a step at entry 10, settled after 5 entries;
+        and a step at entry 20 that never settles.
+        """
+        numEntries = 25
+        irradiance = np.repeat([1000.0, 800.0, 600.0], [10, 10, 5])
+        maxPower = irradiance / 100
+        outputPower = maxPower.copy()
+        below = np.zeros(numEntries, dtype=bool)
+        below[[0, 1, 2, 10, 11, 14]] = True
+        below[20:] = True
+        outputPower[below] *= 0.5
+        vRef = np.full(numEntries, 30.0)
+        vRef[3:10:2] += 0.02
+        vRef[15:20:2] -= 0.01
+        datastore = {
+            "numEntries": numEntries,
+            "irradiance": irradiance[:, np.newaxis],
+            "temperature": np.full((numEntries, 1), 25.0),
+            "vMPP": np.full(numEntries, 30.0),
+            "iMPP": maxPower / 30.0,
+            "outputPower": outputPower,
+            "mpptOutput": vRef,
+        }
+
+        try:
+            metrics = Metrics.getRunMetrics(datastore, period=0.5)
+            assert metrics["numCycles"] == numEntries
+            assert metrics["cyclesBelowThreshold"] == 11
+            assert metrics["energy"] == pytest.approx(np.sum(outputPower) * 0.5)
+            assert metrics["trackingEff"] == pytest.approx(
+                np.sum(outputPower) / np.sum(maxPower)
+            )
+
+            assert metrics["numSteps"] == 3
+            assert metrics["unsettledSteps"] == 1
+            steps = metrics["steps"]
+            assert np.array_equal(steps["start"], [0, 10, 20])
+            assert np.allclose(steps["settlingTime"][:2], [1.5, 2.5])
+            assert np.allclose(steps["oscillation"][:2], [0.01, 0.005])
+            assert np.isnan(steps["settlingTime"][2])
+            assert metrics["settlingTime"] == pytest.approx(2.0)
+            assert metrics["maxOscillation"] == pytest.approx(0.01)
+
+            # Assert that the running metrics, accumulated block by block,
+            # reach the metrics of the whole run.
+            running = Metrics(period=0.5)
+            for (start, stop) in [(0, 7), (7, 8), (8, 25)]:
+                result = running.update(outputPower[start:stop], maxPower[start:stop])
+            totals = running.getTotals()
+            assert totals["cyclesBelowThreshold"] == metrics["cyclesBelowThreshold"]
+            assert totals["energy"] == pytest.approx(metrics["energy"])
+            assert result["trackingEff"][-1] == pytest.approx(metrics["trackingEff"])
+            assert result["fractionBelowThreshold"][-1] == pytest.approx(11 / 25)
+        except Exception as e:
+            pytest.fail(str(e))
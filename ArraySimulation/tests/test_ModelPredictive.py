@@ -0,0 +1,73 @@
+"""
+test_ModelPredictive.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the Model Predictive algorithm jumps to the
+maximum power point after a change in irradiance or temperature, and learns
+the residual error of its cell model.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPT import MPPT
+from ArraySimulation.PVSource.PVCell.PVCellIdeal import PVCellIdeal
+
+
+class TestModelPredictive:
+    def _getCurve(self, irradiance, temperature, scale):
+        """
+        The IV curve of a cell per the ideal cell model, with its voltage
+        scaled by scale to stand in for the error of the surrogate.
+        """
+        cell = PVCellIdeal(False)
+        voltages = np.arange(0.001, 0.8, 0.0005)
+        currents = np.array(
+            [
+                cell.getCurrent(1, voltage, irradiance, temperature)
+                for voltage in voltages
+            ]
+        )
+        return (voltages * scale, np.maximum(currents, 0.0))
+
+    def test_ModelPredictiveSteps(self):
+        """
+        Testing that, after each step in irradiance or temperature, the
+        reference voltage is within 0.005 V of the VMPP in the next cycle, once
+        the residual error of the model has been learned.
+        """
+        steps = [(1000, 25), (400, 25), (400, 60), (900, 40), (150, 30)]
+
+        try:
+            for scale in [1.0, 0.95]:
+                model = MPPT()
+                model.setupModel(1, "Model Predictive", "PandO", "Fixed")
+                vRef = 0.0
+                for (idx, (irradiance, temperature)) in enumerate(steps * 2):
+                    (voltages, currents) = self._getCurve(
+                        irradiance, temperature, scale
+                    )
+                    VMPP = voltages[np.argmax(voltages * currents)]
+                    for cycle in range(50):
+                        current = float(np.interp(vRef, voltages, currents))
+                        vRef = model.getReferenceVoltage(
+                            vRef, current, irradiance, temperature
+                        )
+                        if cycle == 0 and (idx > 0 or scale == 1.0):
+                            assert abs(vRef - VMPP) < 0.005
+                    assert abs(vRef - VMPP) < 0.015
+
+            with pytest.raises(Exception):
+                model.setupModel(
+                    1, "Model Predictive", "PandO", "Fixed", None, {"c": 0}
+                )
+        except Exception as e:
+            pytest.fail(str(e))
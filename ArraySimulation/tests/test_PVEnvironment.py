@@ -9,6 +9,7 @@ Last Modified: 11/24/20
 Description: Test file to see if the various implemented models run as expected.
 """
 # Library Imports.
+import numpy as np
 import pytest
 import sys
 
@@ -194,7 +195,113 @@ class TestPVEnvironment:
         except Exception as e:
             pytest.fail(str(e))
 
-    # TODO: test with multiple cell profile.
+    def test_PVEnvironmentMultiModule(self):
+        """
+        Testing the PVEnvironment using a multiple module file reference.
+        """
+        env = PVEnvironment()
+        env.setupModel(source="TwoCellsWithDiode.json", maxCycles=1000)
+
+        try:
+            # Assert that the immutable source properties are cached.
+            assert env.getSourceNumCells() == 2
+            assert env.getModuleNumCells("1") == 1
+            assert env.getModuleMapping() == {"0": "1x1", "1": "1x1"}
+
+            # Assert that entries are interpolated between events.
+            env.setCycle(225)
+            assert env.getModuleDefinition("0", 0.0) == {
+                "numCells": 1,
+                "voltage": 0.0,
+                "irradiance": 1000,
+                "temperature": 37.5,
+            }
+
+            # Assert that modules are interpolated independently and that the
+            # source environment is weighted across them.
+            env.setCycle(575)
+            assert env.getSourceDefinition(0.5) == {
+                "0": {
+                    "numCells": 1,
+                    "voltage": 0.5,
+                    "irradiance": 500,
+                    "temperature": 25,
+                },
+                "1": {
+                    "numCells": 1,
+                    "voltage": 0.5,
+                    "irradiance": 0,
+                    "temperature": 25,
+                },
+            }
+            assert env.getSourceEnvironmentDefinition() == {
+                "irradiance": 250,
+                "temperature": 25,
+            }
+
+            # Assert that the last event is held until the max cycle.
+            env.setCycle(1000)
+            assert env.getModuleEnvironmentDefinition("1") == {
+                "irradiance": 1000,
+                "temperature": 25,
+            }
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_PVEnvironmentTime(self):
+        """
+        Testing the time based API of the PVEnvironment.
+        """
+        env = PVEnvironment()
+        env.setupModel(source="TwoCellsWithDiode.json", maxCycles=1000, dt=0.05)
+
+        try:
+            # Assert that cycles map onto time with the default cycle period.
+            assert env.getCyclePeriod() == 1.0
+            assert env.cycleToTime(250) == 250.0
+            assert list(env.timeToCycle(np.array([0.0, 0.99, 1.0, 2.5]))) == [
+                0,
+                0,
+                1,
+                2,
+            ]
+
+            # Assert that stepping the time at sub cycle resolution reaches the
+            # max cycle in the expected number of steps.
+            numSteps = 0
+            while env.incrementTime():
+                numSteps += 1
+            assert numSteps == 20000
+            assert env.getCycle() == 1000
+            assert env.getTime() == 1000.0
+
+            # Assert that the environment is interpolated between cycles.
+            assert env.setTime(224.5)
+            assert env.getCycle() == 224
+            assert env.getSourceEnvironmentDefinition() == {
+                "irradiance": 1000,
+                "temperature": 37.25,
+            }
+            (irradiance, temperature) = env.getEnvironmentAtTimes(
+                np.array([224.5, 575.0])
+            )
+            assert irradiance.tolist() == [[1000, 1000], [500, 0]]
+            assert temperature.tolist() == [[37.25, 37.25], [25, 25]]
+
+            # Assert that we can find how long the environment stays static.
+            assert env.getNextChangeTime(0.0) == 200.0
+            assert env.getNextChangeTime(210.0) == 210.0
+            assert env.getNextChangeTime(300.0) == 500.0
+            assert env.getNextChangeTime(650.0) == 1000.0
+
+            # Assert that coarse steps skip over cycles.
+            env.setupModel(source="SingleCell.json", maxCycles=86400, dt=60)
+            numSteps = 0
+            while env.incrementTime():
+                numSteps += 1
+            assert numSteps == 1440
+        except Exception as e:
+            pytest.fail(str(e))
 
 
 env = PVEnvironment()
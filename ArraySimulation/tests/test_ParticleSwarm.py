@@ -0,0 +1,51 @@
+"""
+test_ParticleSwarm.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the Particle Swarm finds the global maximum
+power point of partially shaded strings, and finds it again when the shading
+changes.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.MPPT.MPPT import MPPT
+from ArraySimulation.tests.SourceCurves import getShadedStringCurve
+
+
+class TestParticleSwarm:
+    def test_ParticleSwarmGlobalMaximum(self):
+        """
+        Testing that the swarm converges on the global maximum, whether it is
+        the right or the left peak, within tens of cycles, and that a change
+        in shading reinitializes it.
+        """
+        model = MPPT()
+        model.setupModel(40, "Particle Swarm", "PandO", "Fixed", None, {"seed": 1})
+
+        try:
+            vRef = 0.0
+            for shadedCurrent in [4.5, 1.5]:
+                (voltages, currents) = getShadedStringCurve(shadedCurrent)
+                VMPP = voltages[np.argmax(voltages * currents)]
+                numSearching = 0
+                for _ in range(300):
+                    current = float(np.interp(vRef, voltages, currents, right=0.0))
+                    vRef = model.getReferenceVoltage(vRef, current, 1000, 25)
+                    numSearching += model.isSearching()
+                assert abs(vRef - VMPP) < 0.1
+                assert 0 < numSearching < 100
+
+            with pytest.raises(Exception):
+                model.setupModel(40, "Particle Swarm", "PandO", "Fixed", None, {"c": 0})
+        except Exception as e:
+            pytest.fail(str(e))
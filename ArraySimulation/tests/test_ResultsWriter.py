@@ -0,0 +1,118 @@
+"""
+test_ResultsWriter.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the results writers stream the entries of the
+MPPT simulation to file without keeping them in memory.
+"""
+# Library Imports.
+import csv
+import json
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.ResultsWriter import BinaryWriter, ResultsWriter
+
+
+def runSimulation(writer=None, fastForward=True):
+    controller = DataController()
+    controller.setupFastForward(fastForward)
+    if writer is not None:
+        controller.setupSink(writer, retain=False)
+    controller.resetPipeline(
+        "Ideal", "TwoCellsWithDiode.json", 1000, "Voltage Sweep", "PandO", "Fixed"
+    )
+
+    capacity = 0
+    continueBool = True
+    while continueBool:
+        (datastore, continueBool) = controller.iteratePipelineCycleMPPT()
+        capacity = max(capacity, len(datastore["cycle"]))
+    return (datastore, capacity)
+
+
+class TestResultsWriter:
+    def test_ResultsWriter(self, tmp_path):
+        """
+        Testing that each format streams every entry of the simulation.
+        """
+        (expected, _) = runSimulation()
+        numEntries = expected["numEntries"]
+
+        try:
+            for fastForward in [True, False]:
+                for extension in ["csv", "ndjson", "bin"]:
+                    fileName = str(tmp_path / ("results." + extension))
+                    writer = ResultsWriter.fromFileName(fileName, blockSize=64)
+                    (_, capacity) = runSimulation(writer, fastForward)
+
+                    # Assert that the datastore stays bounded.
+                    assert capacity <= 64 + 256
+                    assert writer.getNumRows() == numEntries
+
+                    if extension == "csv":
+                        with open(fileName) as file:
+                            rows = list(csv.DictReader(file))
+                        power = [float(row["power"]) for row in rows]
+                        voltage = [float(row["voltage"]) for row in rows]
+                        current = [float(row["current"]) for row in rows]
+                    elif extension == "ndjson":
+                        with open(fileName) as file:
+                            rows = [json.loads(line) for line in file]
+                        power = [row["power"] for row in rows]
+                        voltage = [row["voltage"] for row in rows]
+                        current = [row["current"] for row in rows]
+                    else:
+                        rows = BinaryWriter.read(fileName)
+                        assert np.array_equal(
+                            rows["cycle"], expected["cycle"][:numEntries]
+                        )
+                        power = rows["power"]
+                        (voltage, current) = (rows["voltage"], rows["current"])
+
+                    # Assert that the entries written match the datastore.
+                    assert len(power) == numEntries
+                    assert np.array_equal(
+                        power, expected["outputPower"][:numEntries]
+                    )
+
+                    # Assert that each current is written with the voltage it
+                    # was measured at.
+                    assert np.array_equal(
+                        voltage, expected["arrayVoltage"][:numEntries]
+                    )
+                    assert np.array_equal(
+                        current, expected["sourceCurrent"][:numEntries]
+                    )
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_BinaryWriterPartial(self, tmp_path):
+        """
+        Testing that a binary file cut short by an interruption can be read.
+        """
+        fileName = str(tmp_path / "results.bin")
+        writer = ResultsWriter.fromFileName(fileName, blockSize=100)
+        runSimulation(writer, fastForward=False)
+
+        try:
+            with open(fileName, "rb") as file:
+                data = file.read()
+            with open(fileName, "wb") as file:
+                file.write(data[:-10])
+
+            # Assert that only the complete blocks are read back.
+            rows = BinaryWriter.read(fileName)
+            assert len(rows["cycle"]) == 1000
+            assert np.array_equal(rows["cycle"], np.arange(1000))
+        except Exception as e:
+            pytest.fail(str(e))
@@ -0,0 +1,69 @@
+"""
+test_RingBuffer.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the RingBuffer passes values in order between
+a producer and a consumer thread.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+import threading
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.RingBuffer import RingBuffer
+
+
+class TestRingBuffer:
+    def test_RingBufferWrap(self):
+        """
+        Testing pushes and drains across the end of the buffer.
+        """
+        buffer = RingBuffer(8)
+
+        try:
+            # Assert that pushes stop at the capacity.
+            assert buffer.push(np.arange(5)) == 5
+            assert buffer.push(np.arange(5, 10)) == 3
+            assert buffer.getSize() == 8
+            assert np.array_equal(buffer.drain(6), np.arange(6))
+
+            # Assert that values wrap around the end in order.
+            assert buffer.push(np.arange(8, 14)) == 6
+            assert np.array_equal(buffer.drain(), np.arange(6, 14))
+            assert len(buffer.drain()) == 0
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_RingBufferThreads(self):
+        """
+        Testing a producer and consumer running concurrently.
+        """
+        buffer = RingBuffer(100)
+        values = np.arange(100000)
+
+        def produce():
+            remaining = values
+            while len(remaining) > 0:
+                remaining = remaining[buffer.push(remaining[:37]) :]
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        try:
+            received = []
+            while producer.is_alive() or buffer.getSize() > 0:
+                received.append(buffer.drain())
+            producer.join()
+
+            # Assert that every value arrives once and in order.
+            assert np.array_equal(np.concatenate(received), values)
+        except Exception as e:
+            pytest.fail(str(e))
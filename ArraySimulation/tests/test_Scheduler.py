@@ -0,0 +1,86 @@
+"""
+test_Scheduler.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the Scheduler runs stages at their own rates
+and if the multi-rate pipeline matches the lockstep pipeline.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.Scheduler import Scheduler
+
+
+class TestScheduler:
+    def test_SchedulerRates(self):
+        """
+        Testing that stages fire at their own periods and in insertion order.
+        """
+        scheduler = Scheduler()
+        calls = {"slow": [], "fast": []}
+        scheduler.addStage("slow", 1.0, lambda time: calls["slow"].append(time))
+        scheduler.addStage("fast", 0.1, lambda time: calls["fast"].append(time))
+
+        try:
+            # Assert that both stages fire at time 0, in insertion order.
+            assert scheduler.step() == ["slow", "fast"]
+
+            # Assert that the fast stage fires on its own in between.
+            for _ in range(9):
+                assert scheduler.step() == ["fast"]
+            assert scheduler.step() == ["slow", "fast"]
+            assert scheduler.getTime() == pytest.approx(1.0)
+
+            # Assert that the stages stay aligned over long runs.
+            while scheduler.getTime() < 1000.0 - 1e-6:
+                scheduler.step()
+            assert len(calls["slow"]) == 1001
+            assert len(calls["fast"]) == 10001
+
+            # Assert that duplicate or bad stages are caught.
+            with pytest.raises(Exception):
+                scheduler.addStage("slow", 1.0, print)
+            with pytest.raises(Exception):
+                scheduler.addStage("stopped", 0.0, print)
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_SchedulerPipeline(self):
+        """
+        Testing that the multi-rate pipeline at a single rate reproduces the
+        lockstep pipeline.
+        """
+        lockstep = DataController()
+        lockstep.resetPipeline(
+            "Ideal", "SingleCell.json", 50, "Voltage Sweep", "Bisection", "Fixed"
+        )
+        multiRate = DataController()
+        multiRate.resetPipeline(
+            "Ideal", "SingleCell.json", 50, "Voltage Sweep", "Bisection", "Fixed"
+        )
+        multiRate.setupMultiRate()
+
+        try:
+            continueBool = True
+            while continueBool:
+                (expected, continueBool) = lockstep.iteratePipelineCycleMPPT()
+            continueBool = True
+            while continueBool:
+                (actual, continueBool) = multiRate.iteratePipelineMultiRate()
+
+            assert actual["numEntries"] == expected["numEntries"]
+            assert np.array_equal(actual["cycle"], expected["cycle"])
+            assert np.array_equal(actual["time"], expected["time"])
+            assert np.allclose(actual["mpptOutput"], expected["mpptOutput"])
+        except Exception as e:
+            pytest.fail(str(e))
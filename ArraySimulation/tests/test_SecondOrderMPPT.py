@@ -0,0 +1,82 @@
+"""
+test_SecondOrderMPPT.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the Newton and BFGS local MPPT algorithms
+converge on the maximum power point, and track it across changes of the curve,
+in far fewer cycles than PandO.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.BFGS import BFGS
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.Newton import Newton
+from ArraySimulation.MPPT.LocalMPPTAlgorithms.PandO import PandO
+
+
+class TestSecondOrderMPPT:
+    def _getCurve(self, shortCircuit, openCircuit):
+        """
+        A single diode shaped IV curve of a 40 cell string.
+        """
+        voltages = np.linspace(0, 40 * openCircuit, 40001)
+        currents = shortCircuit * (1 - np.exp((voltages - 40 * openCircuit) / 1.5))
+        return (voltages, currents)
+
+    def _track(self, model, vRef, curve, numCycles=300):
+        """
+        Runs the model on a curve, returning the last reference voltage and
+        the cycle after which it stayed within 0.05 V of the MPP.
+        """
+        (voltages, currents) = curve
+        VMPP = voltages[np.argmax(voltages * currents)]
+        settled = 0
+        for cycle in range(numCycles):
+            current = float(np.interp(vRef, voltages, currents, right=0.0))
+            vRef = model.getReferenceVoltage(vRef, current, 1000, 25)
+            if abs(vRef - VMPP) >= 0.05:
+                settled = cycle + 1
+        return (vRef, settled)
+
+    def test_SecondOrderMPPTConvergence(self):
+        """
+        Testing that Newton and BFGS settle on the MPP within 15 cycles of
+        being set up near it, and of a change in irradiance or temperature,
+        several times faster than PandO.
+        """
+        curves = [
+            self._getCurve(6.0, 0.7),
+            self._getCurve(4.0, 0.69),
+            self._getCurve(4.0, 0.64),
+        ]
+        VMPP = curves[0][0][np.argmax(curves[0][0] * curves[0][1])]
+
+        try:
+            totals = {}
+            for algorithm in [Newton, BFGS, PandO]:
+                model = algorithm(40, "Fixed")
+                vRef = VMPP + 2.0
+                model.setup(vRef, VMPP - 4.0, VMPP + 4.0)
+                totals[algorithm] = 0
+                for curve in curves:
+                    (vRef, settled) = self._track(model, vRef, curve)
+                    if algorithm is not PandO:
+                        assert settled <= 15, model.getLocalMPPTType()
+                    totals[algorithm] += settled
+
+                model.reset()
+                assert model.vOld == 0.0
+
+            assert totals[Newton] * 5 < totals[PandO]
+            assert totals[BFGS] * 5 < totals[PandO]
+        except Exception as e:
+            pytest.fail(str(e))
@@ -0,0 +1,72 @@
+"""
+test_SeriesBuffer.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the SeriesBuffer keeps growable and rolling
+series of values.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.SeriesBuffer import SeriesBuffer
+
+
+class TestSeriesBuffer:
+    def test_SeriesBufferGrowth(self):
+        """
+        Testing that appended values are kept in order as the buffer grows.
+        """
+        buffer = SeriesBuffer(capacity=4)
+
+        try:
+            for idx in range(10):
+                buffer.append(idx, 2 * idx)
+            buffer.extend(range(10, 1000), np.arange(10, 1000) * 2)
+
+            assert len(buffer) == 1000
+            assert np.array_equal(buffer.getX(), np.arange(1000))
+            assert np.array_equal(buffer.getY(), np.arange(1000) * 2)
+
+            # Assert that values can be replaced and cleared.
+            buffer.set(-1, 5, 5)
+            assert (buffer.getX()[-1], buffer.getY()[-1]) == (5, 5)
+            buffer.clear()
+            assert len(buffer) == 0 and len(buffer.getX()) == 0
+            with pytest.raises(Exception):
+                buffer.set(0, 0, 0)
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_SeriesBufferRolling(self):
+        """
+        Testing that a rolling series keeps only its latest values.
+        """
+        buffer = SeriesBuffer(maxLength=100)
+
+        try:
+            expected = []
+            for size in [1, 7, 60, 99, 100, 250, 3]:
+                values = np.arange(len(expected), len(expected) + size)
+                buffer.extend(values, -values)
+                expected += values.tolist()
+
+                # Assert that the window is the latest values, in order.
+                assert np.array_equal(buffer.getX(), expected[-100:])
+                assert np.array_equal(buffer.getY(), -np.array(expected[-100:]))
+
+            # Assert that the arrays never grow past twice the window.
+            for idx in range(1000):
+                buffer.append(idx, idx)
+            assert len(buffer._x) == 200
+            assert np.array_equal(buffer.getX(), np.arange(900, 1000))
+        except Exception as e:
+            pytest.fail(str(e))
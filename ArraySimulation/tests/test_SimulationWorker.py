@@ -0,0 +1,86 @@
+"""
+test_SimulationWorker.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the SimulationWorker runs the pipeline in the
+background, publishing every entry, at the requested speed.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+import time
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.DataController import DataController
+from ArraySimulation.Controller.RingBuffer import RingBuffer
+from ArraySimulation.Controller.SimulationWorker import SimulationWorker
+
+
+class TestSimulationWorker:
+    def test_SimulationWorker(self):
+        """
+        Testing that every entry is published once and in order while the
+        consumer drains at a frame rate.
+        """
+        controller = DataController()
+        controller.setupFastForward(True)
+        controller.resetPipeline(
+            "Ideal", "TwoCellsWithDiode.json", 2000, "Voltage Sweep", "PandO", "Fixed"
+        )
+        buffer = RingBuffer(256)
+        worker = SimulationWorker(controller, buffer)
+
+        try:
+            worker.start()
+            frames = []
+            while worker.is_alive() or buffer.getSize() > 0:
+                frames.append(buffer.drain())
+                time.sleep(1 / 60)
+
+            assert worker.error is None
+            assert not worker.continueBool
+            rows = np.concatenate(frames)
+            assert np.array_equal(rows, np.arange(controller.datastore["numEntries"]))
+            assert len(rows) == 2001
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_SimulationWorkerSpeed(self):
+        """
+        Testing that the worker is paced to the requested speed, and that it
+        can be stopped and sped up.
+        """
+        controller = DataController()
+        controller.resetPipeline(
+            "Ideal", "SingleCell.json", 1000, "Voltage Sweep", "PandO", "Fixed"
+        )
+        buffer = RingBuffer()
+        worker = SimulationWorker(controller, buffer, speed=100)
+
+        try:
+            # Assert that 0.3 s at 100x runs about 30 cycles of 1 s.
+            worker.start()
+            time.sleep(0.3)
+            assert 20 <= buffer.getSize() <= 40
+
+            # Assert that a stopped worker publishes nothing more.
+            worker.stop()
+            numEntries = buffer.getSize()
+            time.sleep(0.1)
+            assert buffer.getSize() == numEntries
+            assert worker.continueBool
+
+            # Assert that a new worker at full speed picks up where it stopped.
+            worker = SimulationWorker(controller, buffer)
+            worker.start()
+            worker.join()
+            assert np.array_equal(buffer.drain(), np.arange(1001))
+        except Exception as e:
+            pytest.fail(str(e))
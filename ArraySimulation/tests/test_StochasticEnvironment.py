@@ -0,0 +1,134 @@
+"""
+test_StochasticEnvironment.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the stochastic environment generates
+reproducible regimes that can be ingested by the PVEnvironment.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.PVEnvironment.PVEnvironment import PVEnvironment
+from ArraySimulation.PVEnvironment.StochasticEnvironment import (
+    StochasticEnvironment,
+)
+
+
+class TestStochasticEnvironment:
+    def test_StochasticEnvironmentRegime(self):
+        """
+        Testing the regime generated by the stochastic model.
+        """
+        model = StochasticEnvironment(seed=4, dayLength=1000, dayOffset=100)
+
+        try:
+            (irradiance, temperature) = model.generateRegime(2000)
+
+            # Assert that we generate an entry for every cycle.
+            assert len(irradiance) == 2001
+            assert len(temperature) == 2001
+
+            # Assert that the irradiance is bounded by the clear sky envelope.
+            assert np.all(irradiance >= 0)
+            assert np.all(irradiance <= 1000)
+            assert np.all(irradiance[0:100] == 0)
+            assert np.all(irradiance[1101:] == 0)
+
+            # Assert that the cell cools to ambient at night and never exceeds
+            # the steady state temperature at the peak irradiance.
+            assert temperature[0] == pytest.approx(25)
+            assert np.all(temperature <= 25 + 0.03 * 1000 + 1e-9)
+
+            # Assert that the same seed reproduces the regime, and a different
+            # seed does not.
+            (irradianceCopy, temperatureCopy) = model.generateRegime(2000)
+            assert np.array_equal(irradiance, irradianceCopy)
+            assert np.array_equal(temperature, temperatureCopy)
+            (irradianceOther, _) = model.generateRegime(2000, seed=5)
+            assert not np.array_equal(irradiance, irradianceOther)
+
+            # Assert that a bad transition matrix is caught.
+            with pytest.raises(Exception) as excinfo:
+                StochasticEnvironment(transitions=[[0.5, 0.4], [0.5, 0.5]])
+            assert "must be of shape" in str(excinfo.value)
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_StochasticEnvironmentSource(self):
+        """
+        Testing the PVEnvironment using a generated source model.
+        """
+        model = StochasticEnvironment(seed=7, thermalTimeConstant=0)
+        source = model.generateSource(300, numModules=2, sharedClouds=False)
+        env = PVEnvironment()
+
+        try:
+            assert env.setupModel(source, 300)
+            assert env.getSourceNumCells() == 2
+            assert env.getModuleMapping() == {"0": "1x1", "1": "1x1"}
+
+            # Assert that the environment reflects the generated regime.
+            env.setCycle(150)
+            (irradiance, temperature) = source["pv_model"]["0"]["env_regime"][150][1:]
+            assert env.getModuleDefinition("0", 0.5) == {
+                "numCells": 1,
+                "voltage": 0.5,
+                "irradiance": irradiance,
+                "temperature": temperature,
+            }
+
+            # Assert that a module of type "Stochastic" generates the same
+            # regime as the model built from the same parameters.
+            params = {"seed": 7, "thermal_time_constant": 0}
+            stochasticSource = {
+                "name": "Stochastic Module",
+                "description": "",
+                "num_modules": 1,
+                "pv_model": {
+                    "0": {
+                        "module_type": "1x1",
+                        "env_type": "Stochastic",
+                        "needs_interp": False,
+                        "env_regime": params,
+                    }
+                },
+            }
+            assert env.setupModel(stochasticSource, 300)
+            (irradiance, temperature) = StochasticEnvironment.fromJSON(
+                params
+            ).generateRegime(300)
+            env.setCycle(299)
+            assert env.getSourceEnvironmentDefinition() == {
+                "irradiance": irradiance[299],
+                "temperature": temperature[299],
+            }
+
+            # Assert that the caller's source is not modified, so that it can
+            # be reused to generate a longer regime.
+            assert stochasticSource["pv_model"]["0"]["env_type"] == "Stochastic"
+            assert stochasticSource["pv_model"]["0"]["env_regime"] == params
+            assert env.setupModel(stochasticSource, 600)
+            (irradiance, temperature) = StochasticEnvironment.fromJSON(
+                params
+            ).generateRegime(600)
+            env.setCycle(599)
+            assert env.getSourceEnvironmentDefinition() == {
+                "irradiance": irradiance[599],
+                "temperature": temperature[599],
+            }
+
+            # Assert that an in memory source cannot be saved.
+            with pytest.raises(Exception) as excinfo:
+                env.saveEnvironment()
+            assert "no source file" in str(excinfo.value)
+        except Exception as e:
+            pytest.fail(str(e))
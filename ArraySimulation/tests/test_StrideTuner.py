@@ -0,0 +1,83 @@
+"""
+test_StrideTuner.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the StrideTuner finds stride parameters at
+least as good as the defaults, within their bounds.
+"""
+# Library Imports.
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.StrideTuner import StrideTuner, evaluateCandidate
+
+
+class TestStrideTuner:
+    def test_StrideTuner(self):
+        """
+        Testing a small tuning of two pairs in this process.
+        """
+        tuner = StrideTuner(numProcesses=1)
+
+        try:
+            with pytest.raises(Exception):
+                tuner.setupTuning(strideAlgos=["Unknown"])
+            assert (
+                tuner.setupTuning(
+                    maxCycles=150,
+                    strideAlgos=["Fixed", "Optimal"],
+                    maxEvaluations=13,
+                )
+                == 2
+            )
+
+            results = tuner.runTuning()
+            for result in results:
+                assert result["error"] is None
+                assert 1 < result["numEvaluations"] <= 13
+                assert result["trackingEff"] >= result["defaultTrackingEff"]
+                for (name, value) in result["strideParams"].items():
+                    (low, high, _) = StrideTuner.PARAMETERS[result["strideAlgo"]][name]
+                    assert low <= value <= high
+
+                # Assert that the tuned parameters reproduce their efficiency.
+                assert evaluateCandidate(
+                    (
+                        "Ideal",
+                        "SingleCell.json",
+                        150,
+                        "Voltage Sweep",
+                        "PandO",
+                        result["strideAlgo"],
+                        result["strideParams"],
+                        None,
+                    )
+                ) == pytest.approx(result["trackingEff"])
+
+            # Assert that the error of the stride model survives the setup of
+            # the local algorithm by the global algorithm.
+            efficiencies = [
+                evaluateCandidate(
+                    (
+                        "Ideal",
+                        "SingleCell.json",
+                        150,
+                        "Voltage Sweep",
+                        "PandO",
+                        "Optimal",
+                        {"error": error},
+                        None,
+                    )
+                )
+                for error in [0.05, 0.3]
+            ]
+            assert efficiencies[0] != efficiencies[1]
+        except Exception as e:
+            pytest.fail(str(e))
@@ -0,0 +1,66 @@
+"""
+test_SweepController.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the SweepController runs a matrix of
+scenarios and collects their metrics.
+"""
+# Library Imports.
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.Controller.SweepController import SweepController
+
+
+class TestSweepController:
+    def test_SweepController(self):
+        """
+        Testing a small sweep across a process pool.
+        """
+        sweep = SweepController(numProcesses=2)
+
+        try:
+            # Assert that the Cartesian product of the options is generated.
+            assert (
+                sweep.setupSweep(
+                    maxCycles=150,
+                    localAlgos=["PandO", "IC"],
+                    strideAlgos=["Fixed"],
+                    strideParams=[None, {"minStride": 0.02}, {"badParam": 0}],
+                )
+                == 6
+            )
+
+            results = sweep.runSweep()
+            assert len(results) == 6
+            for (scenario, result) in zip(sweep.getScenarios(), results):
+                assert result["localAlgo"] == scenario["localAlgo"]
+                assert result["strideParams"] == scenario["strideParams"]
+
+                # Assert that bad scenarios are recorded instead of halting the
+                # sweep.
+                if scenario["strideParams"] == {"badParam": 0}:
+                    assert "badParam" in result["error"]
+                    continue
+
+                assert result["error"] is None
+                assert result["numCycles"] == 151
+                assert 0 < result["trackingEff"] <= 1
+                assert result["energy"] == pytest.approx(
+                    result["trackingEff"] * result["theoreticalEnergy"]
+                )
+                assert 0 <= result["cyclesBelowThreshold"] <= 151
+                assert 0 <= result["settlingTime"] <= 151
+                assert result["oscillation"] >= 0
+
+            # Assert that the stride parameters make it to the stride model.
+            assert results[0]["energy"] != results[1]["energy"]
+        except Exception as e:
+            pytest.fail(str(e))
@@ -0,0 +1,169 @@
+"""
+test_VoltageSweep.py
+
+Author: agent (2026).
+Contact: agent@local
+Created: 10/19/26
+Last Modified: 10/19/26
+
+Description: Test file to see if the coarse to fine Voltage Sweep finds the
+global maximum power point of a partially shaded string in fewer cycles than
+the full sweep, and if it searches again when the shading changes.
+"""
+# Library Imports.
+import numpy as np
+import pytest
+import sys
+
+sys.path.append("../")
+
+# Custom Imports.
+from ArraySimulation.MPPT.GlobalMPPTAlgorithms.GlobalMPPTAlgorithm import (
+    GlobalMPPTAlgorithm,
+)
+from ArraySimulation.MPPT.GlobalMPPTAlgorithms.VoltageSweep import VoltageSweep
+from ArraySimulation.MPPT.MPPT import MPPT
+from ArraySimulation.MPPT.MPPTComponents.CellSurrogate import CellSurrogate
+from ArraySimulation.tests.SourceCurves import getShadedStringCurve
+
+
+class TestVoltageSweep:
+    def _run(self, globalParams, numCycles=4000):
+        """
+        Runs the Voltage Sweep with PandO over the curve.
+
+        Return
+        ------
+        tuple: (final voltage, number of cycles spent searching)
+        """
+        (voltages, currents) = getShadedStringCurve()
+        model = MPPT()
+        model.setupModel(40, "Voltage Sweep", "PandO", "Fixed", None, globalParams)
+        vRef = 0.0
+        numSearching = 0
+        for _ in range(numCycles):
+            current = float(np.interp(vRef, voltages, currents, right=0.0))
+            vRef = model.getReferenceVoltage(vRef, current, 1000, 25)
+            numSearching += model.isSearching()
+        return (vRef, numSearching)
+
+    def test_VoltageSweepCoarseToFine(self):
+        """
+        Testing that the coarse to fine sweep converges on the global maximum
+        an order of magnitude faster than the full sweep.
+        """
+        (voltages, currents) = getShadedStringCurve()
+        VMPP = voltages[np.argmax(voltages * currents)]
+
+        try:
+            (vFull, cyclesFull) = self._run(None)
+            assert abs(vFull - VMPP) < 0.1
+            for params in [
+                {"coarseStride": 0.5},
+                {"coarseStride": 0.5, "boundByVoc": True},
+                {"coarseStride": 1.0, "numCandidates": 1},
+            ]:
+                (vRef, cycles) = self._run(params)
+                assert abs(vRef - VMPP) < 0.1
+                assert cycles * 10 < cyclesFull
+
+            # Assert that the sweep is bounded just past the Voc estimated by
+            # the cell surrogate.
+            surrogate = CellSurrogate(40)
+            assert surrogate.getOCVoltage(1000, 25) == pytest.approx(40 * 0.721)
+            sweep = VoltageSweep(40, "PandO", "Fixed", None, {"boundByVoc": True})
+            for (irradiance, temperature) in [(1000, 25), (200, 25), (1000, 60)]:
+                assert sweep._getSweepLimit(irradiance, temperature) == (
+                    pytest.approx(
+                        surrogate.getOCVoltage(irradiance, temperature)
+                        * (1 + VoltageSweep.VOC_MARGIN),
+                        abs=0.01,
+                    )
+                )
+
+            with pytest.raises(Exception):
+                self._run({"badParam": 0}, 1)
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_VoltageSweepSinglePeak(self):
+        """
+        Testing that a curve with a single peak is refined around that peak
+        only, even with more candidates allowed, rather than around the flat
+        zero power samples past Voc.
+        """
+        (voltages, currents) = getShadedStringCurve(6.0)
+        VMPP = voltages[np.argmax(voltages * currents)]
+        (coarseStride, fineStride) = (0.5, 0.01)
+        params = {
+            "coarseStride": coarseStride,
+            "fineStride": fineStride,
+            "numCandidates": 3,
+        }
+        sweep = VoltageSweep(40, "PandO", "Fixed", None, params)
+
+        try:
+            vRef = 0.0
+            numSearching = 0
+            for _ in range(1000):
+                current = float(np.interp(vRef, voltages, currents, right=0.0))
+                vRef = sweep.getReferenceVoltage(vRef, current, 1000, 25)
+                numSearching += sweep.isSearching()
+            assert abs(vRef - VMPP) < 0.1
+
+            # Assert that one bracket, two coarse strides wide, is refined.
+            assert len(sweep._brackets) == 1
+            (left, right) = sweep._brackets[0]
+            assert left < VMPP < right
+            assert right - left == pytest.approx(2 * coarseStride)
+            numCoarse = int(np.ceil(GlobalMPPTAlgorithm.MAX_VOLTAGE / coarseStride))
+            assert numSearching <= numCoarse + 2 * coarseStride / fineStride + 2
+        except Exception as e:
+            pytest.fail(str(e))
+
+    def test_VoltageSweepRescan(self):
+        """
+        Testing that a change in shading triggers a rescan that finds the new
+        global maximum, while a uniform change in irradiance does not.
+        """
+        # (shaded substring current, uniform irradiance scale, expected
+        # {"partial", "full"} rescans so far).
+        steps = [
+            (4.5, 1.0, (0, 0)),
+            (4.5, 0.5, (0, 0)),
+            (4.5, 1.0, (0, 0)),
+            (1.5, 1.0, (0, 1)),
+            (5.0, 1.0, (0, 2)),
+            (3.5, 1.0, (1, 2)),
+        ]
+
+        try:
+            for params in [{"rescan": True}, {"rescan": True, "coarseStride": 0.5}]:
+                model = MPPT()
+                model.setupModel(40, "Voltage Sweep", "PandO", "Fixed", None, params)
+                vRef = 0.0
+                for (shadedCurrent, scale, expected) in steps:
+                    (voltages, currents) = getShadedStringCurve(shadedCurrent)
+                    currents = currents * scale
+                    VMPP = voltages[np.argmax(voltages * currents)]
+                    irradiance = 1000 * scale * (6.0 + shadedCurrent) / 12.0
+                    for _ in range(4000):
+                        current = float(np.interp(vRef, voltages, currents, right=0.0))
+                        vRef = model.getReferenceVoltage(vRef, current, irradiance, 25)
+                    assert abs(vRef - VMPP) < 0.1
+                    rescans = model.getRescanCounts()
+                    assert (rescans["partial"], rescans["full"]) == expected
+
+            # Without rescans, the tracker stays on the stale maximum.
+            model = MPPT()
+            model.setupModel(40, "Voltage Sweep", "PandO", "Fixed")
+            vRef = 0.0
+            for shadedCurrent in [4.5, 1.5]:
+                (voltages, currents) = getShadedStringCurve(shadedCurrent)
+                for _ in range(4000):
+                    current = float(np.interp(vRef, voltages, currents, right=0.0))
+                    vRef = model.getReferenceVoltage(vRef, current, 1000, 25)
+            assert abs(vRef - voltages[np.argmax(voltages * currents)]) > 1.0
+            assert model.getRescanCounts() == {"partial": 0, "full": 0}
+        except Exception as e:
+            pytest.fail(str(e))